@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections import OrderedDict
 from datetime import timedelta
+import time
 from typing import Any, Dict, Mapping, Optional, Tuple, cast
 
 import jwt
@@ -14,7 +15,12 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.util import dt as dt_util
 
 from . import auth_store, models
-from .const import ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN
+from .const import (
+    ACCESS_TOKEN_CACHE_SIZE,
+    ACCESS_TOKEN_CACHE_TTL,
+    ACCESS_TOKEN_EXPIRATION,
+    GROUP_ID_ADMIN,
+)
 from .mfa_modules import MultiFactorAuthModule, auth_mfa_module_from_config
 from .providers import AuthProvider, LoginFlow, auth_provider_from_config
 
@@ -155,6 +161,9 @@ class AuthManager:
         self._providers = providers
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
+        # Verified access tokens with the refresh token they belong to
+        # and the time.time() until which they are trusted
+        self._access_token_cache: dict[str, tuple[models.RefreshToken, float]] = {}
 
     @property
     def auth_providers(self) -> list[AuthProvider]:
@@ -288,6 +297,7 @@ class AuthManager:
             await asyncio.wait(tasks)
 
         await self._store.async_remove_user(user)
+        self._async_invalidate_access_tokens(user=user)
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -321,6 +331,7 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactivate the owner")
         await self._store.async_deactivate_user(user)
+        self._async_invalidate_access_tokens(user=user)
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -447,6 +458,7 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_invalidate_access_tokens(refresh_token=refresh_token)
 
     @callback
     def async_create_access_token(
@@ -506,6 +518,13 @@ class AuthManager:
         self, token: str
     ) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        cached = self._access_token_cache.get(token)
+        if cached is not None:
+            refresh_token, trusted_until = cached
+            if time.time() < trusted_until and refresh_token.user.is_active:
+                return refresh_token
+            del self._access_token_cache[token]
+
         try:
             unverif_claims = jwt.decode(token, verify=False)
         except jwt.InvalidTokenError:
@@ -523,15 +542,50 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            claims = jwt.decode(
+                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            )
         except jwt.InvalidTokenError:
             return None
 
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        self._async_cache_access_token(token, refresh_token, claims)
         return refresh_token
 
+    @callback
+    def _async_cache_access_token(
+        self, token: str, refresh_token: models.RefreshToken, claims: dict[str, Any]
+    ) -> None:
+        """Trust a verified access token until the TTL or the token expires."""
+        now = time.time()
+        cache = self._access_token_cache
+        if len(cache) >= ACCESS_TOKEN_CACHE_SIZE:
+            for cached_token, (_, trusted_until) in list(cache.items()):
+                if trusted_until <= now:
+                    del cache[cached_token]
+            if len(cache) >= ACCESS_TOKEN_CACHE_SIZE:
+                cache.clear()
+
+        trusted_until = now + ACCESS_TOKEN_CACHE_TTL.total_seconds()
+        if "exp" in claims:
+            trusted_until = min(trusted_until, claims["exp"])
+        cache[token] = (refresh_token, trusted_until)
+
+    @callback
+    def _async_invalidate_access_tokens(
+        self,
+        refresh_token: models.RefreshToken | None = None,
+        user: models.User | None = None,
+    ) -> None:
+        """Stop trusting the cached access tokens of a refresh token or user."""
+        for token, (cached_token, _) in list(self._access_token_cache.items()):
+            if (refresh_token is not None and cached_token.id == refresh_token.id) or (
+                user is not None and cached_token.user.id == user.id
+            ):
+                del self._access_token_cache[token]
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
@@ -4,12 +4,15 @@ from __future__ import annotations
 import asyncio
 from collections import OrderedDict
 from datetime import timedelta
+import hashlib
 import hmac
 from logging import getLogger
 from typing import Any
 
 from homeassistant.auth.const import ACCESS_TOKEN_EXPIRATION
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.util import dt as dt_util
 
 from . import models
@@ -39,6 +42,9 @@ class AuthStore:
         self._users: dict[str, models.User] | None = None
         self._groups: dict[str, models.Group] | None = None
         self._perm_lookup: PermissionLookup | None = None
+        # Indexes of the refresh tokens of all users by id and by token hash
+        self._refresh_tokens: dict[str, models.RefreshToken] = {}
+        self._refresh_tokens_by_hash: dict[str, models.RefreshToken] = {}
         self._store = hass.helpers.storage.Store(
             STORAGE_VERSION, STORAGE_KEY, private=True
         )
@@ -143,6 +149,8 @@ class AuthStore:
             assert self._users is not None
 
         self._users.pop(user.id)
+        for refresh_token in user.refresh_tokens.values():
+            self._async_unindex_refresh_token(refresh_token)
         self._async_schedule_save()
 
     async def async_update_user(
@@ -227,6 +235,7 @@ class AuthStore:
 
         refresh_token = models.RefreshToken(**kwargs)
         user.refresh_tokens[refresh_token.id] = refresh_token
+        self._async_index_refresh_token(refresh_token)
 
         self._async_schedule_save()
         return refresh_token
@@ -239,10 +248,12 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            if user.refresh_tokens.pop(refresh_token.id, None):
-                self._async_schedule_save()
-                break
+        if (stored_token := self._refresh_tokens.get(refresh_token.id)) is None:
+            return
+
+        stored_token.user.refresh_tokens.pop(stored_token.id, None)
+        self._async_unindex_refresh_token(stored_token)
+        self._async_schedule_save()
 
     async def async_get_refresh_token(
         self, token_id: str
@@ -252,12 +263,7 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            refresh_token = user.refresh_tokens.get(token_id)
-            if refresh_token is not None:
-                return refresh_token
-
-        return None
+        return self._refresh_tokens.get(token_id)
 
     async def async_get_refresh_token_by_token(
         self, token: str
@@ -267,14 +273,23 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        found = None
+        refresh_token = self._refresh_tokens_by_hash.get(_token_hash(token))
+        if refresh_token is None or not hmac.compare_digest(refresh_token.token, token):
+            return None
 
-        for user in self._users.values():
-            for refresh_token in user.refresh_tokens.values():
-                if hmac.compare_digest(refresh_token.token, token):
-                    found = refresh_token
+        return refresh_token
 
-        return found
+    @callback
+    def _async_index_refresh_token(self, refresh_token: models.RefreshToken) -> None:
+        """Add a refresh token to the lookup indexes."""
+        self._refresh_tokens[refresh_token.id] = refresh_token
+        self._refresh_tokens_by_hash[_token_hash(refresh_token.token)] = refresh_token
+
+    @callback
+    def _async_unindex_refresh_token(self, refresh_token: models.RefreshToken) -> None:
+        """Remove a refresh token from the lookup indexes."""
+        self._refresh_tokens.pop(refresh_token.id, None)
+        self._refresh_tokens_by_hash.pop(_token_hash(refresh_token.token), None)
 
     @callback
     def async_log_refresh_token_usage(
@@ -307,6 +322,18 @@ class AuthStore:
 
         self._perm_lookup = perm_lookup = PermissionLookup(ent_reg, dev_reg)
 
+        @callback
+        def _async_registry_updated(event: Event) -> None:
+            """Drop the entity decisions cached by permissions."""
+            perm_lookup.generation += 1
+
+        self.hass.bus.async_listen(
+            EVENT_ENTITY_REGISTRY_UPDATED, _async_registry_updated
+        )
+        self.hass.bus.async_listen(
+            EVENT_DEVICE_REGISTRY_UPDATED, _async_registry_updated
+        )
+
         if data is None:
             self._set_defaults()
             return
@@ -478,6 +505,7 @@ class AuthStore:
                 version=rt_dict.get("version"),
             )
             users[rt_dict["user_id"]].refresh_tokens[token.id] = token
+            self._async_index_refresh_token(token)
 
         self._groups = groups
         self._users = users
@@ -579,6 +607,11 @@ class AuthStore:
         self._groups = groups
 
 
+def _token_hash(token: str) -> str:
+    """Return the key of a token in the token hash index."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 def _system_admin_group() -> models.Group:
     """Create system admin group."""
     return models.Group(
@@ -48,11 +48,32 @@ class PolicyPermissions(AbstractPermissions):
         """Initialize the permission class."""
         self._policy = policy
         self._perm_lookup = perm_lookup
+        self._entity_decisions: dict[str, dict[str, bool]] = {}
+        self._decisions_generation = perm_lookup.generation if perm_lookup else 0
 
     def access_all_entities(self, key: str) -> bool:
         """Check if we have a certain access to all entities."""
         return test_all(self._policy.get(CAT_ENTITIES), key)
 
+    def check_entity(self, entity_id: str, key: str) -> bool:
+        """Check if we can access entity.
+
+        Decisions are cached per entity until the entity or device
+        registry changes, as policies by device or area depend on them.
+        """
+        perm_lookup = self._perm_lookup
+        if perm_lookup and self._decisions_generation != perm_lookup.generation:
+            self._entity_decisions.clear()
+            self._decisions_generation = perm_lookup.generation
+
+        if (decisions := self._entity_decisions.get(key)) is None:
+            decisions = self._entity_decisions[key] = {}
+
+        if (decision := decisions.get(entity_id)) is None:
+            decision = decisions[entity_id] = super().check_entity(entity_id, key)
+
+        return decision
+
     def _entity_func(self) -> Callable[[str, str], bool]:
         """Return a function that can test entity access."""
         return compile_entities(self._policy.get(CAT_ENTITIES), self._perm_lookup)
@@ -13,6 +13,7 @@ from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.bootstrap import DATA_LOGGING
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import (
+    CONTENT_TYPE_JSON,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_TIME_CHANGED,
     HTTP_BAD_REQUEST,
@@ -225,7 +226,12 @@ class APIStatesView(HomeAssistantView):
             for state in request.app["hass"].states.async_all()
             if entity_perm(state.entity_id, "read")
         ]
-        return self.json(states)
+        try:
+            body = f'[{",".join(state.as_dict_json for state in states)}]'
+        except (ValueError, TypeError):
+            # Let the regular serializer report the unserializable data
+            return self.json(states)
+        return _json_response(body)
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -242,9 +248,13 @@ class APIEntityStateView(HomeAssistantView):
             raise Unauthorized(entity_id=entity_id)
 
         state = request.app["hass"].states.get(entity_id)
-        if state:
+        if not state:
+            return self.json_message("Entity not found.", HTTP_NOT_FOUND)
+        try:
+            body = state.as_dict_json
+        except (ValueError, TypeError):
             return self.json(state)
-        return self.json_message("Entity not found.", HTTP_NOT_FOUND)
+        return _json_response(body)
 
     async def post(self, request, entity_id):
         """Update state of entity."""
@@ -433,6 +443,15 @@ class APIErrorLog(HomeAssistantView):
         return web.FileResponse(request.app["hass"].data[DATA_LOGGING])
 
 
+def _json_response(body: str) -> web.Response:
+    """Return a JSON response for an already serialized body."""
+    response = web.Response(
+        body=body.encode("UTF-8"), content_type=CONTENT_TYPE_JSON, status=HTTP_OK
+    )
+    response.enable_compression()
+    return response
+
+
 async def async_services_json(hass):
     """Generate services data to JSONify."""
     descriptions = await async_get_all_descriptions(hass)
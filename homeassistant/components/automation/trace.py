@@ -4,7 +4,11 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import Any
 
-from homeassistant.components.trace import ActionTrace, async_store_trace
+from homeassistant.components.trace import (
+    ActionTrace,
+    async_finish_trace,
+    async_store_trace,
+)
 from homeassistant.components.trace.const import CONF_STORED_TRACES
 from homeassistant.core import Context
 
@@ -54,4 +58,4 @@ def trace_automation(
         raise ex
     finally:
         if automation_id:
-            trace.finished()
+            async_finish_trace(hass, trace)
@@ -1,13 +1,16 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterable
 from datetime import datetime as dt, timedelta
+import json
 import logging
 import time
 from typing import cast
 
 from aiohttp import web
+from aiohttp.hdrs import CONTENT_TYPE
 from sqlalchemy import not_, or_
 import voluptuous as vol
 
@@ -24,6 +27,7 @@ from homeassistant.const import (
     CONF_ENTITIES,
     CONF_EXCLUDE,
     CONF_INCLUDE,
+    CONTENT_TYPE_JSON,
     HTTP_BAD_REQUEST,
 )
 from homeassistant.core import HomeAssistant
@@ -33,6 +37,7 @@ from homeassistant.helpers.entityfilter import (
     CONF_ENTITY_GLOBS,
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
 )
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -42,6 +47,10 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN = "history"
 CONF_ORDER = "use_include_order"
 
+# The number of states to send in each chunk
+# of a streamed websocket history response
+STREAM_CHUNK_SIZE = 1000
+
 GLOB_TO_SQL_CHARS = {
     42: "%",  # *
     46: "_",  # .
@@ -101,10 +110,14 @@ async def async_setup(hass, config):
 
     use_include_order = conf.get(CONF_ORDER)
 
+    hass.data[DOMAIN] = filters
     hass.http.register_view(HistoryPeriodView(filters, use_include_order))
     hass.components.frontend.async_register_built_in_panel(
         "history", "history", "hass:poll-box"
     )
+    hass.components.websocket_api.async_register_command(
+        ws_stream_history_during_period
+    )
     hass.components.websocket_api.async_register_command(
         ws_get_statistics_during_period
     )
@@ -181,6 +194,139 @@ async def ws_get_list_statistic_ids(
     connection.send_result(msg["id"], statistic_ids)
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/stream_during_period",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("entity_ids"): [str],
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+        vol.Optional("minimal_response", default=False): bool,
+        vol.Optional("columnar", default=False): bool,
+        vol.Optional("cursor"): str,
+    }
+)
+@websocket_api.async_response
+async def ws_stream_history_during_period(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Stream the history during a period in chunks.
+
+    Each chunk is sent as an event with the states of one or more
+    entities and a cursor. Passing the cursor of the last chunk
+    received resumes an interrupted stream after it.
+
+    With columnar the states of each entity are sent as parallel
+    lists of states and last_changed epoch timestamps.
+    """
+    start_time = dt_util.parse_datetime(msg["start_time"])
+    if start_time:
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    if end_time_str := msg.get("end_time"):
+        end_time = dt_util.parse_datetime(end_time_str)
+        if end_time:
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = start_time + timedelta(days=1)
+
+    entity_ids = msg.get("entity_ids")
+    if entity_ids:
+        entity_ids = [entity_id.lower() for entity_id in entity_ids]
+
+    await hass.async_add_executor_job(
+        _stream_history_chunks,
+        hass,
+        connection,
+        msg["id"],
+        start_time,
+        end_time,
+        entity_ids,
+        hass.data[DOMAIN],
+        msg["include_start_time_state"],
+        msg["significant_changes_only"],
+        msg["minimal_response"],
+        msg["columnar"],
+        msg.get("cursor"),
+    )
+    connection.send_result(msg["id"])
+
+
+def _stream_history_chunks(
+    hass,
+    connection,
+    msg_id,
+    start_time,
+    end_time,
+    entity_ids,
+    filters,
+    include_start_time_state,
+    significant_changes_only,
+    minimal_response,
+    columnar,
+    cursor,
+):
+    """Send the significant states to the websocket in chunks."""
+    chunk = {}
+    chunk_size = 0
+
+    def send_chunk():
+        # The cursor is the last entity in the chunk, serialize
+        # in the executor to keep the work off the event loop
+        message = websocket_api.messages.message_to_json(
+            websocket_api.event_message(
+                msg_id, {"states": chunk, "cursor": next(reversed(chunk))}
+            )
+        )
+        # Wait for the client to receive each chunk before reading the next
+        # batch so a long period does not pile up in the connection queue
+        return asyncio.run_coroutine_threadsafe(
+            _async_send_and_drain(connection, message), hass.loop
+        ).result()
+
+    with session_scope(hass=hass) as session:
+        for entity_id, states in history.stream_significant_states(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            cursor,
+            columnar,
+        ):
+            chunk[entity_id] = states
+            chunk_size += len(states[history.STATE_KEY] if columnar else states)
+            if chunk_size >= STREAM_CHUNK_SIZE:
+                if not send_chunk():
+                    # The client is gone, stop reading the period
+                    return
+                chunk = {}
+                chunk_size = 0
+
+    if chunk:
+        send_chunk()
+
+
+async def _async_send_and_drain(connection, message):
+    """Send a message and wait until it is written to the client.
+
+    Returns False if the connection is closed.
+    """
+    connection.send_message(message)
+    return await connection.async_drain()
+
+
 class HistoryPeriodView(HomeAssistantView):
     """Handle history period requests."""
 
@@ -212,8 +358,10 @@ class HistoryPeriodView(HomeAssistantView):
         else:
             start_time = now - one_day
 
+        columnar = "columnar" in request.query
+
         if start_time > now:
-            return self.json([])
+            return self.json({} if columnar else [])
 
         end_time_str = request.query.get("end_time")
         if end_time_str:
@@ -242,7 +390,34 @@ class HistoryPeriodView(HomeAssistantView):
             and entity_ids
             and not _entities_may_have_state_changes_after(hass, entity_ids, start_time)
         ):
-            return self.json([])
+            return self.json({} if columnar else [])
+
+        if "stream" in request.query:
+            return await self._async_stream_significant_states_json(
+                request,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                columnar,
+            )
+
+        if columnar:
+            return cast(
+                web.Response,
+                await hass.async_add_executor_job(
+                    self._columnar_significant_states_json,
+                    hass,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    include_start_time_state,
+                    significant_changes_only,
+                ),
+            )
 
         return cast(
             web.Response,
@@ -306,6 +481,116 @@ class HistoryPeriodView(HomeAssistantView):
 
         return self.json(result)
 
+    def _columnar_significant_states_json(
+        self,
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+    ):
+        """Fetch significant states from the database as columnar json.
+
+        Each entity_id maps to parallel lists of states and
+        last_changed epoch timestamps.
+        """
+        with session_scope(hass=hass) as session:
+            return self.json(
+                dict(
+                    history.stream_significant_states(
+                        hass,
+                        session,
+                        start_time,
+                        end_time,
+                        entity_ids,
+                        self.filters,
+                        include_start_time_state,
+                        significant_changes_only,
+                        columnar=True,
+                    )
+                )
+            )
+
+    async def _async_stream_significant_states_json(
+        self,
+        request,
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        columnar,
+    ):
+        """Stream significant states from the database as json.
+
+        The states are written one entity at a time in entity_id order
+        so the use_include_order option does not apply.
+        """
+        response = web.StreamResponse(headers={CONTENT_TYPE: CONTENT_TYPE_JSON})
+        response.enable_compression()
+        await response.prepare(request)
+        await hass.async_add_executor_job(
+            self._stream_significant_states_json,
+            hass,
+            response,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            columnar,
+        )
+        await response.write_eof()
+        return response
+
+    def _stream_significant_states_json(
+        self,
+        hass,
+        response,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        columnar,
+    ):
+        """Write the significant states to the response as they are fetched.
+
+        With columnar the response is an object keyed by entity_id
+        instead of a list of lists of states.
+        """
+
+        def write(data):
+            # Wait for each write so a slow client throttles the query
+            asyncio.run_coroutine_threadsafe(response.write(data), hass.loop).result()
+
+        start, end = (b"{", b"}") if columnar else (b"[", b"]")
+        separator = start
+        with session_scope(hass=hass) as session:
+            for entity_id, states in history.stream_significant_states(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                self.filters,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                columnar=columnar,
+            ):
+                data = json.dumps(states, cls=JSONEncoder, allow_nan=False)
+                if columnar:
+                    data = f"{json.dumps(entity_id)}:{data}"
+                write(separator + data.encode("UTF-8"))
+                separator = b","
+        write(start + end if separator == start else end)
+
 
 def sqlalchemy_filter_from_include_exclude_conf(conf):
     """Build a sql filter from config."""
@@ -1,7 +1,7 @@
 """Provide info to system health."""
 from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import system_info
+from homeassistant.helpers import entity_platform, system_info, template
 
 
 @callback
@@ -15,6 +15,8 @@ def async_register(
 async def system_health_info(hass):
     """Get info for the info page."""
     info = await system_info.async_get_system_info(hass)
+    template_cache = template.compiled_code_cache_info()
+    polling = entity_platform.async_polling_stats_info(hass)
 
     return {
         "version": f"core-{info.get('version')}",
@@ -28,4 +30,11 @@ async def system_health_info(hass):
         "os_version": info.get("os_version"),
         "arch": info.get("arch"),
         "timezone": info.get("timezone"),
+        "template_cache_hits": template_cache["hits"],
+        "template_cache_misses": template_cache["misses"],
+        "template_cache_size": f"{template_cache['size']}/{template_cache['maxsize']}",
+        "polling_skipped_ticks": polling["skipped_ticks"],
+        "polling_max_latency": f"{polling['max_latency']:.3f} s",
+        "polling_slowest_platform": polling["slowest_platform"],
+        "suppressed_state_writes": entity_platform.async_suppressed_state_writes(hass),
     }
@@ -1,21 +1,29 @@
 """Event parser and human readable log generator."""
+import asyncio
 from contextlib import suppress
-from datetime import timedelta
+from datetime import datetime as dt, timedelta
 from itertools import groupby
 import json
 import re
+from typing import NamedTuple
 
+import async_timeout
 import sqlalchemy
 from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import literal
 import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.history import sqlalchemy_filter_from_include_exclude_conf
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.recorder import DATA_INSTANCE as RECORDER_INSTANCE
 from homeassistant.components.recorder.models import (
+    EventData,
     Events,
+    StateAttributes,
     States,
+    process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import session_scope
@@ -27,6 +35,7 @@ from homeassistant.const import (
     ATTR_ICON,
     ATTR_NAME,
     ATTR_SERVICE,
+    ATTR_UNIT_OF_MEASUREMENT,
     EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
@@ -42,6 +51,7 @@ from homeassistant.helpers.entityfilter import (
     convert_include_exclude_filter,
     generate_filter,
 )
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
@@ -59,8 +69,22 @@ CONTINUOUS_DOMAINS = ["proximity", "sensor"]
 
 DOMAIN = "logbook"
 
+DATA_FILTERS = "logbook_filters"
+
 GROUP_BY_MINUTES = 15
 
+# Number of context ids looked up with a single query
+MAX_CONTEXT_IDS_PER_QUERY = 500
+
+# Number of database rows in each page of history sent by the event stream
+STREAM_PAGE_SIZE = 1000
+
+# Number of contexts an event stream remembers to describe live events
+MAX_STREAM_CONTEXTS = 2048
+
+# Seconds an event stream waits for the recorder to commit the queued events
+RECORDER_SYNC_TIMEOUT = 30
+
 EMPTY_JSON_OBJECT = "{}"
 UNIT_OF_MEASUREMENT_JSON = '"unit_of_measurement":'
 
@@ -87,8 +111,10 @@ ALL_EVENT_TYPES = [
 ]
 
 EVENT_COLUMNS = [
+    Events.event_id,
     Events.event_type,
     Events.event_data,
+    EventData.shared_data,
     Events.time_fired,
     Events.context_id,
     Events.context_user_id,
@@ -160,7 +186,9 @@ async def async_setup(hass, config):
         filters = None
         entities_filter = None
 
+    hass.data[DATA_FILTERS] = (filters, entities_filter)
     hass.http.register_view(LogbookView(conf, filters, entities_filter))
+    hass.components.websocket_api.async_register_command(ws_event_stream)
 
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
 
@@ -239,24 +267,254 @@ class LogbookView(HomeAssistantView):
                 "Can't combine entity with context_id", HTTP_BAD_REQUEST
             )
 
+        limit = request.query.get("limit")
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                return self.json_message("Invalid limit", HTTP_BAD_REQUEST)
+            if limit < 1:
+                return self.json_message("Invalid limit", HTTP_BAD_REQUEST)
+
+        cursor = request.query.get("cursor")
+        if cursor is not None:
+            cursor = _parse_cursor(cursor)
+            if cursor is None:
+                return self.json_message("Invalid cursor", HTTP_BAD_REQUEST)
+
         def json_events():
             """Fetch events and generate JSON."""
+            events, next_cursor = _get_events_page(
+                hass,
+                start_day,
+                end_day,
+                entity_ids,
+                self.filters,
+                self.entities_filter,
+                entity_matches_only,
+                context_id,
+                cursor,
+                limit,
+            )
+            if limit is None and cursor is None:
+                return self.json(events)
             return self.json(
-                _get_events(
-                    hass,
-                    start_day,
-                    end_day,
-                    entity_ids,
-                    self.filters,
-                    self.entities_filter,
-                    entity_matches_only,
-                    context_id,
-                )
+                {
+                    "events": events,
+                    "next_cursor": next_cursor and _cursor_to_str(next_cursor),
+                }
             )
 
         return await hass.async_add_executor_job(json_events)
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "logbook/event_stream",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("entity_ids"): [str],
+    }
+)
+@websocket_api.async_response
+async def ws_event_stream(hass, connection, msg):
+    """Stream the logbook from the database and then live from the bus.
+
+    The historical entries are sent first in one or more events. Once the
+    history is sent, an event with no entries and live set to true marks
+    the switch to live events. Their entries follow as they happen until
+    end_time.
+    """
+    start_time = dt_util.parse_datetime(msg["start_time"])
+    if start_time:
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    if end_time_str := msg.get("end_time"):
+        end_time = dt_util.parse_datetime(end_time_str)
+        if end_time:
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = None
+
+    entity_ids = msg.get("entity_ids")
+    if entity_ids:
+        entity_ids = [entity_id.lower() for entity_id in entity_ids]
+
+    filters, entities_filter = hass.data[DATA_FILTERS]
+    if entity_ids:
+        filters = None
+        entities_filter = generate_filter([], entity_ids, [], [])
+
+    now = dt_util.utcnow()
+    live = end_time is None or end_time > now
+    stream = None
+    # Shared with the live events so they find contexts started in history
+    context_lookup = None
+
+    if live:
+        context_lookup = {None: None}
+        stream = LogbookEventStream(
+            hass, connection, msg["id"], entities_filter, context_lookup
+        )
+        stream.async_subscribe()
+        if end_time is not None:
+
+            @callback
+            def _async_end_stream(_):
+                """Stop the stream at the end time."""
+                stream.async_unsubscribe()
+
+            stream.async_on_unsubscribe(
+                async_track_point_in_utc_time(hass, _async_end_stream, end_time)
+            )
+        connection.subscriptions[msg["id"]] = stream.async_unsubscribe
+        end_time = now
+        # Everything fired before we subscribed must be in the
+        # database before we query it
+        try:
+            with async_timeout.timeout(RECORDER_SYNC_TIMEOUT):
+                await hass.data[RECORDER_INSTANCE].async_block_till_done()
+        except asyncio.TimeoutError:
+            if unsub := connection.subscriptions.pop(msg["id"], None):
+                unsub()
+            connection.send_error(
+                msg["id"],
+                websocket_api.const.ERR_TIMEOUT,
+                "Timed out waiting for the recorder",
+            )
+            return
+
+    connection.send_result(msg["id"])
+
+    cursor = None
+    while start_time < end_time:
+        events, cursor = await hass.async_add_executor_job(
+            _get_events_page,
+            hass,
+            start_time,
+            end_time,
+            entity_ids or None,
+            filters,
+            entities_filter,
+            False,
+            None,
+            cursor,
+            STREAM_PAGE_SIZE,
+            context_lookup,
+        )
+        if events:
+            connection.send_message(
+                websocket_api.event_message(msg["id"], {"events": events})
+            )
+        if cursor is None:
+            break
+
+    if stream is not None:
+        stream.async_start_live(now)
+
+
+class LogbookEventStream:
+    """Describe live events for a logbook event stream."""
+
+    def __init__(self, hass, connection, msg_id, entities_filter, context_lookup):
+        """Init the event stream."""
+        self._hass = hass
+        self._connection = connection
+        self._msg_id = msg_id
+        self._entities_filter = entities_filter
+        self._entity_attr_cache = EntityAttributeCache(hass)
+        self._context_lookup = context_lookup
+        self._pending = []
+        self._live = False
+        self._unsubs = []
+
+    @callback
+    def async_subscribe(self):
+        """Subscribe to the events the logbook describes."""
+        for event_type in (*ALL_EVENT_TYPES, *self._hass.data.get(DOMAIN, {})):
+            self._unsubs.append(
+                self._hass.bus.async_listen(event_type, self._async_event)
+            )
+
+    @callback
+    def async_on_unsubscribe(self, unsub):
+        """Call unsub when the stream is unsubscribed."""
+        self._unsubs.append(unsub)
+
+    @callback
+    def async_unsubscribe(self):
+        """Stop listening to events."""
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    @callback
+    def async_start_live(self, history_end):
+        """Send the events fired since history_end and go live."""
+        pending = [event for event in self._pending if event.time_fired >= history_end]
+        self._pending = []
+        self._live = True
+        self._connection.send_message(
+            websocket_api.event_message(self._msg_id, {"events": [], "live": True})
+        )
+        self._async_send(pending)
+
+    @callback
+    def _async_event(self, event):
+        """Describe or queue an event."""
+        if self._live:
+            self._async_send([event])
+        else:
+            self._pending.append(event)
+
+    @callback
+    def _async_send(self, events):
+        """Send the entries for live events."""
+        entries = list(
+            humanify(
+                self._hass,
+                self._yield_events(events),
+                self._entity_attr_cache,
+                self._context_lookup,
+            )
+        )
+        if len(self._context_lookup) > MAX_STREAM_CONTEXTS:
+            # Keep the newest half and the None lookup
+            context_ids = list(self._context_lookup)[
+                1 : len(self._context_lookup) - MAX_STREAM_CONTEXTS // 2
+            ]
+            for context_id in context_ids:
+                del self._context_lookup[context_id]
+        if entries:
+            self._connection.send_message(
+                websocket_api.event_message(self._msg_id, {"events": entries})
+            )
+
+    def _yield_events(self, events):
+        """Yield the live events the database query would have returned."""
+        entities_filter = self._entities_filter
+        for event in events:
+            event = LiveEventPartialState(event)
+            if event.event_type == EVENT_STATE_CHANGED:
+                if not event.logbook_state or (
+                    entities_filter is not None and not entities_filter(event.entity_id)
+                ):
+                    continue
+                self._context_lookup.setdefault(event.context_id, event)
+                yield event
+                continue
+            self._context_lookup.setdefault(event.context_id, event)
+            if event.event_type != EVENT_CALL_SERVICE and _keep_event(
+                self._hass, event, entities_filter
+            ):
+                yield event
+
+
 def humanify(hass, events, entity_attr_cache, context_lookup):
     """Generate a converted list of events into Entry objects.
 
@@ -422,19 +680,93 @@ def _get_events(
     context_id=None,
 ):
     """Get events for a period of time."""
+    return _get_events_page(
+        hass,
+        start_day,
+        end_day,
+        entity_ids,
+        filters,
+        entities_filter,
+        entity_matches_only,
+        context_id,
+    )[0]
+
+
+class LogbookCursor(NamedTuple):
+    """Position of the next page of the logbook."""
+
+    # Key of the last row read, rows are ordered by time fired and event id
+    time_fired: dt
+    event_id: int
+    # Rows of the last GROUP_BY_MINUTES batch read whose entries depend on
+    # the rows after them, they are read again with the next page
+    held_event_ids: tuple[int, ...] = ()
+
+
+def _cursor_to_str(cursor):
+    """Serialize a cursor for the logbook view."""
+    return ",".join(
+        [
+            cursor.time_fired.isoformat(),
+            *(str(event_id) for event_id in (cursor.event_id, *cursor.held_event_ids)),
+        ]
+    )
+
+
+def _parse_cursor(value):
+    """Parse a cursor of the logbook view, None if it is invalid."""
+    time_fired, *event_ids = value.split(",")
+    time_fired = dt_util.parse_datetime(time_fired)
+    if time_fired is None or not event_ids:
+        return None
+    try:
+        event_id, *held_event_ids = (int(event_id) for event_id in event_ids)
+    except ValueError:
+        return None
+    return LogbookCursor(dt_util.as_utc(time_fired), event_id, tuple(held_event_ids))
+
+
+def _get_events_page(
+    hass,
+    start_day,
+    end_day,
+    entity_ids=None,
+    filters=None,
+    entities_filter=None,
+    entity_matches_only=False,
+    context_id=None,
+    cursor=None,
+    limit=None,
+    context_lookup=None,
+):
+    """Get a page of events for a period of time.
+
+    The page holds the rows after the cursor, or from the start of the
+    period if no cursor is given, at most limit of them. The entries of
+    continuous entities in the last GROUP_BY_MINUTES batch of a full page
+    and of Home Assistant starts and stops in its last minute depend on the
+    rows after it. Those rows are held back and carried to the next page
+    with the cursor, so grouping works as it would without paging.
+
+    The contexts of the rows are added to context_lookup if it is given.
+
+    Returns the entries and the cursor of the next page, None if done.
+    """
     assert not (
         entity_ids and context_id
     ), "can't pass in both entity_ids and context_id"
 
     entity_attr_cache = EntityAttributeCache(hass)
-    context_lookup = {None: None}
+    if context_lookup is None:
+        context_lookup = {None: None}
+    held_event_ids = set()
 
-    def yield_events(query):
+    def yield_events(rows):
         """Yield Events that are not filtered away."""
-        for row in query.yield_per(1000):
+        for row in rows:
             event = LazyEventPartialState(row)
             context_lookup.setdefault(event.context_id, event)
-            if event.event_type == EVENT_CALL_SERVICE:
+            if event.event_type == EVENT_CALL_SERVICE or row.event_id in held_event_ids:
                 continue
             if event.event_type == EVENT_STATE_CHANGED or _keep_event(
                 hass, event, entities_filter
@@ -444,48 +776,165 @@ def _get_events(
     if entity_ids is not None:
         entities_filter = generate_filter([], entity_ids, [], [])
 
+    def logbook_query(session, page_end=end_day, **kwargs):
+        """Return the logbook query for part of the period."""
+        return _generate_logbook_query(
+            hass,
+            session,
+            start_day,
+            page_end,
+            entity_ids,
+            filters,
+            entity_matches_only,
+            context_id,
+            **kwargs,
+        ).order_by(Events.time_fired, Events.event_id)
+
     with session_scope(hass=hass) as session:
-        old_state = aliased(States, name="old_state")
+        next_cursor = None
+        query = logbook_query(session, after=cursor)
 
-        if entity_ids is not None:
-            query = _generate_events_query_without_states(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_event_types_filter(
-                hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
-            )
-            if entity_matches_only:
-                # When entity_matches_only is provided, contexts and events that do not
-                # contain the entity_ids are not included in the logbook response.
-                query = _apply_event_entity_id_matchers(query, entity_ids)
-
-            query = query.union_all(
-                _generate_states_query(
-                    session, start_day, end_day, old_state, entity_ids
-                )
-            )
+        if cursor is None and limit is None:
+            rows = query.yield_per(1000)
         else:
-            query = _generate_events_query(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_events_types_and_states_filter(
-                hass, query, old_state
-            ).filter(
-                (States.last_updated == States.last_changed)
-                | (Events.event_type != EVENT_STATE_CHANGED)
-            )
-            if filters:
-                query = query.filter(
-                    filters.entity_filter() | (Events.event_type != EVENT_STATE_CHANGED)
+            if limit is not None:
+                query = query.limit(limit)
+            rows = query.all()
+            full_page = limit is not None and len(rows) == limit
+
+            if cursor is not None:
+                if cursor.held_event_ids:
+                    rows = [
+                        *logbook_query(session, event_ids=cursor.held_event_ids),
+                        *rows,
+                    ]
+                _lookup_context_origins(
+                    rows,
+                    context_lookup,
+                    lambda context_ids: logbook_query(
+                        session,
+                        # Include the rows fired at the time of the cursor
+                        cursor.time_fired + timedelta(microseconds=1),
+                        context_ids=context_ids,
+                    ),
                 )
 
-            if context_id is not None:
-                query = query.filter(Events.context_id == context_id)
+            if full_page:
+                next_cursor = _next_cursor(rows, held_event_ids)
+
+        return (
+            list(humanify(hass, yield_events(rows), entity_attr_cache, context_lookup)),
+            next_cursor,
+        )
+
+
+def _next_cursor(rows, held_event_ids):
+    """Return the cursor after a full page of rows.
+
+    Adds the rows of the last GROUP_BY_MINUTES batch whose entries depend on
+    the rows after the page to held_event_ids. Only the last row of each
+    continuous entity is carried to the next page, it supersedes the others.
+    """
+    last_row = rows[-1]
+    last_minute = last_row.time_fired.minute
+    continuous_entity_ids = set()
+    carried = []
+    for row in reversed(rows):
+        minute = row.time_fired.minute
+        if minute // GROUP_BY_MINUTES != last_minute // GROUP_BY_MINUTES:
+            break
+        if row.event_type == EVENT_STATE_CHANGED and row.domain in CONTINUOUS_DOMAINS:
+            if row.entity_id not in continuous_entity_ids:
+                continuous_entity_ids.add(row.entity_id)
+                carried.append(row.event_id)
+        elif row.event_type in HOMEASSISTANT_EVENTS and minute == last_minute:
+            carried.append(row.event_id)
+        else:
+            continue
+        held_event_ids.add(row.event_id)
+
+    return LogbookCursor(
+        process_timestamp(last_row.time_fired),
+        last_row.event_id,
+        tuple(sorted(carried)),
+    )
+
+
+def _lookup_context_origins(rows, context_lookup, context_query):
+    """Look up the events that started the contexts of rows in the database.
+
+    The first event of a context, or of its parent context, may be before
+    the start of the page. Only the first event of each context is kept.
+    """
+    context_ids = list(
+        {row.context_id for row in rows}
+        | {row.context_parent_id for row in rows if row.context_parent_id}
+    )
+    for idx in range(0, len(context_ids), MAX_CONTEXT_IDS_PER_QUERY):
+        for row in context_query(context_ids[idx : idx + MAX_CONTEXT_IDS_PER_QUERY]):
+            context_lookup.setdefault(row.context_id, LazyEventPartialState(row))
 
-        query = query.order_by(Events.time_fired)
 
-        return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+def _generate_logbook_query(
+    hass,
+    session,
+    start_day,
+    end_day,
+    entity_ids,
+    filters,
+    entity_matches_only,
+    context_id,
+    after=None,
+    context_ids=None,
+    event_ids=None,
+):
+    """Generate the logbook query for a period of time."""
+    old_state = aliased(States, name="old_state")
+
+    if entity_ids is not None:
+        query = _generate_events_query_without_states(session)
+        query = _apply_event_time_filter(query, start_day, end_day, after)
+        query = _apply_event_types_filter(
+            hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
+        )
+        if entity_matches_only:
+            # When entity_matches_only is provided, contexts and events that do not
+            # contain the entity_ids are not included in the logbook response.
+            query = _apply_event_entity_id_matchers(query, entity_ids)
+        states_query = _generate_states_query(
+            session, start_day, end_day, old_state, entity_ids, after
+        )
+        if context_ids is not None:
+            query = _apply_event_context_ids_filter(query, context_ids)
+            states_query = _apply_event_context_ids_filter(states_query, context_ids)
+        if event_ids is not None:
+            query = _apply_event_ids_filter(query, event_ids)
+            states_query = _apply_event_ids_filter(states_query, event_ids)
+
+        return query.union_all(states_query)
+
+    query = _generate_events_query(session)
+    query = _apply_event_time_filter(query, start_day, end_day, after)
+    query = _apply_events_types_and_states_filter(hass, query, old_state).filter(
+        (States.last_updated == States.last_changed)
+        | (Events.event_type != EVENT_STATE_CHANGED)
+    )
+    if filters:
+        query = query.filter(
+            filters.entity_filter() | (Events.event_type != EVENT_STATE_CHANGED)
         )
 
+    if context_id is not None:
+        query = query.filter(Events.context_id == context_id)
+
+    if context_ids is not None:
+        query = _apply_event_context_ids_filter(query, context_ids)
+
+    if event_ids is not None:
+        query = _apply_event_ids_filter(query, event_ids)
+
+    return query
+
 
 def _generate_events_query(session):
     return session.query(
@@ -494,6 +943,7 @@ def _generate_events_query(session):
         States.entity_id,
         States.domain,
         States.attributes,
+        StateAttributes.shared_attrs,
     )
 
 
@@ -504,14 +954,21 @@ def _generate_events_query_without_states(session):
         literal(value=None, type_=sqlalchemy.String).label("entity_id"),
         literal(value=None, type_=sqlalchemy.String).label("domain"),
         literal(value=None, type_=sqlalchemy.Text).label("attributes"),
-    )
+        literal(value=None, type_=sqlalchemy.Text).label("shared_attrs"),
+    ).outerjoin(EventData, (Events.data_id == EventData.data_id))
 
 
-def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
-    return (
+def _generate_states_query(
+    session, start_day, end_day, old_state, entity_ids, after=None
+):
+    query = (
         _generate_events_query(session)
         .outerjoin(Events, (States.event_id == Events.event_id))
+        .outerjoin(EventData, (Events.data_id == EventData.data_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(_missing_state_matcher(old_state))
         .filter(_continuous_entity_matcher())
         .filter((States.last_updated > start_day) & (States.last_updated < end_day))
@@ -520,12 +977,21 @@ def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
             & States.entity_id.in_(entity_ids)
         )
     )
+    if after is not None:
+        query = _apply_event_keyset_filter(
+            query.filter(States.last_updated >= after.time_fired), after
+        )
+    return query
 
 
 def _apply_events_types_and_states_filter(hass, query, old_state):
     events_query = (
-        query.outerjoin(States, (Events.event_id == States.event_id))
+        query.outerjoin(EventData, (Events.data_id == EventData.data_id))
+        .outerjoin(States, (Events.event_id == States.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(
             (Events.event_type != EVENT_STATE_CHANGED)
             | _missing_state_matcher(old_state)
@@ -555,14 +1021,39 @@ def _continuous_entity_matcher():
     #
     return sqlalchemy.or_(
         sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS)),
-        sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)),
+        sqlalchemy.not_(
+            sqlalchemy.func.coalesce(
+                StateAttributes.shared_attrs, States.attributes
+            ).contains(UNIT_OF_MEASUREMENT_JSON)
+        ),
     )
 
 
-def _apply_event_time_filter(events_query, start_day, end_day):
-    return events_query.filter(
+def _apply_event_time_filter(events_query, start_day, end_day, after=None):
+    events_query = events_query.filter(
         (Events.time_fired > start_day) & (Events.time_fired < end_day)
     )
+    if after is not None:
+        events_query = _apply_event_keyset_filter(
+            events_query.filter(Events.time_fired >= after.time_fired), after
+        )
+    return events_query
+
+
+def _apply_event_keyset_filter(events_query, after):
+    # The range filter on the time the caller adds uses the index,
+    # this one only skips the rows fired with the last one read
+    return events_query.filter(
+        (Events.time_fired > after.time_fired) | (Events.event_id > after.event_id)
+    )
+
+
+def _apply_event_context_ids_filter(events_query, context_ids):
+    return events_query.filter(Events.context_id.in_(context_ids))
+
+
+def _apply_event_ids_filter(events_query, event_ids):
+    return events_query.filter(Events.event_id.in_(event_ids))
 
 
 def _apply_event_types_filter(hass, query, event_types):
@@ -575,7 +1066,9 @@ def _apply_event_entity_id_matchers(events_query, entity_ids):
     return events_query.filter(
         sqlalchemy.or_(
             *[
-                Events.event_data.contains(ENTITY_ID_JSON_TEMPLATE.format(entity_id))
+                sqlalchemy.func.coalesce(
+                    EventData.shared_data, Events.event_data
+                ).contains(ENTITY_ID_JSON_TEMPLATE.format(entity_id))
                 for entity_id in entity_ids
             ]
         )
@@ -715,7 +1208,9 @@ class LazyEventPartialState:
         if self._attributes:
             return self._attributes.get(ATTR_ICON)
 
-        result = ICON_JSON_EXTRACT.search(self._row.attributes)
+        result = ICON_JSON_EXTRACT.search(
+            self._row.shared_attrs or self._row.attributes or EMPTY_JSON_OBJECT
+        )
         return result and result.group(1)
 
     @property
@@ -724,7 +1219,7 @@ class LazyEventPartialState:
         if self._event_data:
             return self._event_data.get(ATTR_ENTITY_ID)
 
-        result = ENTITY_ID_JSON_EXTRACT.search(self._row.event_data)
+        result = ENTITY_ID_JSON_EXTRACT.search(self._event_data_json)
         return result and result.group(1)
 
     @property
@@ -733,30 +1228,34 @@ class LazyEventPartialState:
         if self._event_data:
             return self._event_data.get(ATTR_DOMAIN)
 
-        result = DOMAIN_JSON_EXTRACT.search(self._row.event_data)
+        result = DOMAIN_JSON_EXTRACT.search(self._event_data_json)
         return result and result.group(1)
 
     @property
     def attributes(self):
         """State attributes."""
         if not self._attributes:
-            if (
-                self._row.attributes is None
-                or self._row.attributes == EMPTY_JSON_OBJECT
-            ):
+            source = self._row.shared_attrs or self._row.attributes
+            if source is None or source == EMPTY_JSON_OBJECT:
                 self._attributes = {}
             else:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = json.loads(source)
         return self._attributes
 
+    @property
+    def _event_data_json(self):
+        """Return the event data json, shared or stored with the event."""
+        return self._row.shared_data or self._row.event_data or EMPTY_JSON_OBJECT
+
     @property
     def data(self):
         """Event data."""
         if not self._event_data:
-            if self._row.event_data == EMPTY_JSON_OBJECT:
+            source = self._event_data_json
+            if source == EMPTY_JSON_OBJECT:
                 self._event_data = {}
             else:
-                self._event_data = json.loads(self._row.event_data)
+                self._event_data = json.loads(source)
         return self._event_data
 
     @property
@@ -770,6 +1269,78 @@ class LazyEventPartialState:
         return self._time_fired_isoformat
 
 
+class LiveEventPartialState:
+    """A version of LazyEventPartialState for an event fired on the bus."""
+
+    __slots__ = [
+        "event_type",
+        "entity_id",
+        "state",
+        "domain",
+        "data",
+        "attributes",
+        "context_id",
+        "context_user_id",
+        "context_parent_id",
+        "time_fired_minute",
+        "time_fired_isoformat",
+        "logbook_state",
+    ]
+
+    def __init__(self, event):
+        """Init the live event."""
+        self.event_type = event.event_type
+        self.data = event.data
+        self.context_id = event.context.id
+        self.context_user_id = event.context.user_id
+        self.context_parent_id = event.context.parent_id
+        self.time_fired_minute = event.time_fired.minute
+        self.time_fired_isoformat = event.time_fired.isoformat()
+        self.entity_id = None
+        self.state = None
+        self.domain = None
+        self.attributes = {}
+        self.logbook_state = False
+
+        if event.event_type != EVENT_STATE_CHANGED:
+            return
+
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            return
+
+        self.entity_id = new_state.entity_id
+        self.state = new_state.state
+        self.domain = new_state.domain
+        self.attributes = new_state.attributes
+        # The same changes the database query keeps: a state change of an
+        # existing entity that is not a continuous sensor
+        self.logbook_state = (
+            old_state is not None
+            and old_state.state != new_state.state
+            and not (
+                new_state.domain in CONTINUOUS_DOMAINS
+                and ATTR_UNIT_OF_MEASUREMENT in new_state.attributes
+            )
+        )
+
+    @property
+    def attributes_icon(self):
+        """Extract the icon from the attributes."""
+        return self.attributes.get(ATTR_ICON)
+
+    @property
+    def data_entity_id(self):
+        """Extract the entity id from the data."""
+        return self.data.get(ATTR_ENTITY_ID)
+
+    @property
+    def data_domain(self):
+        """Extract the domain from the data."""
+        return self.data.get(ATTR_DOMAIN)
+
+
 class EntityAttributeCache:
     """A cache to lookup static entity_id attribute.
 
@@ -0,0 +1,97 @@
+"""Index MQTT subscriptions by topic filter."""
+from __future__ import annotations
+
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+MULTI_LEVEL_WILDCARD = "#"
+SINGLE_LEVEL_WILDCARD = "+"
+
+
+class _TopicTrieNode(Generic[_T]):
+    """A level of a topic filter."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        # The values of the topic filters ending at this level
+        # mapped to the order they were added in
+        self.values: dict[_T, int] = {}
+
+
+class TopicTrie(Generic[_T]):
+    """A trie of MQTT topic filters.
+
+    Finding the values of the topic filters that match a topic
+    only walks the levels of the topic and the wildcards next to them
+    instead of testing every topic filter. Matches are returned in the
+    order they were added, the same order a linear scan would find them.
+    """
+
+    __slots__ = ("_root", "_next_order")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+        self._next_order = 0
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.values[value] = self._next_order
+        self._next_order += 1
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value for a topic filter.
+
+        Raises KeyError if the value was not added for the topic filter.
+        """
+        path = [self._root]
+        levels = topic_filter.split("/")
+        for level in levels:
+            path.append(path[-1].children[level])
+        del path[-1].values[value]
+
+        # Prune the levels that no longer lead to any value
+        for index in range(len(levels), 0, -1):
+            node = path[index]
+            if node.values or node.children:
+                break
+            del path[index - 1].children[levels[index - 1]]
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of the topic filters matching a topic."""
+        levels = topic.split("/")
+        depth = len(levels)
+        # Wildcards do not match topics starting with $ at the first level
+        wildcard_start = 1 if topic.startswith("$") else 0
+        matches: list[tuple[int, _T]] = []
+
+        def _match(node: _TopicTrieNode[_T], index: int) -> None:
+            children = node.children
+            # A multi level wildcard also matches the parent level
+            if index >= wildcard_start and (
+                multi := children.get(MULTI_LEVEL_WILDCARD)
+            ):
+                matches.extend((order, value) for value, order in multi.values.items())
+            if index == depth:
+                matches.extend((order, value) for value, order in node.values.items())
+                return
+            if child := children.get(levels[index]):
+                _match(child, index + 1)
+            if index >= wildcard_start and (
+                single := children.get(SINGLE_LEVEL_WILDCARD)
+            ):
+                _match(single, index + 1)
+
+        _match(self._root, 0)
+        if len(matches) > 1:
+            matches.sort(key=lambda match: match[0])
+        return [value for _, value in matches]
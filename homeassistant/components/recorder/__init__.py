@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import concurrent.futures
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 import queue
@@ -11,7 +12,7 @@ import threading
 import time
 from typing import Any, Callable, NamedTuple
 
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select
+from sqlalchemy import create_engine, event as sqlalchemy_event, exc, func, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -28,7 +29,7 @@ from homeassistant.const import (
     EVENT_TIME_CHANGED,
     MATCH_ALL,
 )
-from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.core import CoreState, Event, HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
@@ -47,11 +48,13 @@ from homeassistant.helpers.service import async_extract_entity_ids
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
+from homeassistant.util.lru import LRU
 
-from . import history, migration, purge, statistics
+from . import history, migration, purge, statistics, websocket_api
 from .const import CONF_DB_INTEGRITY_CHECK, DATA_INSTANCE, DOMAIN, SQLITE_URL_PREFIX
-from .models import Base, Events, RecorderRuns, States
+from .models import Base, EventData, Events, RecorderRuns, StateAttributes, States
 from .pool import RecorderPool
+from .spill import EventSpill
 from .util import (
     dburl_to_path,
     end_incomplete_runs,
@@ -75,6 +78,12 @@ ATTR_APPLY_FILTER = "apply_filter"
 
 MAX_QUEUE_BACKLOG = 30000
 
+# When spilling to disk, events are spilled once the queue holds this many
+SPILL_QUEUE_BACKLOG = 10000
+
+# The number of spilled events replayed between checking the queue
+SPILL_REPLAY_BATCH = 1000
+
 SERVICE_PURGE_SCHEMA = vol.Schema(
     {
         vol.Optional(ATTR_KEEP_DAYS): cv.positive_int,
@@ -103,12 +112,37 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 1
+DEFAULT_BULK_WRITER = False
+DEFAULT_SPILL_TO_DISK = False
+DEFAULT_SPILL_FILE = "home-assistant_v2.spill"
 KEEPALIVE_TIME = 30
 
+# The bulk writer assigns primary keys itself since it is
+# the only writer to the events and states tables. This is
+# only safe where an explicit id does not desync the
+# auto increment counter of the column.
+BULK_WRITER_DIALECTS = ("sqlite", "mysql")
+
 # Controls how often we clean up
 # States and Events objects
 EXPIRE_AFTER_COMMITS = 120
 
+# The number of attribute ids to cache in memory
+#
+# Based on:
+# - The number of overlapping attributes
+# - How frequently states with overlapping attributes will change
+# - How much memory our low end hardware has
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
+
+# The number of event data ids to cache in memory
+#
+# Based on:
+# - How many distinct payloads frequent events like
+#   call_service and automation_triggered repeat
+# - How much memory our low end hardware has
+EVENT_DATA_ID_CACHE_SIZE = 2048
+
 CONF_AUTO_PURGE = "auto_purge"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
@@ -117,6 +151,8 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_WRITER = "bulk_writer"
+CONF_SPILL_TO_DISK = "spill_to_disk"
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -145,6 +181,12 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(
+                        CONF_BULK_WRITER, default=DEFAULT_BULK_WRITER
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_SPILL_TO_DISK, default=DEFAULT_SPILL_TO_DISK
+                    ): cv.boolean,
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -222,6 +264,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_purge = conf[CONF_AUTO_PURGE]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    bulk_writer = conf[CONF_BULK_WRITER]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
@@ -229,6 +272,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
     exclude = conf[CONF_EXCLUDE]
     exclude_t = exclude.get(CONF_EVENT_TYPES, [])
+    spill_path = None
+    if conf[CONF_SPILL_TO_DISK]:
+        spill_path = hass.config.path(DEFAULT_SPILL_FILE)
     instance = hass.data[DATA_INSTANCE] = Recorder(
         hass=hass,
         auto_purge=auto_purge,
@@ -239,10 +285,15 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_t=exclude_t,
+        bulk_writer=bulk_writer,
+        spill_path=spill_path,
     )
+    if instance.spill is not None:
+        await hass.async_add_executor_job(instance.spill.load)
     instance.async_initialize()
     instance.start()
     _async_register_services(hass, instance)
+    websocket_api.async_setup(hass)
     history.async_setup(hass)
     statistics.async_setup(hass)
     await async_process_integration_platforms(hass, DOMAIN, _process_recorder_platform)
@@ -331,6 +382,35 @@ class WaitTask:
     """An object to insert into the recorder queue to tell it set the _queue_watch event."""
 
 
+class SynchronizeTask(NamedTuple):
+    """An object to insert into the recorder queue to commit and then set an asyncio event."""
+
+    event: asyncio.Event
+
+
+@dataclass
+class RecorderStats:
+    """Statistics about the commits of the recorder."""
+
+    commits: int = 0
+    rows: int = 0
+    rows_per_second: float = 0.0
+    last_commit_latency: float = 0.0
+    max_commit_latency: float = 0.0
+    last_commit: float | None = None
+
+    def record_commit(self, rows: int, start: float, end: float) -> None:
+        """Record a commit of rows that started at start and ended at end."""
+        latency = end - start
+        self.commits += 1
+        self.rows += rows
+        self.last_commit_latency = latency
+        self.max_commit_latency = max(self.max_commit_latency, latency)
+        if self.last_commit is not None and end > self.last_commit:
+            self.rows_per_second = rows / (end - self.last_commit)
+        self.last_commit = end
+
+
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
@@ -345,6 +425,8 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_t: list[str],
+        bulk_writer: bool = DEFAULT_BULK_WRITER,
+        spill_path: str | None = None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -353,7 +435,10 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.keep_days = keep_days
         self.commit_interval = commit_interval
+        self.bulk_writer = bulk_writer
         self.queue: Any = queue.SimpleQueue()
+        self.spill = EventSpill(hass, spill_path) if spill_path else None
+        self.stats = RecorderStats()
         self.recording_start = dt_util.utcnow()
         self.db_url = uri
         self.db_max_retries = db_max_retries
@@ -372,6 +457,19 @@ class Recorder(threading.Thread):
         self._keepalive_count = 0
         self._old_states: dict[str, States] = {}
         self._pending_expunge: list[States] = []
+        self._old_state_ids: dict[str, int] = {}
+        self._pending_event_rows: list[dict[str, Any]] = []
+        self._pending_state_rows: list[dict[str, Any]] = []
+        self._next_event_id = 1
+        self._next_state_id = 1
+        self._next_attributes_id = 1
+        self._state_attributes_ids: LRU[str, int] = LRU(STATE_ATTRIBUTES_ID_CACHE_SIZE)
+        self._pending_state_attributes: dict[str, StateAttributes] = {}
+        self._pending_state_attributes_rows: dict[str, dict[str, Any]] = {}
+        self._next_data_id = 1
+        self._event_data_ids: LRU[str, int] = LRU(EVENT_DATA_ID_CACHE_SIZE)
+        self._pending_event_data: dict[str, EventData] = {}
+        self._pending_event_data_rows: dict[str, dict[str, Any]] = {}
         self.event_session = None
         self.get_session = None
         self._completed_first_database_setup = None
@@ -618,14 +716,37 @@ class Recorder(threading.Thread):
         # Use a session for the event read loop
         # with a commit every time the event time
         # has changed. This reduces the disk io.
-        while event := self.queue.get():
+        spill = self.spill
+        while True:
+            if spill is not None and spill.active and self.queue.empty():
+                self._process_events(spill.replay(SPILL_REPLAY_BATCH))
+                continue
+            if (event := self.queue.get()) is None:
+                break
+            if spill is not None and spill.active and not isinstance(event, Event):
+                # Tasks are queued while events are spilled, do not let
+                # them overtake the events spilled before them
+                self._replay_spilled_events(spill.spilled)
+            self._process_events([event])
+
+        self._shutdown()
+
+    def _replay_spilled_events(self, until):
+        """Replay the spilled events until the given number were replayed."""
+        spill = self.spill
+        while spill.active and spill.replayed < until:
+            self._process_events(
+                spill.replay(min(SPILL_REPLAY_BATCH, until - spill.replayed))
+            )
+
+    def _process_events(self, events):
+        """Process events and tasks, logging the ones that fail."""
+        for event in events:
             try:
                 self._process_one_event_or_recover(event)
             except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Error while processing event %s: %s", event, err)
 
-        self._shutdown()
-
     def _process_one_event_or_recover(self, event):
         """Process an event, reconnect, or recover a malformed database."""
         try:
@@ -700,6 +821,9 @@ class Recorder(threading.Thread):
 
     def _run_purge(self, purge_before, repack, apply_filter):
         """Purge the database."""
+        # Commit first so the purge can see which shared
+        # attributes are still referenced by the new states
+        self._commit_event_session_or_retry()
         if purge.purge_old_data(self, purge_before, repack, apply_filter):
             # We always need to do the db cleanups after a purge
             # is finished to ensure the WAL checkpoint and other
@@ -711,6 +835,7 @@ class Recorder(threading.Thread):
 
     def _run_purge_entities(self, entity_filter):
         """Purge entities from the database."""
+        self._commit_event_session_or_retry()
         if purge.purge_entity_data(self, entity_filter):
             return
         # Schedule a new purge task if this one didn't finish
@@ -740,6 +865,10 @@ class Recorder(threading.Thread):
         if isinstance(event, WaitTask):
             self._queue_watch.set()
             return
+        if isinstance(event, SynchronizeTask):
+            self._commit_event_session_or_retry()
+            self.hass.loop.call_soon_threadsafe(event.event.set)
+            return
         if event.event_type == EVENT_TIME_CHANGED:
             self._keepalive_count += 1
             if self._keepalive_count >= KEEPALIVE_TIME:
@@ -755,11 +884,24 @@ class Recorder(threading.Thread):
         if not self.enabled:
             return
 
+        if self.bulk_writer:
+            self._process_one_event_to_rows(event)
+        else:
+            self._process_one_event_to_session(event)
+
+        # If they do not have a commit interval
+        # than we commit right away
+        if not self.commit_interval:
+            self._commit_event_session_or_retry()
+
+    def _process_one_event_to_session(self, event):
+        """Add the ORM objects for an event to the event session."""
         try:
             if event.event_type == EVENT_STATE_CHANGED:
                 dbevent = Events.from_event(event, event_data="{}")
             else:
                 dbevent = Events.from_event(event)
+                self._set_event_data(dbevent)
             dbevent.created = event.time_fired
             self.event_session.add(dbevent)
         except (TypeError, ValueError):
@@ -769,6 +911,7 @@ class Recorder(threading.Thread):
         if event.event_type == EVENT_STATE_CHANGED:
             try:
                 dbstate = States.from_event(event)
+                self._set_state_attributes(dbstate)
                 has_new_state = event.data.get("new_state")
                 if dbstate.entity_id in self._old_states:
                     old_state = self._old_states.pop(dbstate.entity_id)
@@ -790,10 +933,162 @@ class Recorder(threading.Thread):
                     event.data.get("new_state"),
                 )
 
-        # If they do not have a commit interval
-        # than we commit right away
-        if not self.commit_interval:
-            self._commit_event_session_or_retry()
+    def _process_one_event_to_rows(self, event):
+        """Queue the rows for an event to be inserted at the next commit.
+
+        The primary keys are assigned here so the states rows can
+        reference their event and old state without a flush.
+        """
+        try:
+            if event.event_type == EVENT_STATE_CHANGED:
+                event_row = Events.row_from_event(event, event_data="{}")
+            else:
+                event_row = Events.row_from_event(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+            return
+
+        # All rows of an executemany must have the same columns
+        if event.event_type == EVENT_STATE_CHANGED:
+            event_row["data_id"] = None
+        else:
+            event_row["data_id"] = self._event_data_id_for_row(event_row["event_data"])
+            event_row["event_data"] = None
+
+        event_id = event_row["event_id"] = self._next_event_id
+        event_row["created"] = event.time_fired
+        self._next_event_id += 1
+        self._pending_event_rows.append(event_row)
+
+        if event.event_type != EVENT_STATE_CHANGED:
+            return
+
+        try:
+            state_row = States.row_from_event(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning(
+                "State is not JSON serializable: %s",
+                event.data.get("new_state"),
+            )
+            return
+
+        state_row["attributes_id"] = self._state_attributes_id_for_row(
+            state_row.pop("attributes")
+        )
+        entity_id = state_row["entity_id"]
+        has_new_state = event.data.get("new_state")
+        state_id = state_row["state_id"] = self._next_state_id
+        self._next_state_id += 1
+        state_row["old_state_id"] = self._old_state_ids.pop(entity_id, None)
+        if not has_new_state:
+            state_row["state"] = None
+        state_row["event_id"] = event_id
+        state_row["created"] = event.time_fired
+        self._pending_state_rows.append(state_row)
+        if has_new_state:
+            self._old_state_ids[entity_id] = state_id
+
+    def _find_shared_attrs_in_db(self, shared_attrs: str) -> int | None:
+        """Find the attributes_id of attributes already in the database."""
+        if (attributes_id := self._state_attributes_ids.get(shared_attrs)) is not None:
+            return attributes_id
+        attr_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+        with self.event_session.no_autoflush:
+            attributes = (
+                self.event_session.query(StateAttributes.attributes_id)
+                .filter(StateAttributes.hash == attr_hash)
+                .filter(StateAttributes.shared_attrs == shared_attrs)
+                .first()
+            )
+        if not attributes:
+            return None
+        self._state_attributes_ids[shared_attrs] = attributes[0]
+        return attributes[0]
+
+    def _set_state_attributes(self, dbstate: States) -> None:
+        """Move the attributes of a state to the shared state attributes."""
+        shared_attrs = dbstate.attributes
+        dbstate.attributes = None
+        if pending_attributes := self._pending_state_attributes.get(shared_attrs):
+            dbstate.state_attributes = pending_attributes
+        elif (attributes_id := self._find_shared_attrs_in_db(shared_attrs)) is not None:
+            dbstate.attributes_id = attributes_id
+        else:
+            dbstate_attributes = StateAttributes(
+                hash=StateAttributes.hash_shared_attrs(shared_attrs),
+                shared_attrs=shared_attrs,
+            )
+            self._pending_state_attributes[shared_attrs] = dbstate_attributes
+            dbstate.state_attributes = dbstate_attributes
+
+    def _state_attributes_id_for_row(self, shared_attrs: str) -> int:
+        """Return the attributes_id for shared attributes of a states row.
+
+        New attributes are queued to be inserted before the states rows.
+        """
+        if pending_row := self._pending_state_attributes_rows.get(shared_attrs):
+            return pending_row["attributes_id"]
+        if (attributes_id := self._find_shared_attrs_in_db(shared_attrs)) is not None:
+            return attributes_id
+        attributes_id = self._next_attributes_id
+        self._next_attributes_id += 1
+        self._pending_state_attributes_rows[shared_attrs] = {
+            "attributes_id": attributes_id,
+            "hash": StateAttributes.hash_shared_attrs(shared_attrs),
+            "shared_attrs": shared_attrs,
+        }
+        return attributes_id
+
+    def _find_shared_data_in_db(self, shared_data: str) -> int | None:
+        """Find the data_id of event data already in the database."""
+        if (data_id := self._event_data_ids.get(shared_data)) is not None:
+            return data_id
+        data_hash = EventData.hash_shared_data(shared_data)
+        with self.event_session.no_autoflush:
+            event_data = (
+                self.event_session.query(EventData.data_id)
+                .filter(EventData.hash == data_hash)
+                .filter(EventData.shared_data == shared_data)
+                .first()
+            )
+        if not event_data:
+            return None
+        self._event_data_ids[shared_data] = event_data[0]
+        return event_data[0]
+
+    def _set_event_data(self, dbevent: Events) -> None:
+        """Move the data of an event to the shared event data."""
+        shared_data = dbevent.event_data
+        dbevent.event_data = None
+        if pending_event_data := self._pending_event_data.get(shared_data):
+            dbevent.event_data_rel = pending_event_data
+        elif (data_id := self._find_shared_data_in_db(shared_data)) is not None:
+            dbevent.data_id = data_id
+        else:
+            dbevent_data = EventData(
+                hash=EventData.hash_shared_data(shared_data),
+                shared_data=shared_data,
+            )
+            self._pending_event_data[shared_data] = dbevent_data
+            dbevent.event_data_rel = dbevent_data
+
+    def _event_data_id_for_row(self, shared_data: str) -> int:
+        """Return the data_id for shared data of an events row.
+
+        New event data is queued to be inserted before the events rows.
+        """
+        if pending_row := self._pending_event_data_rows.get(shared_data):
+            return pending_row["data_id"]
+        if (data_id := self._find_shared_data_in_db(shared_data)) is not None:
+            return data_id
+        data_id = self._next_data_id
+        self._next_data_id += 1
+        self._pending_event_data_rows[shared_data] = {
+            "data_id": data_id,
+            "hash": EventData.hash_shared_data(shared_data),
+            "shared_data": shared_data,
+        }
+        return data_id
 
     def _handle_database_error(self, err):
         """Handle a database error that may result in moving away the corrupt db."""
@@ -807,7 +1102,11 @@ class Recorder(threading.Thread):
 
     def _commit_event_session_or_retry(self):
         """Commit the event session if there is work to do."""
-        if not self.event_session.new and not self.event_session.dirty:
+        if (
+            not self._pending_event_rows
+            and not self.event_session.new
+            and not self.event_session.dirty
+        ):
             return
         tries = 1
         while tries <= self.db_max_retries:
@@ -829,6 +1128,16 @@ class Recorder(threading.Thread):
 
     def _commit_event_session(self):
         self._commits_without_expire += 1
+        start = time.monotonic()
+        if self._pending_event_rows:
+            rows = (
+                len(self._pending_event_rows)
+                + len(self._pending_state_rows)
+                + len(self._pending_state_attributes_rows)
+                + len(self._pending_event_data_rows)
+            )
+        else:
+            rows = len(self.event_session.new)
 
         if self._pending_expunge:
             self.event_session.flush()
@@ -838,7 +1147,20 @@ class Recorder(threading.Thread):
                 if dbstate in self.event_session:
                     self.event_session.expunge(dbstate)
             self._pending_expunge = []
-        self.event_session.commit()
+        if self._pending_event_rows:
+            self._commit_pending_rows()
+        else:
+            self.event_session.commit()
+
+        # The shared attributes now have an attributes_id
+        # in the database so they can be found in the cache
+        for shared_attrs, dbstate_attributes in self._pending_state_attributes.items():
+            self._state_attributes_ids[shared_attrs] = dbstate_attributes.attributes_id
+        self._pending_state_attributes = {}
+        for shared_data, dbevent_data in self._pending_event_data.items():
+            self._event_data_ids[shared_data] = dbevent_data.data_id
+        self._pending_event_data = {}
+        self.stats.record_commit(rows, start, time.monotonic())
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -847,6 +1169,41 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             self.event_session.expire_all()
 
+    def _commit_pending_rows(self):
+        """Insert the pending events and states rows with executemany and commit."""
+        try:
+            if self._pending_event_data_rows:
+                self.event_session.execute(
+                    EventData.__table__.insert(),
+                    list(self._pending_event_data_rows.values()),
+                )
+            self.event_session.execute(
+                Events.__table__.insert(), self._pending_event_rows
+            )
+            if self._pending_state_attributes_rows:
+                self.event_session.execute(
+                    StateAttributes.__table__.insert(),
+                    list(self._pending_state_attributes_rows.values()),
+                )
+            if self._pending_state_rows:
+                self.event_session.execute(
+                    States.__table__.insert(), self._pending_state_rows
+                )
+            self.event_session.commit()
+        except SQLAlchemyError:
+            # Rollback so a retry inserts the same rows again
+            # in a new transaction
+            self.event_session.rollback()
+            raise
+        self._pending_event_rows = []
+        self._pending_state_rows = []
+        for shared_attrs, row in self._pending_state_attributes_rows.items():
+            self._state_attributes_ids[shared_attrs] = row["attributes_id"]
+        self._pending_state_attributes_rows = {}
+        for shared_data, row in self._pending_event_data_rows.items():
+            self._event_data_ids[shared_data] = row["data_id"]
+        self._pending_event_data_rows = {}
+
     def _handle_sqlite_corruption(self):
         """Handle the sqlite3 database being corrupt."""
         self._close_event_session()
@@ -858,6 +1215,15 @@ class Recorder(threading.Thread):
     def _close_event_session(self):
         """Close the event session."""
         self._old_states = {}
+        self._old_state_ids = {}
+        self._pending_event_rows = []
+        self._pending_state_rows = []
+        self._pending_state_attributes = {}
+        self._pending_state_attributes_rows = {}
+        self._state_attributes_ids.clear()
+        self._pending_event_data = {}
+        self._pending_event_data_rows = {}
+        self._event_data_ids.clear()
 
         if not self.event_session:
             return
@@ -879,6 +1245,24 @@ class Recorder(threading.Thread):
         """Open the event session."""
         self.event_session = self.get_session()
         self.event_session.expire_on_commit = False
+        if self.bulk_writer:
+            self._seed_bulk_writer_ids()
+
+    def _seed_bulk_writer_ids(self):
+        """Continue the primary keys after the last rows in the database."""
+        self._next_event_id = (
+            self.event_session.query(func.max(Events.event_id)).scalar() or 0
+        ) + 1
+        self._next_state_id = (
+            self.event_session.query(func.max(States.state_id)).scalar() or 0
+        ) + 1
+        self._next_attributes_id = (
+            self.event_session.query(func.max(StateAttributes.attributes_id)).scalar()
+            or 0
+        ) + 1
+        self._next_data_id = (
+            self.event_session.query(func.max(EventData.data_id)).scalar() or 0
+        ) + 1
 
     def _send_keep_alive(self):
         """Send a keep alive to keep the db connection open."""
@@ -887,9 +1271,25 @@ class Recorder(threading.Thread):
 
     @callback
     def event_listener(self, event):
-        """Listen for new events and put them in the process queue."""
+        """Listen for new events and put them in the process queue.
+
+        While the database falls behind the events are spilled to disk
+        instead, until the recorder has replayed all of them.
+        """
+        spill = self.spill
+        if spill is not None and (
+            spill.active or self.queue.qsize() >= SPILL_QUEUE_BACKLOG
+        ):
+            spill.async_add(event)
+            return
         self.queue.put(event)
 
+    async def async_block_till_done(self):
+        """Wait till all events queued so far are committed to the database."""
+        event = asyncio.Event()
+        self.queue.put(SynchronizeTask(event))
+        await event.wait()
+
     def block_till_done(self):
         """Block till all events processed.
 
@@ -934,6 +1334,13 @@ class Recorder(threading.Thread):
 
         self.engine = create_engine(self.db_url, **kwargs)
 
+        if self.bulk_writer and self.engine.dialect.name not in BULK_WRITER_DIALECTS:
+            _LOGGER.warning(
+                "The bulk writer is not supported with %s; Using the default writer",
+                self.engine.dialect.name,
+            )
+            self.bulk_writer = False
+
         sqlalchemy_event.listen(self.engine, "connect", setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
@@ -982,5 +1389,8 @@ class Recorder(threading.Thread):
     def _shutdown(self):
         """Save end time for current run."""
         self.hass.add_job(self._async_stop_queue_watcher_and_event_listener)
+        if self.spill is not None:
+            # Keep the events that were not replayed for the next run
+            self.spill.close()
         self._end_session()
         self._close_connection()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Iterator
 from itertools import groupby
 import logging
 import time
@@ -11,7 +12,9 @@ from sqlalchemy.ext import baked
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder.models import (
+    StateAttributes,
     States,
+    process_timestamp_to_epoch,
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import execute, session_scope
@@ -35,6 +38,13 @@ SIGNIFICANT_DOMAINS = (
     "water_heater",
 )
 IGNORE_DOMAINS = ("zone", "scene")
+
+# Collations ordering entity ids by code point, like Python compares them
+ENTITY_ID_BINARY_COLLATIONS = {
+    "mysql": "utf8mb4_bin",
+    "postgresql": "C",
+    "sqlite": "BINARY",
+}
 NEED_ATTRIBUTE_DOMAINS = {
     "climate",
     "humidifier",
@@ -48,18 +58,43 @@ QUERY_STATES = [
     States.entity_id,
     States.state,
     States.attributes,
+    StateAttributes.shared_attrs,
     States.last_changed,
     States.last_updated,
 ]
 
+# The columns a columnar response needs, leaving out
+# the attributes avoids the join and the json decoding
+QUERY_STATES_COLUMNAR = [
+    States.entity_id,
+    States.state,
+    States.last_changed,
+]
+
 HISTORY_BAKERY = "recorder_history_bakery"
 
+# The number of rows to fetch from the database at
+# a time when streaming the significant states
+STREAM_YIELD_PER = 1000
+
 
 def async_setup(hass):
     """Set up the history hooks."""
     hass.data[HISTORY_BAKERY] = baked.bakery()
 
 
+def _query_states_with_attributes(session):
+    """Query the states columns with the shared attributes joined in."""
+    return session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
+
+def _query_states_columnar(session):
+    """Query only the states columns of a columnar response."""
+    return session.query(*QUERY_STATES_COLUMNAR)
+
+
 def get_significant_states(hass, *args, **kwargs):
     """Wrap _get_significant_states with a sql session."""
     with session_scope(hass=hass) as session:
@@ -86,8 +121,135 @@ def _get_significant_states(
     """
     timer_start = time.perf_counter()
 
+    states = execute(
+        _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            significant_changes_only,
+        )
+    )
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return _sorted_states_to_dict(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
+    )
+
+
+def stream_significant_states(
+    hass,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    minimal_response=False,
+    after_entity_id=None,
+    columnar=False,
+) -> Iterator[tuple[str, list | dict[str, list]]]:
+    """Yield the significant states during a period one entity at a time.
+
+    Unlike get_significant_states, the rows are fetched in batches
+    so only the states of the entity being yielded are held in memory.
+    Entities are yielded in entity_id order, starting after
+    after_entity_id when it is given so an interrupted stream can
+    be resumed.
+
+    With columnar each entity is yielded as parallel lists of states
+    and last_changed epoch timestamps, see _entity_states_to_columns.
+    """
+    # The rows are merged with the entities only having a state at the start
+    # time and resumed after an entity id, so they must be ordered like Python
+    # compares strings, whatever the collation of the database is
+    collation = ENTITY_ID_BINARY_COLLATIONS.get(session.bind.dialect.name)
+    start_time_states = {}
+    if include_start_time_state:
+        run = recorder.run_information_from_instance(hass, start_time)
+        for state in _get_states_with_session(
+            hass, session, start_time, entity_ids, run=run, filters=filters
+        ):
+            if after_entity_id is not None and state.entity_id <= after_entity_id:
+                continue
+            state.last_changed = start_time
+            state.last_updated = start_time
+            start_time_states[state.entity_id] = state
+    pending_start_time_ids = sorted(start_time_states, reverse=True)
+
+    def start_time_only(ent_id):
+        start_time_state = start_time_states.pop(ent_id)
+        if columnar:
+            return _entity_states_to_columns(start_time_state, ())
+        return [start_time_state]
+
+    query = _significant_states_query(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        filters,
+        significant_changes_only,
+        after_entity_id,
+        columnar,
+        collation,
+    ).with_post_criteria(lambda q: q.yield_per(STREAM_YIELD_PER))
+
+    for ent_id, group in groupby(query, lambda state: state.entity_id):
+        # Entities that only have a state at the start
+        # time go before the entities with changes after them
+        while pending_start_time_ids and pending_start_time_ids[-1] < ent_id:
+            start_ent_id = pending_start_time_ids.pop()
+            yield start_ent_id, start_time_only(start_ent_id)
+
+        start_time_state = None
+        if ent_id in start_time_states:
+            pending_start_time_ids.remove(ent_id)
+            start_time_state = start_time_states.pop(ent_id)
+        if columnar:
+            yield ent_id, _entity_states_to_columns(start_time_state, group)
+            continue
+        ent_results = [start_time_state] if start_time_state is not None else []
+        _append_entity_states(ent_results, ent_id, group, minimal_response)
+        yield ent_id, ent_results
+
+    while pending_start_time_ids:
+        start_ent_id = pending_start_time_ids.pop()
+        yield start_ent_id, start_time_only(start_ent_id)
+
+
+def _significant_states_query(
+    hass,
+    session,
+    start_time,
+    end_time,
+    entity_ids,
+    filters,
+    significant_changes_only,
+    after_entity_id=None,
+    columnar=False,
+    collation=None,
+):
+    """Return the query for the significant states during a period.
+
+    The states are ordered by entity id in the collation if one is given.
+    """
     baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+        _query_states_columnar if columnar else _query_states_with_attributes
     )
 
     if significant_changes_only:
@@ -113,36 +275,39 @@ def _get_significant_states(
     if end_time is not None:
         baked_query += lambda q: q.filter(States.last_updated < bindparam("end_time"))
 
-    baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
-
-    states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
+    # The collation is part of the cache key of the baked query
+    if after_entity_id is not None:
+        baked_query.add_criteria(
+            lambda q: q.filter(
+                _collated_entity_id(collation) > bindparam("after_entity_id")
+            ),
+            collation,
         )
-    )
 
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
+    baked_query.add_criteria(
+        lambda q: q.order_by(_collated_entity_id(collation), States.last_updated),
+        collation,
+    )
 
-    return _sorted_states_to_dict(
-        hass,
-        session,
-        states,
-        start_time,
-        entity_ids,
-        filters,
-        include_start_time_state,
-        minimal_response,
+    return baked_query(session).params(
+        start_time=start_time,
+        end_time=end_time,
+        entity_ids=entity_ids,
+        after_entity_id=after_entity_id,
     )
 
 
+def _collated_entity_id(collation):
+    """Return the entity id column in the collation if one is given."""
+    if collation is None:
+        return States.entity_id
+    return States.entity_id.collate(collation)
+
+
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states_with_attributes)
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -155,7 +320,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -176,13 +343,13 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     start_time = dt_util.utcnow()
 
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states_with_attributes)
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -243,7 +410,7 @@ def _get_states_with_session(
     # We have more than one entity to look at (most commonly we want
     # all entities,) so we need to do a search on all states since the
     # last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = _query_states_with_attributes(session)
 
     most_recent_states_by_date = session.query(
         States.entity_id.label("max_entity_id"),
@@ -291,9 +458,7 @@ def _get_states_with_session(
 def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](_query_states_with_attributes)
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
@@ -350,51 +515,83 @@ def _sorted_states_to_dict(
         elapsed = time.perf_counter() - timer_start
         _LOGGER.debug("getting %d first datapoints took %fs", len(result), elapsed)
 
+    # Append all changes to it
+    for ent_id, group in groupby(states, lambda state: state.entity_id):
+        _append_entity_states(result[ent_id], ent_id, group, minimal_response)
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _entity_states_to_columns(start_time_state, group):
+    """Convert the states rows of a single entity to parallel lists.
+
+    Attributes are not included so rows that only
+    changed the attributes are left out.
+    """
+    states = []
+    last_changed = []
+    prev_state = None
+    if start_time_state is not None:
+        prev_state = start_time_state.state
+        states.append(prev_state)
+        last_changed.append(process_timestamp_to_epoch(start_time_state.last_changed))
+
     # Called in a tight loop so cache the function
     # here
-    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
+    _process_timestamp_to_epoch = process_timestamp_to_epoch
 
-    # Append all changes to it
-    for ent_id, group in groupby(states, lambda state: state.entity_id):
-        domain = split_entity_id(ent_id)[0]
-        ent_results = result[ent_id]
-        if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
-            ent_results.extend(LazyState(db_state) for db_state in group)
-
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            ent_results.append(LazyState(next(group)))
-
-        prev_state = ent_results[-1]
-        initial_state_count = len(ent_results)
-
-        for db_state in group:
-            # With minimal response we do not care about attribute
-            # changes so we can filter out duplicate states
-            if db_state.state == prev_state.state:
-                continue
+    for db_state in group:
+        if db_state.state == prev_state:
+            continue
+        prev_state = db_state.state
+        states.append(prev_state)
+        last_changed.append(_process_timestamp_to_epoch(db_state.last_changed))
 
-            ent_results.append(
-                {
-                    STATE_KEY: db_state.state,
-                    LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
-                        db_state.last_changed
-                    ),
-                }
-            )
-            prev_state = db_state
+    return {STATE_KEY: states, LAST_CHANGED_KEY: last_changed}
 
-        if prev_state and len(ent_results) != initial_state_count:
-            # There was at least one state change
-            # replace the last minimal state with
-            # a full state
-            ent_results[-1] = LazyState(prev_state)
 
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+def _append_entity_states(ent_results, ent_id, group, minimal_response):
+    """Append the states rows of a single entity to its results."""
+    domain = split_entity_id(ent_id)[0]
+    if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
+        ent_results.extend(LazyState(db_state) for db_state in group)
+
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if not ent_results:
+        ent_results.append(LazyState(next(group)))
+
+    prev_state = ent_results[-1]
+    initial_state_count = len(ent_results)
+
+    # Called in a tight loop so cache the function
+    # here
+    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
+
+    for db_state in group:
+        # With minimal response we do not care about attribute
+        # changes so we can filter out duplicate states
+        if db_state.state == prev_state.state:
+            continue
+
+        ent_results.append(
+            {
+                STATE_KEY: db_state.state,
+                LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
+                    db_state.last_changed
+                ),
+            }
+        )
+        prev_state = db_state
+
+    if prev_state and len(ent_results) != initial_state_count:
+        # There was at least one state change
+        # replace the last minimal state with
+        # a full state
+        ent_results[-1] = LazyState(prev_state)
 
 
 def get_state(hass, utc_point_in_time, entity_id, run=None):
@@ -347,7 +347,7 @@ def _drop_foreign_key_constraints(connection, engine, table, columns):
             )
 
 
-def _apply_update(engine, session, new_version, old_version):
+def _apply_update(engine, session, new_version, old_version):  # noqa: C901
     """Perform operations to bring schema up to date."""
     connection = session.connection()
     if new_version == 1:
@@ -475,6 +475,16 @@ def _apply_update(engine, session, new_version, old_version):
 
         StatisticsMeta.__table__.create(engine)
         Statistics.__table__.create(engine)
+    elif new_version == 19:
+        # The state_attributes table is created by create_all
+        # on startup, we only need to link the states to it
+        _add_columns(connection, "states", ["attributes_id INTEGER"])
+        _create_index(connection, "states", "ix_states_attributes_id")
+    elif new_version == 20:
+        # The event_data table is created by create_all
+        # on startup, we only need to link the events to it
+        _add_columns(connection, "events", ["data_id INTEGER"])
+        _create_index(connection, "events", "ix_events_data_id")
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
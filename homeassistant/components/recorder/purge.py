@@ -9,7 +9,7 @@ from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import distinct
 
 from .const import MAX_ROWS_TO_PURGE
-from .models import Events, RecorderRuns, States
+from .models import EventData, Events, RecorderRuns, StateAttributes, States
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
 
@@ -37,9 +37,9 @@ def purge_old_data(
         event_ids = _select_event_ids_to_purge(session, purge_before)
         state_ids = _select_state_ids_to_purge(session, purge_before, event_ids)
         if state_ids:
-            _purge_state_ids(session, state_ids)
+            _purge_state_ids(instance, session, state_ids)
         if event_ids:
-            _purge_event_ids(session, event_ids)
+            _purge_event_ids(instance, session, event_ids)
             # If states or events purging isn't processing the purge_before yet,
             # return false, as we are not done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
@@ -81,7 +81,9 @@ def _select_state_ids_to_purge(
     return [state.state_id for state in states]
 
 
-def _purge_state_ids(session: Session, state_ids: list[int]) -> None:
+def _purge_state_ids(
+    instance: Recorder, session: Session, state_ids: list[int]
+) -> None:
     """Disconnect states and delete by state id."""
 
     # Update old_state_id to NULL before deleting to ensure
@@ -95,6 +97,14 @@ def _purge_state_ids(session: Session, state_ids: list[int]) -> None:
     )
     _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
 
+    attributes_ids = {
+        attributes_id
+        for (attributes_id,) in session.query(distinct(States.attributes_id))
+        .filter(States.state_id.in_(state_ids))
+        .all()
+        if attributes_id is not None
+    }
+
     deleted_rows = (
         session.query(States)
         .filter(States.state_id.in_(state_ids))
@@ -102,9 +112,70 @@ def _purge_state_ids(session: Session, state_ids: list[int]) -> None:
     )
     _LOGGER.debug("Deleted %s states", deleted_rows)
 
+    # Evict any entries in the old_state_ids cache referring to a purged state
+    _evict_purged_states_from_old_states_cache(instance, state_ids)
+
+    if attributes_ids:
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
+
+
+def _purge_unused_attributes_ids(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> None:
+    """Delete the shared attributes no longer referenced by any state."""
+    still_used_ids = {
+        attributes_id
+        for (attributes_id,) in session.query(distinct(States.attributes_id))
+        .filter(States.attributes_id.in_(attributes_ids))
+        .all()
+    }
+    unused_attributes_ids = attributes_ids - still_used_ids
+    if not unused_attributes_ids:
+        return
+
+    deleted_rows = (
+        session.query(StateAttributes)
+        .filter(StateAttributes.attributes_id.in_(unused_attributes_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s attribute states", deleted_rows)
+
+    # Evict any entries in the state_attributes_ids cache referring to a purged row
+    state_attributes_ids = (
+        instance._state_attributes_ids  # pylint: disable=protected-access
+    )
+    for shared_attrs, attributes_id in state_attributes_ids.items():
+        if attributes_id in unused_attributes_ids:
+            state_attributes_ids.pop(shared_attrs)
+
+
+def _evict_purged_states_from_old_states_cache(
+    instance: Recorder, purged_state_ids: list[int]
+) -> None:
+    """Evict purged states from the old states cache."""
+    # Make a map from old_state_id to entity_id
+    old_state_ids = instance._old_state_ids  # pylint: disable=protected-access
+    old_state_reversed = {
+        old_state_id: entity_id for entity_id, old_state_id in old_state_ids.items()
+    }
+
+    # Evict any purged state from the old states cache
+    for purged_state_id in set(purged_state_ids).intersection(old_state_reversed):
+        old_state_ids.pop(old_state_reversed[purged_state_id], None)
+
 
-def _purge_event_ids(session: Session, event_ids: list[int]) -> None:
+def _purge_event_ids(
+    instance: Recorder, session: Session, event_ids: list[int]
+) -> None:
     """Delete by event id."""
+    data_ids = {
+        data_id
+        for (data_id,) in session.query(distinct(Events.data_id))
+        .filter(Events.event_id.in_(event_ids))
+        .all()
+        if data_id is not None
+    }
+
     deleted_rows = (
         session.query(Events)
         .filter(Events.event_id.in_(event_ids))
@@ -112,6 +183,37 @@ def _purge_event_ids(session: Session, event_ids: list[int]) -> None:
     )
     _LOGGER.debug("Deleted %s events", deleted_rows)
 
+    if data_ids:
+        _purge_unused_data_ids(instance, session, data_ids)
+
+
+def _purge_unused_data_ids(
+    instance: Recorder, session: Session, data_ids: set[int]
+) -> None:
+    """Delete the shared event data no longer referenced by any event."""
+    still_used_ids = {
+        data_id
+        for (data_id,) in session.query(distinct(Events.data_id))
+        .filter(Events.data_id.in_(data_ids))
+        .all()
+    }
+    unused_data_ids = data_ids - still_used_ids
+    if not unused_data_ids:
+        return
+
+    deleted_rows = (
+        session.query(EventData)
+        .filter(EventData.data_id.in_(unused_data_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s data events", deleted_rows)
+
+    # Evict any entries in the event_data_ids cache referring to a purged row
+    event_data_ids = instance._event_data_ids  # pylint: disable=protected-access
+    for shared_data, data_id in event_data_ids.items():
+        if data_id in unused_data_ids:
+            event_data_ids.pop(shared_data)
+
 
 def _purge_old_recorder_runs(
     instance: Recorder, session: Session, purge_before: datetime
@@ -138,7 +240,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
         if not instance.entity_filter(entity_id)
     ]
     if len(excluded_entity_ids) > 0:
-        _purge_filtered_states(session, excluded_entity_ids)
+        _purge_filtered_states(instance, session, excluded_entity_ids)
         return False
 
     # Check if excluded event_types are in database
@@ -148,13 +250,15 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
         if event_type in instance.exclude_t
     ]
     if len(excluded_event_types) > 0:
-        _purge_filtered_events(session, excluded_event_types)
+        _purge_filtered_events(instance, session, excluded_event_types)
         return False
 
     return True
 
 
-def _purge_filtered_states(session: Session, excluded_entity_ids: list[str]) -> None:
+def _purge_filtered_states(
+    instance: Recorder, session: Session, excluded_entity_ids: list[str]
+) -> None:
     """Remove filtered states and linked events."""
     state_ids: list[int]
     event_ids: list[int | None]
@@ -170,11 +274,13 @@ def _purge_filtered_states(session: Session, excluded_entity_ids: list[str]) ->
     _LOGGER.debug(
         "Selected %s state_ids to remove that should be filtered", len(state_ids)
     )
-    _purge_state_ids(session, state_ids)
-    _purge_event_ids(session, event_ids)  # type: ignore  # type of event_ids already narrowed to 'list[int]'
+    _purge_state_ids(instance, session, state_ids)
+    _purge_event_ids(instance, session, event_ids)  # type: ignore  # type of event_ids already narrowed to 'list[int]'
 
 
-def _purge_filtered_events(session: Session, excluded_event_types: list[str]) -> None:
+def _purge_filtered_events(
+    instance: Recorder, session: Session, excluded_event_types: list[str]
+) -> None:
     """Remove filtered events and linked states."""
     events: list[Events] = (
         session.query(Events.event_id)
@@ -190,8 +296,8 @@ def _purge_filtered_events(session: Session, excluded_event_types: list[str]) ->
         session.query(States.state_id).filter(States.event_id.in_(event_ids)).all()
     )
     state_ids: list[int] = [state.state_id for state in states]
-    _purge_state_ids(session, state_ids)
-    _purge_event_ids(session, event_ids)
+    _purge_state_ids(instance, session, state_ids)
+    _purge_event_ids(instance, session, event_ids)
 
 
 @retryable_database_job("purge")
@@ -206,7 +312,7 @@ def purge_entity_data(instance: Recorder, entity_filter: Callable[[str], bool])
         _LOGGER.debug("Purging entity data for %s", selected_entity_ids)
         if len(selected_entity_ids) > 0:
             # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
-            _purge_filtered_states(session, selected_entity_ids)
+            _purge_filtered_states(instance, session, selected_entity_ids)
             _LOGGER.debug("Purging entity data hasn't fully completed yet")
             return False
 
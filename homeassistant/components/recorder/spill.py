@@ -0,0 +1,165 @@
+"""Spill recorder events to disk while the database falls behind."""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, HomeAssistant, State
+from homeassistant.helpers.json import JSONEncoder
+import homeassistant.util.dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EventSpill:
+    """An append-only file of events waiting to be recorded.
+
+    Events are added from the event loop and written to the file in the
+    executor. The recorder thread replays them in the order they were
+    added, reading the events not yet written from memory.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize the spill."""
+        self.hass = hass
+        self.path = path
+        self.active = False
+        self.spilled = 0
+        self.replayed = 0
+        self._buffer: list[str] = []
+        self._buffer_lock = threading.Lock()
+        self._file_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._read_offset = 0
+
+    @property
+    def pending(self) -> int:
+        """Return the number of events waiting to be replayed."""
+        return self.spilled - self.replayed
+
+    def load(self) -> None:
+        """Pick up the events left in the file by a previous run."""
+        with self._file_lock:
+            if not os.path.exists(self.path):
+                return
+            with open(self.path, encoding="utf8") as spill_file:
+                spilled = sum(1 for _ in spill_file)
+        if not spilled:
+            return
+        _LOGGER.info("Replaying %s events spilled by a previous run", spilled)
+        with self._buffer_lock:
+            self.spilled += spilled
+            self.active = True
+
+    def async_add(self, event: Event) -> None:
+        """Spill an event."""
+        try:
+            line = json.dumps(event.as_dict(), cls=JSONEncoder, allow_nan=False)
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+            return
+
+        with self._buffer_lock:
+            self._buffer.append(line)
+            self.spilled += 1
+            self.active = True
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+
+        self.hass.async_add_executor_job(self.flush)
+
+    def flush(self) -> None:
+        """Append the events added since the last flush to the file."""
+        with self._file_lock:
+            with self._buffer_lock:
+                lines = self._buffer
+                self._buffer = []
+                self._flush_scheduled = False
+            if not lines:
+                return
+            with open(self.path, "a", encoding="utf8") as spill_file:
+                spill_file.write("\n".join(lines))
+                spill_file.write("\n")
+
+    def close(self) -> None:
+        """Leave only the events that were not replayed in the file."""
+        with self._file_lock:
+            with self._buffer_lock:
+                lines = self._buffer
+                self._buffer = []
+                self._flush_scheduled = False
+            remaining = ""
+            if os.path.exists(self.path):
+                with open(self.path, encoding="utf8") as spill_file:
+                    spill_file.seek(self._read_offset)
+                    remaining = spill_file.read()
+                os.unlink(self.path)
+            self._read_offset = 0
+            if not remaining and not lines:
+                return
+            with open(self.path, "w", encoding="utf8") as spill_file:
+                spill_file.write(remaining)
+                if lines:
+                    spill_file.write("\n".join(lines))
+                    spill_file.write("\n")
+
+    def replay(self, max_events: int) -> list[Event]:
+        """Take the oldest spilled events.
+
+        When all events are taken the file is emptied and the spill
+        is no longer active.
+        """
+        with self._file_lock:
+            lines = []
+            if os.path.exists(self.path):
+                with open(self.path, encoding="utf8") as spill_file:
+                    spill_file.seek(self._read_offset)
+                    while len(lines) < max_events and (line := spill_file.readline()):
+                        lines.append(line)
+                    self._read_offset = spill_file.tell()
+
+            with self._buffer_lock:
+                if len(lines) < max_events:
+                    take = max_events - len(lines)
+                    lines.extend(self._buffer[:take])
+                    del self._buffer[:take]
+                if not lines or (len(lines) < max_events and not self._buffer):
+                    self._read_offset = 0
+                    if os.path.exists(self.path):
+                        os.unlink(self.path)
+                    self.active = False
+                self.replayed += len(lines)
+
+        events = []
+        for line in lines:
+            try:
+                events.append(_event_from_json(line))
+            except (ValueError, KeyError, TypeError) as err:
+                _LOGGER.warning("Dropping spilled event that cannot be read: %s", err)
+        return events
+
+
+def _event_from_json(line: str) -> Event:
+    """Rebuild an event from its spilled JSON."""
+    event_dict = json.loads(line)
+    event_type = event_dict["event_type"]
+    data = event_dict["data"]
+    if event_type == EVENT_STATE_CHANGED:
+        data["old_state"] = State.from_dict(data.get("old_state"))
+        data["new_state"] = State.from_dict(data.get("new_state"))
+    context = event_dict["context"]
+    return Event(
+        event_type,
+        data,
+        EventOrigin(event_dict["origin"]),
+        dt_util.parse_datetime(event_dict["time_fired"]),
+        Context(
+            id=context["id"],
+            parent_id=context["parent_id"],
+            user_id=context["user_id"],
+        ),
+    )
@@ -0,0 +1,44 @@
+"""The Recorder websocket API."""
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_INSTANCE
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Set up the recorder websocket API."""
+    websocket_api.async_register_command(hass, ws_info)
+
+
+@websocket_api.websocket_command({vol.Required("type"): "recorder/info"})
+@callback
+def ws_info(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the queue depth and write statistics of the recorder."""
+    # pylint: disable=import-outside-toplevel
+    from . import MAX_QUEUE_BACKLOG
+
+    instance = hass.data[DATA_INSTANCE]
+    stats = instance.stats
+    spill = instance.spill
+    connection.send_result(
+        msg["id"],
+        {
+            "backlog": instance.queue.qsize(),
+            "max_backlog": MAX_QUEUE_BACKLOG,
+            "spill_backlog": spill.pending if spill is not None else None,
+            "migration_in_progress": instance.migration_in_progress,
+            "recording": instance.enabled,
+            "thread_running": instance.is_alive(),
+            "commits": stats.commits,
+            "rows_per_second": stats.rows_per_second,
+            "last_commit_latency": stats.last_commit_latency,
+            "max_commit_latency": stats.max_commit_latency,
+        },
+    )
@@ -5,7 +5,11 @@ from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any
 
-from homeassistant.components.trace import ActionTrace, async_store_trace
+from homeassistant.components.trace import (
+    ActionTrace,
+    async_finish_trace,
+    async_store_trace,
+)
 from homeassistant.components.trace.const import CONF_STORED_TRACES
 from homeassistant.core import Context, HomeAssistant
 
@@ -46,4 +50,4 @@ def trace_script(
         raise ex
     finally:
         if item_id:
-            trace.finished()
+            async_finish_trace(hass, trace)
@@ -4,12 +4,14 @@ from __future__ import annotations
 from collections import deque
 import datetime as dt
 from itertools import count
+import json
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.core import Context
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_get,
@@ -20,8 +22,14 @@ from homeassistant.helpers.trace import (
 import homeassistant.util.dt as dt_util
 
 from . import websocket_api
-from .const import CONF_STORED_TRACES, DATA_TRACE, DEFAULT_STORED_TRACES
-from .utils import LimitedSizeDict
+from .const import (
+    CONF_STORED_TRACES,
+    DATA_TRACE,
+    DATA_TRACE_BUDGET,
+    DEFAULT_STORED_TRACES,
+    MAX_STORED_TRACE_STEPS,
+)
+from .utils import LimitedSizeDict, TraceStepBudget
 
 DOMAIN = "trace"
 
@@ -33,6 +41,9 @@ TRACE_CONFIG_SCHEMA = {
 async def async_setup(hass, config):
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
+    hass.data[DATA_TRACE_BUDGET] = TraceStepBudget(
+        hass.data[DATA_TRACE], MAX_STORED_TRACE_STEPS
+    )
     websocket_api.async_setup(hass)
     return True
 
@@ -43,12 +54,21 @@ def async_store_trace(hass, trace, stored_traces):
     if key[1]:
         traces = hass.data[DATA_TRACE]
         if key not in traces:
-            traces[key] = LimitedSizeDict(size_limit=stored_traces)
+            traces[key] = LimitedSizeDict(
+                size_limit=stored_traces,
+                evict_callback=hass.data[DATA_TRACE_BUDGET].remove,
+            )
         else:
             traces[key].size_limit = stored_traces
         traces[key][trace.run_id] = trace
 
 
+def async_finish_trace(hass, trace):
+    """Finish a trace and keep the stored traces within the step budget."""
+    trace.finished()
+    hass.data[DATA_TRACE_BUDGET].add(trace)
+
+
 class ActionTrace:
     """Base container for a script or automation trace."""
 
@@ -73,6 +93,7 @@ class ActionTrace:
         self._timestamp_finish: dt.datetime | None = None
         self._timestamp_start: dt.datetime = dt_util.utcnow()
         self.key: tuple[str, str] = key
+        self.steps = 0
         if trace_id_get():
             trace_set_child_id(self.key, self.run_id)
         trace_id_set((key, self.run_id))
@@ -90,6 +111,13 @@ class ActionTrace:
         self._timestamp_finish = dt_util.utcnow()
         self._state = "stopped"
         self._script_execution = script_execution_get()
+        self.steps = max(
+            1, sum(len(trace_list) for trace_list in (self._trace or {}).values())
+        )
+
+    def as_json(self) -> str:
+        """Return this ActionTrace serialized to JSON."""
+        return json.dumps(self.as_dict(), cls=ExtendedJSONEncoder, allow_nan=False)
 
     def as_dict(self) -> dict[str, Any]:
         """Return dictionary version of this ActionTrace."""
@@ -2,4 +2,9 @@
 
 CONF_STORED_TRACES = "stored_traces"
 DATA_TRACE = "trace"
+DATA_TRACE_BUDGET = "trace_budget"
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+# Steps of finished traces stored over all scripts and automations, a trace
+# without steps counts as one. This caps the number of steps, not the memory
+# they use.
+MAX_STORED_TRACE_STEPS = 16 * 1024
@@ -8,6 +8,7 @@ class LimitedSizeDict(OrderedDict):
     def __init__(self, *args, **kwds):
         """Initialize OrderedDict limited in size."""
         self.size_limit = kwds.pop("size_limit", None)
+        self.evict_callback = kwds.pop("evict_callback", None)
         OrderedDict.__init__(self, *args, **kwds)
         self._check_size_limit()
 
@@ -20,4 +21,39 @@ class LimitedSizeDict(OrderedDict):
         """Check dict size and evict items in FIFO order if needed."""
         if self.size_limit is not None:
             while len(self) > self.size_limit:
-                self.popitem(last=False)
+                key, value = self.popitem(last=False)
+                if self.evict_callback is not None:
+                    self.evict_callback(key, value)
+
+
+class TraceStepBudget:
+    """Evict the oldest finished traces when they hold too many steps."""
+
+    def __init__(self, traces, max_steps):
+        """Initialize the budget for the traces stored per key."""
+        self._traces = traces
+        self._steps = OrderedDict()
+        self.max_steps = max_steps
+        self.steps = 0
+
+    def add(self, trace):
+        """Account for a finished trace and evict the oldest ones over budget.
+
+        The newest trace is kept even if it has too many steps on its own.
+        """
+        if self._traces.get(trace.key, {}).get(trace.run_id) is not trace:
+            return
+        self._steps[trace] = trace.steps
+        self.steps += trace.steps
+        while self.steps > self.max_steps and len(self._steps) > 1:
+            old_trace, old_steps = self._steps.popitem(last=False)
+            self.steps -= old_steps
+            stored = self._traces.get(old_trace.key)
+            if stored is not None and stored.get(old_trace.run_id) is old_trace:
+                del stored[old_trace.run_id]
+
+    def remove(self, run_id, trace):
+        """Stop accounting for a trace evicted from the traces of its key."""
+        steps = self._steps.pop(trace, None)
+        if steps is not None:
+            self.steps -= steps
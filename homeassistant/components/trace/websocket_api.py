@@ -1,6 +1,4 @@
 """Websocket API for automation."""
-import json
-
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
@@ -11,7 +9,6 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
-from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.script import (
     SCRIPT_BREAKPOINT_HIT,
     SCRIPT_DEBUG_CONTINUE_ALL,
@@ -69,10 +66,8 @@ def websocket_trace_get(hass, connection, msg):
         )
         return
 
-    message = websocket_api.messages.result_message(msg["id"], trace)
-
     connection.send_message(
-        json.dumps(message, cls=ExtendedJSONEncoder, allow_nan=False)
+        websocket_api.messages.result_message_json(msg["id"], trace.as_json())
     )
 
 
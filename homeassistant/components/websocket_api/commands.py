@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
+from functools import partial
 import json
 from typing import Any
 
@@ -12,7 +13,7 @@ from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_READ
 from homeassistant.bootstrap import SIGNAL_BOOTSTRAP_INTEGRATONS
 from homeassistant.components.websocket_api.const import ERR_NOT_FOUND
 from homeassistant.const import EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_ALL
-from homeassistant.core import Context, Event, HomeAssistant, callback
+from homeassistant.core import Context, Event, HomeAssistant, State, callback
 from homeassistant.exceptions import (
     HomeAssistantError,
     ServiceNotFound,
@@ -24,15 +25,21 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
+    async_track_state_change_event,
     async_track_template_result,
 )
-from homeassistant.helpers.json import ExtendedJSONEncoder
+from homeassistant.helpers.json import ExtendedJSONEncoder, JSONEncoder
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import IntegrationNotFound, async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
+from homeassistant.util.json import (
+    find_paths_unserializable_data,
+    format_unserializable_data,
+)
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
+from .http import WebSocketStats
 
 
 @callback
@@ -53,10 +60,13 @@ def async_register_commands(
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
+    async_reg(hass, handle_supported_features)
     async_reg(hass, handle_test_condition)
     async_reg(hass, handle_unsubscribe_events)
+    async_reg(hass, handle_websocket_info)
 
 
 def pong_message(iden: int) -> dict[str, Any]:
@@ -84,33 +94,82 @@ def handle_subscribe_events(
     if event_type not in SUBSCRIBE_ALLOWLIST and not connection.user.is_admin:
         raise Unauthorized
 
-    if event_type == EVENT_STATE_CHANGED:
+    connection.subscriptions[msg["id"]] = _async_subscribe_events(
+        hass, event_type, connection, msg["id"]
+    )
 
-        @callback
-        def forward_events(event: Event) -> None:
-            """Forward state changed events to websocket."""
-            if not connection.user.permissions.check_entity(
-                event.data["entity_id"], POLICY_READ
-            ):
-                return
+    connection.send_message(messages.result_message(msg["id"]))
 
-            connection.send_message(messages.cached_event_message(msg["id"], event))
 
-    else:
+@callback
+def _async_subscribe_events(
+    hass: HomeAssistant, event_type: str, connection: ActiveConnection, iden: int
+) -> Callable[[], None]:
+    """Add a connection to the subscribers of an event type.
+
+    All connections subscribed to the same event type share a single bus
+    listener, so each event is dispatched and serialized once.
+    """
+    listeners: dict[
+        str, tuple[dict[object, tuple[ActiveConnection, int]], Callable[[], None]]
+    ] = hass.data.setdefault(const.DATA_EVENT_SUBSCRIBERS, {})
+
+    if (listener := listeners.get(event_type)) is None:
+        subscribers: dict[object, tuple[ActiveConnection, int]] = {}
+        forward = (
+            _async_forward_state_changed_events
+            if event_type == EVENT_STATE_CHANGED
+            else _async_forward_events
+        )
+        listener = listeners[event_type] = (
+            subscribers,
+            hass.bus.async_listen(event_type, partial(forward, subscribers)),
+        )
+    subscribers = listener[0]
 
-        @callback
-        def forward_events(event: Event) -> None:
-            """Forward events to websocket."""
-            if event.event_type == EVENT_TIME_CHANGED:
-                return
+    token = object()
+    subscribers[token] = (connection, iden)
 
-            connection.send_message(messages.cached_event_message(msg["id"], event))
+    @callback
+    def unsubscribe() -> None:
+        """Remove the connection and the listener once nobody is left."""
+        subscribers.pop(token, None)
+        if subscribers or listeners.get(event_type) is not listener:
+            return
+        del listeners[event_type]
+        listener[1]()
 
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events
-    )
+    return unsubscribe
 
-    connection.send_message(messages.result_message(msg["id"]))
+
+@callback
+def _async_forward_state_changed_events(
+    subscribers: dict[object, tuple[ActiveConnection, int]], event: Event
+) -> None:
+    """Forward state changed events to the connections allowed to read them."""
+    entity_id = event.data["entity_id"]
+    readable: dict[str, bool] = {}
+
+    for connection, iden in list(subscribers.values()):
+        user = connection.user
+        if (allowed := readable.get(user.id)) is None:
+            allowed = readable[user.id] = user.permissions.check_entity(
+                entity_id, POLICY_READ
+            )
+        if allowed:
+            connection.send_message(messages.cached_event_message(iden, event))
+
+
+@callback
+def _async_forward_events(
+    subscribers: dict[object, tuple[ActiveConnection, int]], event: Event
+) -> None:
+    """Forward events to websocket."""
+    if event.event_type == EVENT_TIME_CHANGED:
+        return
+
+    for connection, iden in list(subscribers.values()):
+        connection.send_message(messages.cached_event_message(iden, event))
 
 
 @callback
@@ -136,6 +195,43 @@ def handle_subscribe_bootstrap_integrations(
     connection.send_message(messages.result_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "supported_features",
+        vol.Required("features"): {str: int},
+    }
+)
+def handle_supported_features(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle setting the features the client supports."""
+    connection.supported_features = msg["features"]
+    connection.send_result(msg["id"])
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "websocket_api/info"})
+def handle_websocket_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle getting the sizes of the messages sent to clients."""
+    stats: WebSocketStats = hass.data.setdefault(const.DATA_STATS, WebSocketStats())
+    connection.send_result(
+        msg["id"],
+        {
+            "connections": hass.data.get(const.DATA_CONNECTIONS, 0),
+            "deflate_connections": stats.deflate_connections,
+            "messages": stats.messages,
+            "message_bytes": stats.message_bytes,
+            "binary_message_bytes": stats.binary_message_bytes,
+            "binary_bytes": stats.binary_bytes,
+            "compression_ratio": stats.compression_ratio,
+        },
+    )
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -228,17 +324,117 @@ def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
+    states = _async_get_allowed_states(hass, connection)
+
+    # Reuse the JSON the states cached for earlier requests
+    try:
+        states_json = f'[{",".join(state.as_dict_json for state in states)}]'
+    except (ValueError, TypeError):
+        # The compiled encoder would send NaN as null, keep rejecting it
+        connection.logger.error(
+            "Unable to serialize to JSON. Bad data found at %s",
+            format_unserializable_data(
+                find_paths_unserializable_data(
+                    messages.result_message(msg["id"], states),
+                    dump=partial(json.dumps, cls=JSONEncoder, allow_nan=False),
+                )
+            ),
+        )
+        connection.send_message(
+            messages.error_message(
+                msg["id"], const.ERR_UNKNOWN_ERROR, "Invalid JSON in response"
+            )
+        )
+        return
+
+    connection.send_message(messages.result_message_json(msg["id"], states_json))
+
+
+@callback
+def _async_get_allowed_states(
+    hass: HomeAssistant, connection: ActiveConnection
+) -> list[State]:
+    """Return the states the user of the connection can read."""
     if connection.user.permissions.access_all_entities("read"):
-        states = hass.states.async_all()
+        return hass.states.async_all()
+    entity_perm = connection.user.permissions.check_entity
+    return [
+        state
+        for state in hass.states.async_all()
+        if entity_perm(state.entity_id, "read")
+    ]
+
+
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+def handle_subscribe_entities(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle subscribe entities command.
+
+    Sends a compressed snapshot of the states followed by only the changes
+    of every state changed event.
+    """
+    entity_ids = msg.get("entity_ids")
+    states = _async_get_allowed_states(hass, connection)
+    if entity_ids is not None:
+        wanted = set(entity_ids)
+        states = [state for state in states if state.entity_id in wanted]
+
+    snapshot = messages.event_message(
+        msg["id"],
+        {
+            messages.ENTITY_EVENT_ADD: {
+                state.entity_id: messages.compressed_state_dict_add(state)
+                for state in states
+            }
+        },
+    )
+    # Serialize before subscribing so the client gets an error instead of
+    # a subscription without its initial states
+    try:
+        snapshot_json = const.JSON_DUMP(snapshot)
+    except (ValueError, TypeError):
+        connection.logger.error(
+            "Unable to serialize to JSON. Bad data found at %s",
+            format_unserializable_data(
+                find_paths_unserializable_data(snapshot, dump=const.JSON_DUMP)
+            ),
+        )
+        connection.send_message(
+            messages.error_message(
+                msg["id"], const.ERR_UNKNOWN_ERROR, "Invalid JSON in response"
+            )
+        )
+        return
+
+    entity_perm = connection.user.permissions.check_entity
+
+    @callback
+    def forward_entity_changes(event: Event) -> None:
+        """Forward the changes of entity states to websocket."""
+        if not entity_perm(event.data["entity_id"], POLICY_READ):
+            return
+        connection.send_message(messages.cached_state_diff_message(msg["id"], event))
+
+    # Nothing is awaited between taking the snapshot and listening
+    # so no change can be missed
+    if entity_ids is None:
+        connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, forward_entity_changes
+        )
     else:
-        entity_perm = connection.user.permissions.check_entity
-        states = [
-            state
-            for state in hass.states.async_all()
-            if entity_perm(state.entity_id, "read")
-        ]
-
-    connection.send_message(messages.result_message(msg["id"], states))
+        connection.subscriptions[msg["id"]] = async_track_state_change_event(
+            hass, entity_ids, forward_entity_changes
+        )
+
+    connection.send_result(msg["id"])
+    connection.send_message(snapshot_json)
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Hashable
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
 import voluptuous as vol
 
@@ -27,14 +27,17 @@ class ActiveConnection:
         send_message: Callable[[str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        drain: Callable[[], Awaitable[bool]] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        self._drain = drain
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
+        self.supported_features: dict[str, float] = {}
         self.last_id = 0
 
     def context(self, msg: dict[str, Any]) -> Context:
@@ -53,6 +56,17 @@ class ActiveConnection:
         )
         self.send_message(content)
 
+    async def async_drain(self) -> bool:
+        """Wait until the messages sent so far are written to the client.
+
+        Lets producers of many messages throttle to the speed of the client
+        instead of running into the limit of pending messages. Returns False
+        if the connection is closed, so producers can stop.
+        """
+        if self._drain is None:
+            return True
+        return await self._drain()
+
     @callback
     def send_error(self, msg_id: int, code: str, message: str) -> None:
         """Send a error message."""
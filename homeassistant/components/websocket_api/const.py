@@ -4,11 +4,10 @@ from __future__ import annotations
 import asyncio
 from concurrent import futures
 from functools import partial
-import json
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Final
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import json_dumps
 
 if TYPE_CHECKING:
     from .connection import ActiveConnection
@@ -52,4 +51,14 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
-JSON_DUMP: Final = partial(json.dumps, cls=JSONEncoder, allow_nan=False)
+# Data used to store the subscribers shared by one bus listener per event type
+DATA_EVENT_SUBSCRIBERS: Final = f"{DOMAIN}.event_subscribers"
+
+# Data used to store the message size counters
+DATA_STATS: Final = f"{DOMAIN}.stats"
+
+# Features a client can enable with the supported_features command
+FEATURE_COALESCE_MESSAGES: Final = "coalesce_messages"
+FEATURE_BINARY_MESSAGES: Final = "binary_messages"
+
+JSON_DUMP: Final = partial(json_dumps, allow_nan=False)
@@ -4,9 +4,11 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from dataclasses import dataclass
 import datetime as dt
 import logging
 from typing import Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
 import async_timeout
@@ -17,9 +19,13 @@ from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 
 from .auth import AuthPhase, auth_required_message
+from .connection import ActiveConnection
 from .const import (
     CANCELLATION_ERRORS,
     DATA_CONNECTIONS,
+    DATA_STATS,
+    FEATURE_BINARY_MESSAGES,
+    FEATURE_COALESCE_MESSAGES,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -33,6 +39,24 @@ from .messages import message_to_json
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
 
 
+@dataclass
+class WebSocketStats:
+    """Counters of the messages sent to websocket clients."""
+
+    messages: int = 0
+    message_bytes: int = 0
+    binary_message_bytes: int = 0
+    binary_bytes: int = 0
+    deflate_connections: int = 0
+
+    @property
+    def compression_ratio(self) -> float | None:
+        """Return how much smaller the binary messages were sent."""
+        if not self.binary_bytes:
+            return None
+        return self.binary_message_bytes / self.binary_bytes
+
+
 class WebsocketAPIView(HomeAssistantView):
     """View to serve a websockets endpoint."""
 
@@ -66,6 +90,9 @@ class WebSocketHandler:
         self._writer_task: asyncio.Task | None = None
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub: Callable[[], None] | None = None
+        self._connection: ActiveConnection | None = None
+        self._compressor: Any = None
+        self._stats: WebSocketStats = hass.data.setdefault(DATA_STATS, WebSocketStats())
 
     async def _writer(self) -> None:
         """Write outgoing messages."""
@@ -77,14 +104,94 @@ class WebSocketHandler:
                 if message is None:
                     break
 
-                self._logger.debug("Sending %s", message)
-                await self.wsock.send_str(message)
+                if (
+                    self._to_write.empty()
+                    or self._connection is None
+                    or not self._connection.supported_features.get(
+                        FEATURE_COALESCE_MESSAGES
+                    )
+                ):
+                    self._logger.debug("Sending %s", message)
+                    await self._send(message)
+                    self._to_write.task_done()
+                    continue
+
+                # Send everything queued since the writer last ran as one
+                # JSON array frame
+                messages = [message]
+                closing = False
+                while not self._to_write.empty():
+                    message = self._to_write.get_nowait()
+                    if message is None:
+                        closing = True
+                        break
+                    messages.append(message)
+
+                coalesced_messages = "[" + ",".join(messages) + "]"
+                self._logger.debug("Sending %s", coalesced_messages)
+                await self._send(coalesced_messages)
+                for _ in messages:
+                    self._to_write.task_done()
+                if closing:
+                    break
 
         # Clean up the peaker checker when we shut down the writer
         if self._peak_checker_unsub is not None:
             self._peak_checker_unsub()
             self._peak_checker_unsub = None
 
+    async def _async_drain(self) -> bool:
+        """Wait until the queued messages are written or the writer stops.
+
+        Returns False if the writer stopped because the connection closed.
+        """
+        writer_task = self._writer_task
+        if writer_task is None or writer_task.done():
+            return False
+        join_task = asyncio.create_task(self._to_write.join())
+        await asyncio.wait(
+            (join_task, writer_task), return_when=asyncio.FIRST_COMPLETED
+        )
+        join_task.cancel()
+        return not writer_task.done()
+
+    async def _send(self, message: str) -> None:
+        """Send a message as a text frame or as a compressed binary frame.
+
+        Binary frames carry one zlib stream per connection that is flushed
+        after every message, so the client decompresses them in order with
+        a single decompressor. They are only used when per-message deflate
+        was not negotiated, which already compresses every frame.
+
+        Clients leave binary mode by sending supported_features without the
+        binary messages feature. Messages are text frames from its result
+        on and enabling the feature again starts a new zlib stream.
+        """
+        assert self.wsock is not None
+        payload = message.encode("utf-8")
+        stats = self._stats
+        stats.messages += 1
+        stats.message_bytes += len(payload)
+
+        if (
+            self.wsock.compress
+            or self._connection is None
+            or not self._connection.supported_features.get(FEATURE_BINARY_MESSAGES)
+        ):
+            self._compressor = None
+            await self.wsock.send_str(message)
+            return
+
+        if self._compressor is None:
+            self._compressor = zlib.compressobj(level=zlib.Z_BEST_SPEED)
+
+        compressed = self._compressor.compress(payload) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+        stats.binary_message_bytes += len(payload)
+        stats.binary_bytes += len(compressed)
+        await self.wsock.send_bytes(compressed)
+
     @callback
     def _send_message(self, message: str | dict[str, Any]) -> None:
         """Send a message to the client.
@@ -142,9 +249,11 @@ class WebSocketHandler:
     async def async_handle(self) -> web.WebSocketResponse:
         """Handle a websocket response."""
         request = self.request
-        wsock = self.wsock = web.WebSocketResponse(heartbeat=55)
+        wsock = self.wsock = web.WebSocketResponse(heartbeat=55, compress=True)
         await wsock.prepare(request)
         self._logger.debug("Connected from %s", request.remote)
+        if wsock.compress:
+            self._stats.deflate_connections += 1
         self._handle_task = asyncio.current_task()
 
         @callback
@@ -160,7 +269,9 @@ class WebSocketHandler:
         # event we do not want to block for websocket responses
         self._writer_task = asyncio.create_task(self._writer())
 
-        auth = AuthPhase(self._logger, self.hass, self._send_message, request)
+        auth = AuthPhase(
+            self._logger, self.hass, self._send_message, request, self._async_drain
+        )
         connection = None
         disconnect_warn = None
 
@@ -189,7 +300,7 @@ class WebSocketHandler:
                 raise Disconnect from err
 
             self._logger.debug("Received %s", msg_data)
-            connection = await auth.async_handle(msg_data)
+            connection = self._connection = await auth.async_handle(msg_data)
             self.hass.data[DATA_CONNECTIONS] = (
                 self.hass.data.get(DATA_CONNECTIONS, 0) + 1
             )
@@ -248,6 +359,8 @@ class WebSocketHandler:
 
                 if connection is not None:
                     self.hass.data[DATA_CONNECTIONS] -= 1
+                if wsock.compress:
+                    self._stats.deflate_connections -= 1
                 self.hass.helpers.dispatcher.async_dispatcher_send(
                     SIGNAL_WEBSOCKET_DISCONNECTED
                 )
@@ -11,6 +11,7 @@ from collections.abc import Awaitable, Collection, Coroutine, Iterable, Mapping
 import datetime
 import enum
 import functools
+import json
 import logging
 import os
 import pathlib
@@ -59,6 +60,7 @@ from homeassistant.exceptions import (
     ServiceNotFound,
     Unauthorized,
 )
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util import location
 from homeassistant.util.async_ import (
     fire_coroutine_threadsafe,
@@ -661,6 +663,10 @@ class EventBus:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[tuple[HassJob, Callable | None]]] = {}
+        # The listeners to call for each event type, including the
+        # MATCH_ALL listeners, built on demand and dropped when
+        # the listeners change
+        self._dispatch: dict[str, tuple[tuple[HassJob, Callable | None], ...]] = {}
         self._hass = hass
 
     @callback
@@ -706,21 +712,24 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
+        listeners = self._dispatch.get(event_type)
+        if listeners is None:
+            listeners = self._async_build_dispatch(event_type)
 
-        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
-        match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        if not listeners:
+            # Nobody is listening, only create the event to log it
+            if event_type != EVENT_TIME_CHANGED and _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Bus:Handling %s",
+                    Event(event_type, event_data, origin, time_fired, context),
+                )
+            return
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if event_type != EVENT_TIME_CHANGED:
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners:
-            return
-
         for job, event_filter in listeners:
             if event_filter is not None:
                 try:
@@ -731,6 +740,36 @@ class EventBus:
                     continue
             self._hass.async_add_hass_job(job, event)
 
+    @callback
+    def _async_build_dispatch(
+        self, event_type: str
+    ) -> tuple[tuple[HassJob, Callable | None], ...]:
+        """Build the listeners to call for an event type.
+
+        Only event types with listeners are stored, so firing events nobody
+        listens to does not grow the cache.
+        """
+        listeners = self._listeners.get(event_type, [])
+
+        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
+        match_all_listeners = self._listeners.get(MATCH_ALL)
+        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
+            listeners = match_all_listeners + listeners
+
+        if not listeners:
+            return ()
+
+        dispatch = self._dispatch[event_type] = tuple(listeners)
+        return dispatch
+
+    @callback
+    def _async_listeners_changed(self, event_type: str) -> None:
+        """Drop the listeners to call that are affected by a change."""
+        if event_type == MATCH_ALL:
+            self._dispatch.clear()
+        else:
+            self._dispatch.pop(event_type, None)
+
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -776,6 +815,7 @@ class EventBus:
         self, event_type: str, filterable_job: tuple[HassJob, Callable | None]
     ) -> CALLBACK_TYPE:
         self._listeners.setdefault(event_type, []).append(filterable_job)
+        self._async_listeners_changed(event_type)
 
         def remove_listener() -> None:
             """Remove the listener."""
@@ -850,6 +890,7 @@ class EventBus:
             # delete event_type list if empty
             if not self._listeners[event_type]:
                 self._listeners.pop(event_type)
+            self._async_listeners_changed(event_type)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
@@ -881,6 +922,8 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_dict_json",
+        "_attributes_json",
     ]
 
     def __init__(
@@ -916,6 +959,8 @@ class State:
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: dict[str, Collection[Any]] | None = None
+        self._as_dict_json: str | None = None
+        self._attributes_json: str | None = None
 
     @property
     def name(self) -> str:
@@ -948,6 +993,32 @@ class State:
             }
         return self._as_dict
 
+    @property
+    def as_dict_json(self) -> str:
+        """Return the JSON encoded dict representation of the State.
+
+        Async friendly.
+
+        Cached so consumers sending the same State do not encode it again.
+        """
+        if not self._as_dict_json:
+            self._as_dict_json = json.dumps(
+                self.as_dict(), cls=JSONEncoder, allow_nan=False
+            )
+        return self._as_dict_json
+
+    @property
+    def attributes_json(self) -> str:
+        """Return the JSON encoded attributes of the State.
+
+        Async friendly.
+
+        Encoded the way the recorder stores them.
+        """
+        if not self._attributes_json:
+            self._attributes_json = json.dumps(dict(self.attributes), cls=JSONEncoder)
+        return self._attributes_json
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Any:
         """Initialize a state from a dict.
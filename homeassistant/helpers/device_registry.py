@@ -161,7 +161,11 @@ class DeviceRegistry:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the device registry."""
         self.hass = hass
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            log_collections={"devices": "id", "deleted_devices": "id"},
+        )
         self._clear_index()
 
     @callback
@@ -448,7 +452,7 @@ class DeviceRegistry:
 
         new = attr.evolve(old, **changes)
         self._update_device(old, new)
-        self.async_schedule_save()
+        self.async_schedule_save(new.id)
 
         self.hass.bus.async_fire(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -477,7 +481,7 @@ class DeviceRegistry:
         self.hass.bus.async_fire(
             EVENT_DEVICE_REGISTRY_UPDATED, {"action": "remove", "device_id": device_id}
         )
-        self.async_schedule_save()
+        self.async_schedule_save(device_id)
 
     async def async_load(self) -> None:
         """Load the device registry."""
@@ -530,42 +534,39 @@ class DeviceRegistry:
         self._rebuild_index()
 
     @callback
-    def async_schedule_save(self) -> None:
-        """Schedule saving the device registry."""
-        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+    def async_schedule_save(self, *device_ids: str) -> None:
+        """Schedule saving the device registry.
+
+        Only the changes of the devices are saved if device IDs are passed.
+        """
+        if not device_ids:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+            return
+
+        changes = []
+        for device_id in device_ids:
+            device = self.devices.get(device_id)
+            deleted_device = self.deleted_devices.get(device_id)
+            changes.append(
+                ("devices", device_id, _device_to_save(device) if device else None)
+            )
+            changes.append(
+                (
+                    "deleted_devices",
+                    device_id,
+                    _deleted_device_to_save(deleted_device) if deleted_device else None,
+                )
+            )
+        self._store.async_delay_log_changes(self._data_to_save, changes, SAVE_DELAY)
 
     @callback
     def _data_to_save(self) -> dict[str, list[dict[str, Any]]]:
         """Return data of device registry to store in a file."""
         data = {}
 
-        data["devices"] = [
-            {
-                "config_entries": list(entry.config_entries),
-                "connections": list(entry.connections),
-                "identifiers": list(entry.identifiers),
-                "manufacturer": entry.manufacturer,
-                "model": entry.model,
-                "name": entry.name,
-                "sw_version": entry.sw_version,
-                "entry_type": entry.entry_type,
-                "id": entry.id,
-                "via_device_id": entry.via_device_id,
-                "area_id": entry.area_id,
-                "name_by_user": entry.name_by_user,
-                "disabled_by": entry.disabled_by,
-            }
-            for entry in self.devices.values()
-        ]
+        data["devices"] = [_device_to_save(entry) for entry in self.devices.values()]
         data["deleted_devices"] = [
-            {
-                "config_entries": list(entry.config_entries),
-                "connections": list(entry.connections),
-                "identifiers": list(entry.identifiers),
-                "id": entry.id,
-                "orphaned_timestamp": entry.orphaned_timestamp,
-            }
-            for entry in self.deleted_devices.values()
+            _deleted_device_to_save(entry) for entry in self.deleted_devices.values()
         ]
 
         return data
@@ -592,7 +593,7 @@ class DeviceRegistry:
                 self.deleted_devices[deleted_device.id] = attr.evolve(
                     deleted_device, config_entries=config_entries
                 )
-            self.async_schedule_save()
+            self.async_schedule_save(deleted_device.id)
 
     @callback
     def async_purge_expired_orphaned_devices(self) -> None:
@@ -620,6 +621,36 @@ class DeviceRegistry:
                 self._async_update_device(dev_id, area_id=None)
 
 
+def _device_to_save(entry: DeviceEntry) -> dict[str, Any]:
+    """Return data of a device registry entry to store in a file."""
+    return {
+        "config_entries": list(entry.config_entries),
+        "connections": list(entry.connections),
+        "identifiers": list(entry.identifiers),
+        "manufacturer": entry.manufacturer,
+        "model": entry.model,
+        "name": entry.name,
+        "sw_version": entry.sw_version,
+        "entry_type": entry.entry_type,
+        "id": entry.id,
+        "via_device_id": entry.via_device_id,
+        "area_id": entry.area_id,
+        "name_by_user": entry.name_by_user,
+        "disabled_by": entry.disabled_by,
+    }
+
+
+def _deleted_device_to_save(entry: DeletedDeviceEntry) -> dict[str, Any]:
+    """Return data of a deleted device registry entry to store in a file."""
+    return {
+        "config_entries": list(entry.config_entries),
+        "connections": list(entry.connections),
+        "identifiers": list(entry.identifiers),
+        "id": entry.id,
+        "orphaned_timestamp": entry.orphaned_timestamp,
+    }
+
+
 @callback
 def async_get(hass: HomeAssistant) -> DeviceRegistry:
     """Get device registry."""
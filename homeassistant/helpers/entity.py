@@ -29,7 +29,7 @@ from homeassistant.const import (
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
 )
-from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError, NoEntitySpecifiedError
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import EntityPlatform
@@ -197,6 +197,16 @@ class Entity(ABC):
     # If we reported if this entity was slow
     _slow_reported = False
 
+    # Number of writes rejected because nothing changed since the last write
+    _suppressed_writes = 0
+
+    # Snapshot of the last write: the state and attributes before customization,
+    # the customization and unit system they were written with and the
+    # resulting state object in the state machine
+    _write_snapshot: tuple[
+        str, dict[str, Any], dict[str, Any] | None, Any, State | None
+    ] | None = None
+
     # If we reported this entity is updated while disabled
     _disabled_reported = False
 
@@ -508,42 +518,78 @@ class Entity(ABC):
                     )
 
             _LOGGER.warning(
-                "Updating state for %s (%s) took %.3f seconds. %s",
+                "Updating state for %s (%s) took %.3f seconds "
+                "(%d unchanged writes suppressed). %s",
                 self.entity_id,
                 type(self),
                 end - start,
+                self._suppressed_writes,
                 extra,
             )
 
-        # Overwrite properties that have been set in the config file.
+        customize = None
         if DATA_CUSTOMIZE in self.hass.data:
-            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
+            customize = self.hass.data[DATA_CUSTOMIZE].get(self.entity_id)
+        units = self.hass.config.units
+
+        if (
+            self._context_set is not None
+            and dt_util.utcnow() - self._context_set > self.context_recent_time
+        ):
+            self._context = None
+            self._context_set = None
+
+        # Reject the write before customization, unit conversion and the state
+        # machine comparison when nothing changed since the last write and
+        # nobody else has written the state in the meantime.
+        snapshot = self._write_snapshot
+        if (
+            snapshot is not None
+            and not self.force_update
+            and snapshot[0] == state
+            and snapshot[2] == customize
+            and snapshot[3] is units
+            and snapshot[4] is not None
+            and snapshot[4] is self.hass.states.get(self.entity_id)
+            and snapshot[1] == attr
+        ):
+            self._suppressed_writes += 1
+            return
+
+        write_state = state
+        write_attr = attr
+
+        # Overwrite properties that have been set in the config file.
+        if customize:
+            write_attr = {**write_attr, **customize}
 
         # Convert temperature if we detect one
         try:
-            unit_of_measure = attr.get(ATTR_UNIT_OF_MEASUREMENT)
-            units = self.hass.config.units
+            unit_of_measure = write_attr.get(ATTR_UNIT_OF_MEASUREMENT)
             if (
                 unit_of_measure in (TEMP_CELSIUS, TEMP_FAHRENHEIT)
                 and unit_of_measure != units.temperature_unit
             ):
                 prec = len(state) - state.index(".") - 1 if "." in state else 0
                 temp = units.temperature(float(state), unit_of_measure)
-                state = str(round(temp) if prec == 0 else round(temp, prec))
-                attr[ATTR_UNIT_OF_MEASUREMENT] = units.temperature_unit
+                write_state = str(round(temp) if prec == 0 else round(temp, prec))
+                write_attr = {
+                    **write_attr,
+                    ATTR_UNIT_OF_MEASUREMENT: units.temperature_unit,
+                }
         except ValueError:
             # Could not convert state to float
             pass
 
-        if (
-            self._context_set is not None
-            and dt_util.utcnow() - self._context_set > self.context_recent_time
-        ):
-            self._context = None
-            self._context_set = None
-
         self.hass.states.async_set(
-            self.entity_id, state, attr, self.force_update, self._context
+            self.entity_id, write_state, write_attr, self.force_update, self._context
+        )
+        self._write_snapshot = (
+            state,
+            attr,
+            customize,
+            units,
+            self.hass.states.get(self.entity_id),
         )
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
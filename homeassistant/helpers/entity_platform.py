@@ -4,11 +4,14 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Coroutine, Iterable
 from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 from logging import Logger
+from time import monotonic
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable, Protocol
+from zlib import crc32
 
 import voluptuous as vol
 
@@ -34,6 +37,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.setup import async_start_setup
 from homeassistant.util.async_ import run_callback_threadsafe
+import homeassistant.util.dt as dt_util
 
 from . import (
     config_validation as cv,
@@ -43,7 +47,7 @@ from . import (
 )
 from .device_registry import DeviceRegistry
 from .entity_registry import DISABLED_INTEGRATION, EntityRegistry
-from .event import async_call_later, async_track_time_interval
+from .event import async_call_later, async_track_point_in_utc_time
 from .typing import ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -58,6 +62,7 @@ SLOW_ADD_MIN_TIMEOUT = 500
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
+MAX_POLLING_BACKOFF = 8  # Times the scan interval
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -71,6 +76,19 @@ class AddEntitiesCallback(Protocol):
         """Define add_entities type."""
 
 
+@dataclass
+class PollingStats:
+    """Polling metrics of an entity platform."""
+
+    polls: int = 0
+    skipped_ticks: int = 0
+    # Seconds the last and the slowest update of all polling entities took
+    last_latency: float | None = None
+    max_latency: float = 0.0
+    # Multiple of the scan interval between polls
+    backoff: int = 1
+
+
 class EntityPlatform:
     """Manage the entities for a single platform."""
 
@@ -100,6 +118,7 @@ class EntityPlatform:
         self._setup_complete = False
         # Method to cancel the state change listener
         self._async_unsub_polling: CALLBACK_TYPE | None = None
+        self.polling_stats = PollingStats()
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
@@ -402,12 +421,43 @@ class EntityPlatform:
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
-            self._update_entity_states,
-            self.scan_interval,
+        # Platforms set up together poll at their own offset in the interval
+        self._async_schedule_poll(dt_util.utcnow() + self._polling_offset())
+
+    def _polling_offset(self) -> timedelta:
+        """Return the deterministic offset of the first poll in the interval."""
+        key = f"{self.domain}.{self.platform_name}"
+        if self.config_entry is not None:
+            key = f"{key}.{self.config_entry.entry_id}"
+        elif self.entity_namespace is not None:
+            key = f"{key}.{self.entity_namespace}"
+        return self.scan_interval * (crc32(key.encode()) / 2 ** 32)
+
+    @callback
+    def _async_schedule_poll(self, point_in_time: datetime) -> None:
+        """Schedule the next poll of the entities."""
+        self._async_unsub_polling = async_track_point_in_utc_time(
+            self.hass, self._async_handle_poll, point_in_time
         )
 
+    @callback
+    def _async_handle_poll(self, now: datetime) -> None:
+        """Poll the entities."""
+        self.hass.async_create_task(self._async_poll(now))
+
+    async def _async_poll(self, now: datetime) -> None:
+        """Poll the entities and schedule the next poll once they are updated."""
+        unsub_polling = self._async_unsub_polling
+        try:
+            await self._update_entity_states(now)
+        finally:
+            # Polling was stopped or restarted while the entities were updating
+            if self._async_unsub_polling is unsub_polling:
+                # Schedule with the backoff that this poll has just updated
+                self._async_schedule_poll(
+                    dt_util.utcnow() + self.scan_interval * self.polling_stats.backoff
+                )
+
     async def _async_add_entity(  # noqa: C901
         self,
         entity: Entity,
@@ -688,6 +738,7 @@ class EntityPlatform:
         """
         if self._process_updates is None:
             self._process_updates = asyncio.Lock()
+        stats = self.polling_stats
         if self._process_updates.locked():
             self.logger.warning(
                 "Updating %s %s took longer than the scheduled update interval %s",
@@ -695,6 +746,8 @@ class EntityPlatform:
                 self.domain,
                 self.scan_interval,
             )
+            stats.skipped_ticks += 1
+            stats.backoff = min(stats.backoff * 2, MAX_POLLING_BACKOFF)
             return
 
         async with self._process_updates:
@@ -704,8 +757,21 @@ class EntityPlatform:
                     continue
                 tasks.append(entity.async_update_ha_state(True))
 
-            if tasks:
-                await asyncio.gather(*tasks)
+            if not tasks:
+                return
+
+            start = monotonic()
+            await asyncio.gather(*tasks)
+            latency = monotonic() - start
+
+        stats.polls += 1
+        stats.last_latency = latency
+        stats.max_latency = max(stats.max_latency, latency)
+        # Poll slow platforms less often until they keep up again
+        if latency > self.scan_interval.total_seconds():
+            stats.backoff = min(stats.backoff * 2, MAX_POLLING_BACKOFF)
+        else:
+            stats.backoff = 1
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
@@ -736,3 +802,34 @@ def async_get_platforms(
     platforms: list[EntityPlatform] = hass.data[DATA_ENTITY_PLATFORM][integration_name]
 
     return platforms
+
+
+@callback
+def async_polling_stats_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Return the polling metrics of all entity platforms combined."""
+    info: dict[str, Any] = {
+        "polls": 0,
+        "skipped_ticks": 0,
+        "max_latency": 0.0,
+        "slowest_platform": None,
+    }
+    for platforms in hass.data.get(DATA_ENTITY_PLATFORM, {}).values():
+        for platform in platforms:
+            stats: PollingStats = platform.polling_stats
+            info["polls"] += stats.polls
+            info["skipped_ticks"] += stats.skipped_ticks
+            if stats.max_latency > info["max_latency"]:
+                info["max_latency"] = stats.max_latency
+                info["slowest_platform"] = f"{platform.domain}.{platform.platform_name}"
+    return info
+
+
+@callback
+def async_suppressed_state_writes(hass: HomeAssistant) -> int:
+    """Return the number of unchanged state writes skipped by all entities."""
+    return sum(
+        entity._suppressed_writes  # pylint: disable=protected-access
+        for platforms in hass.data.get(DATA_ENTITY_PLATFORM, {}).values()
+        for platform in platforms
+        for entity in platform.entities.values()
+    )
@@ -154,7 +154,9 @@ class EntityRegistry:
         self.hass = hass
         self.entities: dict[str, RegistryEntry]
         self._index: dict[tuple[str, str, str], str] = {}
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION, STORAGE_KEY, log_collections={"entities": "entity_id"}
+        )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
         )
@@ -313,7 +315,7 @@ class EntityRegistry:
         )
         self._register_entry(entity)
         _LOGGER.info("Registered new %s.%s entity: %s", domain, platform, entity_id)
-        self.async_schedule_save()
+        self.async_schedule_save(entity_id)
 
         self.hass.bus.async_fire(
             EVENT_ENTITY_REGISTRY_UPDATED, {"action": "create", "entity_id": entity_id}
@@ -328,7 +330,7 @@ class EntityRegistry:
         self.hass.bus.async_fire(
             EVENT_ENTITY_REGISTRY_UPDATED, {"action": "remove", "entity_id": entity_id}
         )
-        self.async_schedule_save()
+        self.async_schedule_save(entity_id)
 
     @callback
     def async_device_modified(self, event: Event) -> None:
@@ -474,7 +476,10 @@ class EntityRegistry:
         new = attr.evolve(old, **new_values)
         self._register_entry(new)
 
-        self.async_schedule_save()
+        if old.entity_id != entity_id:
+            self.async_schedule_save(old.entity_id, entity_id)
+        else:
+            self.async_schedule_save(entity_id)
 
         data = {"action": "update", "entity_id": entity_id, "changes": old_values}
 
@@ -527,35 +532,29 @@ class EntityRegistry:
         self._rebuild_index()
 
     @callback
-    def async_schedule_save(self) -> None:
-        """Schedule saving the entity registry."""
-        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+    def async_schedule_save(self, *entity_ids: str) -> None:
+        """Schedule saving the entity registry.
+
+        Only the changes of the entities are saved if entity IDs are passed.
+        """
+        if not entity_ids:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+            return
+
+        changes = []
+        for entity_id in entity_ids:
+            entry = self.entities.get(entity_id)
+            changes.append(
+                ("entities", entity_id, _entry_to_save(entry) if entry else None)
+            )
+        self._store.async_delay_log_changes(self._data_to_save, changes, SAVE_DELAY)
 
     @callback
     def _data_to_save(self) -> dict[str, Any]:
         """Return data of entity registry to store in a file."""
         data = {}
 
-        data["entities"] = [
-            {
-                "entity_id": entry.entity_id,
-                "config_entry_id": entry.config_entry_id,
-                "device_id": entry.device_id,
-                "area_id": entry.area_id,
-                "unique_id": entry.unique_id,
-                "platform": entry.platform,
-                "name": entry.name,
-                "icon": entry.icon,
-                "disabled_by": entry.disabled_by,
-                "capabilities": entry.capabilities,
-                "supported_features": entry.supported_features,
-                "device_class": entry.device_class,
-                "unit_of_measurement": entry.unit_of_measurement,
-                "original_name": entry.original_name,
-                "original_icon": entry.original_icon,
-            }
-            for entry in self.entities.values()
-        ]
+        data["entities"] = [_entry_to_save(entry) for entry in self.entities.values()]
 
         return data
 
@@ -596,6 +595,27 @@ class EntityRegistry:
             self._add_index(entry)
 
 
+def _entry_to_save(entry: RegistryEntry) -> dict[str, Any]:
+    """Return data of an entity registry entry to store in a file."""
+    return {
+        "entity_id": entry.entity_id,
+        "config_entry_id": entry.config_entry_id,
+        "device_id": entry.device_id,
+        "area_id": entry.area_id,
+        "unique_id": entry.unique_id,
+        "platform": entry.platform,
+        "name": entry.name,
+        "icon": entry.icon,
+        "disabled_by": entry.disabled_by,
+        "capabilities": entry.capabilities,
+        "supported_features": entry.supported_features,
+        "device_class": entry.device_class,
+        "unit_of_measurement": entry.unit_of_measurement,
+        "original_name": entry.original_name,
+        "original_icon": entry.original_icon,
+    }
+
+
 @callback
 def async_get(hass: HomeAssistant) -> EntityRegistry:
     """Get entity registry."""
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import fnmatch
+from functools import lru_cache
 import re
 from typing import Callable
 
@@ -20,6 +21,9 @@ CONF_EXCLUDE_ENTITIES = "exclude_entities"
 
 CONF_ENTITY_GLOBS = "entity_globs"
 
+# Number of entity ids a filter remembers its decision for
+FILTER_CACHE_SIZE = 16384
+
 
 def convert_filter(config: dict[str, list[str]]) -> Callable[[str], bool]:
     """Convert the filter schema into a filter."""
@@ -104,18 +108,11 @@ INCLUDE_EXCLUDE_FILTER_SCHEMA = vol.All(
 )
 
 
-def _glob_to_re(glob: str) -> re.Pattern[str]:
-    """Translate and compile glob string into pattern."""
-    return re.compile(fnmatch.translate(glob))
-
-
-def _test_against_patterns(patterns: list[re.Pattern[str]], entity_id: str) -> bool:
-    """Test entity against list of patterns, true if any match."""
-    for pattern in patterns:
-        if pattern.match(entity_id):
-            return True
-
-    return False
+def _globs_to_re(globs: set[str]) -> re.Pattern[str] | None:
+    """Translate and compile glob strings into a single pattern."""
+    if not globs:
+        return None
+    return re.compile("|".join(fnmatch.translate(glob) for glob in sorted(globs)))
 
 
 # It's safe since we don't modify it. And None causes typing warnings
@@ -128,15 +125,42 @@ def generate_filter(
     include_entity_globs: list[str] = [],
     exclude_entity_globs: list[str] = [],
 ) -> Callable[[str], bool]:
-    """Return a function that will filter entities based on the args."""
+    """Return a function that will filter entities based on the args.
+
+    The decision for each entity id is memoized, a new filter has to be
+    generated when the configuration changes.
+    """
+    filters = (
+        include_domains,
+        include_entities,
+        exclude_domains,
+        exclude_entities,
+        include_entity_globs,
+        exclude_entity_globs,
+    )
+
+    # Case 1 - no includes or excludes - pass all entities
+    if not any(filters):
+        return lambda entity_id: True
+
+    return lru_cache(maxsize=FILTER_CACHE_SIZE)(_generate_filter(*filters))
+
+
+def _generate_filter(
+    include_domains: list[str],
+    include_entities: list[str],
+    exclude_domains: list[str],
+    exclude_entities: list[str],
+    include_entity_globs: list[str],
+    exclude_entity_globs: list[str],
+) -> Callable[[str], bool]:
+    """Return an uncached function that will filter entities based on the args."""
     include_d = set(include_domains)
     include_e = set(include_entities)
     exclude_d = set(exclude_domains)
     exclude_e = set(exclude_entities)
-    include_eg_set = set(include_entity_globs)
-    exclude_eg_set = set(exclude_entity_globs)
-    include_eg = list(map(_glob_to_re, include_eg_set))
-    exclude_eg = list(map(_glob_to_re, exclude_eg_set))
+    include_eg = _globs_to_re(set(include_entity_globs))
+    exclude_eg = _globs_to_re(set(exclude_entity_globs))
 
     have_exclude = bool(exclude_e or exclude_d or exclude_eg)
     have_include = bool(include_e or include_d or include_eg)
@@ -146,7 +170,7 @@ def generate_filter(
         return (
             entity_id in include_e
             or domain in include_d
-            or bool(include_eg and _test_against_patterns(include_eg, entity_id))
+            or bool(include_eg and include_eg.match(entity_id))
         )
 
     def entity_excluded(domain: str, entity_id: str) -> bool:
@@ -154,13 +178,9 @@ def generate_filter(
         return (
             entity_id in exclude_e
             or domain in exclude_d
-            or bool(exclude_eg and _test_against_patterns(exclude_eg, entity_id))
+            or bool(exclude_eg and exclude_eg.match(entity_id))
         )
 
-    # Case 1 - no includes or excludes - pass all entities
-    if not have_include and not have_exclude:
-        return lambda entity_id: True
-
     # Case 2 - includes, no excludes - only include specified entities
     if have_include and not have_exclude:
 
@@ -196,11 +216,9 @@ def generate_filter(
             if domain in include_d:
                 return not (
                     entity_id in exclude_e
-                    or bool(
-                        exclude_eg and _test_against_patterns(exclude_eg, entity_id)
-                    )
+                    or bool(exclude_eg and exclude_eg.match(entity_id))
                 )
-            if _test_against_patterns(include_eg, entity_id):
+            if include_eg and include_eg.match(entity_id):
                 return not entity_excluded(domain, entity_id)
             return entity_id in include_e
 
@@ -218,9 +236,7 @@ def generate_filter(
         def entity_filter_4b(entity_id: str) -> bool:
             """Return filter function for case 4b."""
             domain = split_entity_id(entity_id)[0]
-            if domain in exclude_d or (
-                exclude_eg and _test_against_patterns(exclude_eg, entity_id)
-            ):
+            if domain in exclude_d or (exclude_eg and exclude_eg.match(entity_id)):
                 return entity_id in include_e
             return entity_id not in exclude_e
 
@@ -7,6 +7,7 @@ import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
+from heapq import heappop, heappush
 import logging
 import time
 from typing import Any, Callable, List, cast
@@ -54,6 +55,8 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+TIMER_WHEEL = "timer_wheel"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -1171,40 +1174,162 @@ def async_track_point_in_utc_time(
 
     # Since this is called once, we accept a HassJob so we can avoid
     # having to figure out how to call the action every time its called.
-    cancel_callback: asyncio.TimerHandle | None = None
+    job = action if isinstance(action, HassJob) else HassJob(action)
+    return _async_get_timer_wheel(hass).async_add(job, utc_point_in_time)
+
+
+@callback
+def _async_get_timer_wheel(hass: HomeAssistant) -> TimerWheel:
+    """Return the timer wheel of this instance."""
+    wheel: TimerWheel | None = hass.data.get(TIMER_WHEEL)
+    if wheel is None:
+        wheel = hass.data[TIMER_WHEEL] = TimerWheel(hass)
+    return wheel
+
+
+@callback
+@bind_hass
+def async_pending_timer_count(hass: HomeAssistant) -> int:
+    """Return the number of point in time listeners that have not fired yet."""
+    wheel: TimerWheel | None = hass.data.get(TIMER_WHEEL)
+    return 0 if wheel is None else wheel.pending
+
+
+class _Timer:
+    """A point in time listener scheduled on the timer wheel."""
+
+    __slots__ = ("job", "point_in_time", "deadline")
+
+    def __init__(self, job: HassJob, point_in_time: datetime) -> None:
+        """Initialize the timer."""
+        self.job = job
+        self.point_in_time = point_in_time
+        self.deadline = point_in_time.timestamp()
+
+
+class TimerWheel:
+    """Run point in time listeners from a single event loop timer.
+
+    Listeners due at the same moment share a slot, so the event loop only
+    holds one timer for the earliest slot. When it fires, every slot that
+    is due by then expires in one batch. Listeners for every tick of the
+    time changed event share a single bus listener.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the timer wheel."""
+        self._hass = hass
+        # Insertion ordered so listeners sharing a slot fire in order added
+        self._slots: dict[float, dict[_Timer, None]] = {}
+        # Heap of slot deadlines, may hold deadlines of emptied slots
+        self._deadlines: list[float] = []
+        self._handle: asyncio.TimerHandle | None = None
+        self._handle_deadline = 0.0
+        self._tick_jobs: list[HassJob] = []
+        self._unsub_tick: CALLBACK_TYPE | None = None
+        self.pending = 0
 
     @callback
-    def run_action(job: HassJob) -> None:
-        """Call the action."""
-        nonlocal cancel_callback
+    def async_add(self, job: HassJob, point_in_time: datetime) -> CALLBACK_TYPE:
+        """Schedule a job to run at a point in UTC time."""
+        timer = _Timer(job, point_in_time)
+        slot = self._slots.get(timer.deadline)
+        if slot is None:
+            slot = self._slots[timer.deadline] = {}
+            heappush(self._deadlines, timer.deadline)
+        slot[timer] = None
+        self.pending += 1
+
+        if self._handle is None or timer.deadline < self._handle_deadline:
+            self._async_schedule(timer.deadline)
 
-        now = time_tracker_utcnow()
+        @callback
+        def unsub_point_in_time_listener() -> None:
+            """Remove the timer from its slot."""
+            slot = self._slots.get(timer.deadline)
+            if slot is None or timer not in slot:
+                return
+            del slot[timer]
+            self.pending -= 1
+            if not slot:
+                del self._slots[timer.deadline]
 
-        # Depending on the available clock support (including timer hardware
-        # and the OS kernel) it can happen that we fire a little bit too early
-        # as measured by utcnow(). That is bad when callbacks have assumptions
-        # about the current time. Thus, we rearm the timer for the remaining
-        # time.
-        delta = (utc_point_in_time - now).total_seconds()
-        if delta > 0:
-            _LOGGER.debug("Called %f seconds too early, rearming", delta)
+        return unsub_point_in_time_listener
 
-            cancel_callback = hass.loop.call_later(delta, run_action, job)
-            return
+    @callback
+    def async_add_tick(self, job: HassJob) -> CALLBACK_TYPE:
+        """Run a job on every time changed event."""
+        self._tick_jobs.append(job)
+        if self._unsub_tick is None:
+            self._unsub_tick = self._hass.bus.async_listen(
+                EVENT_TIME_CHANGED, self._async_tick
+            )
 
-        hass.async_run_hass_job(job, utc_point_in_time)
+        @callback
+        def unsub_time_change_listener() -> None:
+            """Remove the job from the tick listeners."""
+            if job not in self._tick_jobs:
+                return
+            self._tick_jobs.remove(job)
+            if not self._tick_jobs and self._unsub_tick is not None:
+                self._unsub_tick()
+                self._unsub_tick = None
 
-    job = action if isinstance(action, HassJob) else HassJob(action)
-    delta = utc_point_in_time.timestamp() - time.time()
-    cancel_callback = hass.loop.call_later(delta, run_action, job)
+        return unsub_time_change_listener
+
+    @callback
+    def _async_tick(self, event: Event) -> None:
+        """Run the jobs listening for every time changed event."""
+        self._async_run_jobs([(job, event.data[ATTR_NOW]) for job in self._tick_jobs])
+
+    @callback
+    def _async_run_jobs(self, jobs: list[tuple[HassJob, datetime]]) -> None:
+        """Run a batch of jobs without one failing job stopping the others."""
+        hass = self._hass
+        for job, now in jobs:
+            try:
+                hass.async_run_hass_job(job, now)
+            except Exception as err:  # pylint: disable=broad-except
+                hass.loop.call_exception_handler(
+                    {"message": f"Exception in timer job {job}", "exception": err}
+                )
+
+    @callback
+    def _async_schedule(self, deadline: float, now: float | None = None) -> None:
+        """Set the event loop timer to fire at a deadline."""
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle_deadline = deadline
+        delay = deadline - (time.time() if now is None else max(now, time.time()))
+        self._handle = self._hass.loop.call_later(delay, self._async_expire)
 
     @callback
-    def unsub_point_in_time_listener() -> None:
-        """Cancel the call_later."""
-        assert cancel_callback is not None
-        cancel_callback.cancel()
+    def _async_expire(self) -> None:
+        """Run the jobs of every slot that is due."""
+        self._handle = None
 
-    return unsub_point_in_time_listener
+        # Depending on the available clock support (including timer hardware
+        # and the OS kernel) it can happen that we fire a little bit too early
+        # as measured by utcnow(). That is bad when callbacks have assumptions
+        # about the current time. Thus, slots that are not due yet stay on
+        # the wheel and we rearm the timer for the remaining time.
+        now = time_tracker_utcnow().timestamp()
+        deadlines = self._deadlines
+        slots = self._slots
+        expired: list[_Timer] = []
+        while deadlines and deadlines[0] <= now:
+            slot = slots.pop(heappop(deadlines), None)
+            if slot:
+                expired.extend(slot)
+        self.pending -= len(expired)
+
+        self._async_run_jobs([(timer.job, timer.point_in_time) for timer in expired])
+
+        # Drop deadlines of slots whose listeners were all removed
+        while deadlines and deadlines[0] not in slots:
+            heappop(deadlines)
+        if deadlines and (self._handle is None or deadlines[0] < self._handle_deadline):
+            self._async_schedule(deadlines[0], now)
 
 
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
@@ -1373,13 +1498,7 @@ def async_track_utc_time_change(
     # We do not have to wrap the function with time pattern matching logic
     # if no pattern given
     if all(val is None for val in (hour, minute, second)):
-
-        @callback
-        def time_change_listener(event: Event) -> None:
-            """Fire every time event that comes in."""
-            hass.async_run_hass_job(job, event.data[ATTR_NOW])
-
-        return hass.bus.async_listen(EVENT_TIME_CHANGED, time_change_listener)
+        return _async_get_timer_wheel(hass).async_add_tick(job)
 
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
@@ -1503,13 +1622,13 @@ def _event_triggers_rerender(event: Event, info: RenderInfo) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = cast(str, event.data.get(ATTR_ENTITY_ID))
 
+    old_state = event.data.get("old_state")
+    new_state = event.data.get("new_state")
+
     if info.filter(entity_id):
-        return True
+        return info.state_change_affects_render(entity_id, old_state, new_state)
 
-    if (
-        event.data.get("new_state") is not None
-        and event.data.get("old_state") is not None
-    ):
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
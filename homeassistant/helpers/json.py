@@ -1,25 +1,14 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
-from datetime import datetime, timedelta
-import json
-from typing import Any
-
+from __future__ import annotations
 
-class JSONEncoder(json.JSONEncoder):
-    """JSONEncoder that supports Home Assistant objects."""
-
-    def default(self, o: Any) -> Any:
-        """Convert Home Assistant objects.
-
-        Hand other objects to the original method.
-        """
-        if isinstance(o, datetime):
-            return o.isoformat()
-        if isinstance(o, set):
-            return list(o)
-        if hasattr(o, "as_dict"):
-            return o.as_dict()
+from datetime import timedelta
+from typing import Any
 
-        return json.JSONEncoder.default(self, o)
+from homeassistant.util.json import (  # noqa: F401
+    JSONEncoder,
+    json_dumps,
+    json_encoder_default,
+)
 
 
 class ExtendedJSONEncoder(JSONEncoder):
@@ -2,15 +2,19 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
 from contextlib import suppress
+import json
 from json import JSONEncoder
 import logging
 import os
 from typing import Any, Callable
+from uuid import uuid4
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_dumps
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 
@@ -18,6 +22,8 @@ from homeassistant.util import json as json_util
 # mypy: no-check-untyped-defs
 
 STORAGE_DIR = ".storage"
+# Number of change log records after which a new snapshot is saved instead
+STORAGE_LOG_COMPACT_RECORDS = 1000
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -75,8 +81,14 @@ class Store:
         private: bool = False,
         *,
         encoder: type[JSONEncoder] | None = None,
+        log_collections: dict[str, str] | None = None,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        Passing log_collections, which maps the lists of dicts in the data to
+        the key of their items, enables logging changes of single items with
+        async_delay_log_changes instead of saving all data.
+        """
         self.version = version
         self.key = key
         self.hass = hass
@@ -87,12 +99,23 @@ class Store:
         self._write_lock = asyncio.Lock()
         self._load_task: asyncio.Future | None = None
         self._encoder = encoder
+        self._log_collections = log_collections
+        # The id of the saved data the change log applies to
+        self._log_id: str | None = None
+        self._log_records = 0
+        self._log_data_func: Callable[[], dict] | None = None
+        self._pending_changes: dict[tuple[str, str], dict | None] = {}
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def log_path(self):
+        """Return the path of the change log."""
+        return f"{self.path}.log"
+
     async def async_load(self) -> dict | list | None:
         """Load data.
 
@@ -124,12 +147,15 @@ class Store:
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
         else:
-            data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
-            )
+            data = await self.hass.async_add_executor_job(self._load_data)
 
             if data == {}:
                 return None
+
+            if self._pending_changes and data["version"] == self.version:
+                _apply_log_records(
+                    data["data"], self._log_collections, self._pending_records()
+                )
         if data["version"] == self.version:
             stored = data["data"]
         else:
@@ -143,6 +169,52 @@ class Store:
 
         return stored
 
+    def _load_data(self) -> dict:
+        """Load the data and replay the change log on top of it."""
+        data: dict = json_util.load_json(self.path)  # type: ignore[assignment]
+        if not self._log_collections or data == {}:
+            return data
+
+        log_id = data.get("log_id")
+        records, complete = self._load_log(log_id) if log_id else ([], True)
+        _apply_log_records(data["data"], self._log_collections, records)
+
+        if data["version"] == self.version:
+            # Without a log id the next change saves all data and starts a
+            # new log, instead of being appended behind an incomplete record
+            # and lost on the next load
+            self._log_id = log_id if complete else None
+            self._log_records = len(records)
+        return data
+
+    def _load_log(self, log_id: str) -> tuple[list[dict], bool]:
+        """Load the change log records of the saved data.
+
+        Returns the records and if the log was complete.
+        """
+        try:
+            with open(self.log_path, encoding="utf-8") as fdesc:
+                lines = fdesc.read().splitlines()
+        except FileNotFoundError:
+            return [], True
+
+        records = []
+        try:
+            # A log of older saved data was left behind if saving stopped
+            # before the first change to the current data was logged
+            if not lines or json.loads(lines[0]).get("log_id") != log_id:
+                return [], True
+            for line in lines[1:]:
+                records.append(json.loads(line))
+        except ValueError:
+            _LOGGER.warning(
+                "Ignoring incomplete change log record of %s after %s records",
+                self.key,
+                len(records),
+            )
+            return records, False
+        return records, True
+
     async def async_save(self, data: dict | list) -> None:
         """Save data."""
         self._data = {"version": self.version, "key": self.key, "data": data}
@@ -168,6 +240,41 @@ class Store:
             self.hass, delay, self._async_callback_delayed_write
         )
 
+    @callback
+    def async_delay_log_changes(
+        self,
+        data_func: Callable[[], dict],
+        changes: Iterable[tuple[str, str, dict | None]],
+        delay: float = 0,
+    ) -> None:
+        """Log changed items with an optional delay.
+
+        Changes are (collection, key, item) tuples, where a None item removes
+        the item. Only the changes are appended to the change log, unless
+        there is no saved data to log against or the log has grown past
+        STORAGE_LOG_COMPACT_RECORDS. Then the data of data_func is saved.
+        """
+        for collection, key, item in changes:
+            self._pending_changes[(collection, key)] = item
+        self._log_data_func = data_func
+
+        self._async_cleanup_delay_listener()
+        self._async_ensure_final_write_listener()
+
+        if self.hass.state == CoreState.stopping:
+            return
+
+        self._unsub_delay_listener = async_call_later(
+            self.hass, delay, self._async_callback_delayed_write
+        )
+
+    def _pending_records(self) -> list[dict[str, Any]]:
+        """Return the change log records of the pending changes."""
+        return [
+            {"collection": collection, "key": key, "item": item}
+            for (collection, key), item in self._pending_changes.items()
+        ]
+
     @callback
     def _async_ensure_final_write_listener(self) -> None:
         """Ensure that we write if we quit before delay has passed."""
@@ -209,23 +316,71 @@ class Store:
             self._async_cleanup_delay_listener()
             self._async_cleanup_final_write_listener()
 
-            if self._data is None:
+            if self._data is None and not self._pending_changes:
                 # Another write already consumed the data
                 return
 
             data = self._data
-
-            if "data_func" in data:
-                data["data"] = data.pop("data_func")()
-
+            records = self._pending_records()
             self._data = None
-
-            try:
-                await self.hass.async_add_executor_job(
-                    self._write_data, self.path, data
+            self._pending_changes = {}
+
+            if data is None and (
+                self._log_id is None
+                or self._log_records + len(records) > STORAGE_LOG_COMPACT_RECORDS
+            ):
+                # Compact the change log into newly saved data
+                assert self._log_data_func is not None
+                data = {
+                    "version": self.version,
+                    "key": self.key,
+                    "data_func": self._log_data_func,
+                }
+                records = []
+
+            if data is not None:
+                if "data_func" in data:
+                    data["data"] = data.pop("data_func")()
+                if not await self._async_write_data(data):
+                    return
+
+            if records and not await self._async_write_log(records):
+                # Save all data instead of the changes that were not logged
+                await self._async_write_data(
+                    {
+                        "version": self.version,
+                        "key": self.key,
+                        "data": self._log_data_func(),  # type: ignore[misc]
+                    }
                 )
-            except (json_util.SerializationError, json_util.WriteError) as err:
-                _LOGGER.error("Error writing config for %s: %s", self.key, err)
+
+    async def _async_write_data(self, data: dict) -> bool:
+        """Write the data and return if it succeeded."""
+        if self._log_collections:
+            # Start a new change log for the data
+            self._log_id = data["log_id"] = uuid4().hex
+            self._log_records = 0
+
+        try:
+            await self.hass.async_add_executor_job(self._write_data, self.path, data)
+        except (json_util.SerializationError, json_util.WriteError) as err:
+            _LOGGER.error("Error writing config for %s: %s", self.key, err)
+            self._log_id = None
+            return False
+        return True
+
+    async def _async_write_log(self, records: list[dict[str, Any]]) -> bool:
+        """Append records to the change log and return if it succeeded."""
+        truncate = self._log_records == 0
+        self._log_records += len(records)
+        try:
+            await self.hass.async_add_executor_job(
+                self._write_log, self.log_path, self._log_id, records, truncate
+            )
+        except (json_util.SerializationError, json_util.WriteError) as err:
+            _LOGGER.error("Error writing change log for %s: %s", self.key, err)
+            return False
+        return True
 
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
@@ -235,6 +390,31 @@ class Store:
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_util.save_json(path, data, self._private, encoder=self._encoder)
 
+    def _write_log(
+        self, path: str, log_id: str, records: list[dict[str, Any]], truncate: bool
+    ) -> None:
+        """Append records to the change log, starting a new log if truncating."""
+        try:
+            lines = [json_dumps(record, encoder=self._encoder) for record in records]
+        except (TypeError, ValueError) as error:
+            raise json_util.SerializationError(
+                f"Failed to serialize change log record: {path}: {error}"
+            ) from error
+        if truncate:
+            lines.insert(0, json_dumps({"log_id": log_id}))
+
+        flags = os.O_WRONLY | os.O_CREAT | (os.O_TRUNC if truncate else os.O_APPEND)
+        try:
+            with open(
+                os.open(path, flags, 0o600 if self._private else 0o644),
+                "w",
+                encoding="utf-8",
+            ) as fdesc:
+                fdesc.write("".join(f"{line}\n" for line in lines))
+        except OSError as error:
+            _LOGGER.exception("Writing change log failed: %s", path)
+            raise json_util.WriteError(error) from error
+
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -246,3 +426,40 @@ class Store:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self._log_collections:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.log_path)
+
+
+def _apply_log_records(
+    data: dict[str, list[dict]],
+    log_collections: dict[str, str] | None,
+    records: Iterable[dict[str, Any]],
+) -> None:
+    """Apply change log records to the lists of the data."""
+    assert log_collections is not None
+    indexes: dict[str, dict[str, int]] = {}
+
+    for record in records:
+        collection = record["collection"]
+        items = data.setdefault(collection, [])
+        if (index := indexes.get(collection)) is None:
+            key_field = log_collections[collection]
+            index = indexes[collection] = {
+                item[key_field]: position for position, item in enumerate(items)
+            }
+
+        key = record["key"]
+        item = record["item"]
+        if (position := index.get(key)) is not None:
+            # Removed items are dropped after all records are applied
+            items[position] = item
+            if item is None:
+                del index[key]
+        elif item is not None:
+            index[key] = len(items)
+            items.append(item)
+
+    for collection in indexes:
+        data[collection] = [item for item in data[collection] if item is not None]
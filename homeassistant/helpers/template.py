@@ -17,9 +17,10 @@ from operator import attrgetter
 import random
 import re
 import sys
+import threading
+from types import CodeType
 from typing import Any, Callable, cast
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import jinja2
 from jinja2 import contextfunction, pass_context
@@ -29,6 +30,7 @@ import voluptuous as vol
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    ATTR_FRIENDLY_NAME,
     ATTR_LATITUDE,
     ATTR_LONGITUDE,
     ATTR_UNIT_OF_MEASUREMENT,
@@ -48,6 +50,7 @@ from homeassistant.helpers.typing import TemplateVarsType
 from homeassistant.loader import bind_hass
 from homeassistant.util import convert, dt as dt_util, location as loc_util
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.lru import LRU
 from homeassistant.util.thread import ThreadWithException
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -56,6 +59,9 @@ _LOGGER = logging.getLogger(__name__)
 _SENTINEL = object()
 DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Number of compiled templates shared by all templates and environments
+COMPILED_CODE_CACHE_SIZE = 4096
+
 _RENDER_INFO = "template.render_info"
 _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
@@ -221,6 +227,14 @@ class RenderInfo:
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: timedelta | None = None
         self.has_time = False
+        # Entities the template read completely, and the state fields and
+        # attributes read from the entities it only read in part.
+        self._entities_fully_read: set[str] = set()
+        self._entity_fields: dict[str, set[str]] = {}
+        self._entity_attributes: dict[str, set[str]] = {}
+        # Set when frozen: the fields and attributes each partially read
+        # entity depends on.
+        self._entity_reads: dict[str, tuple[frozenset[str], frozenset[str]]] = {}
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -240,6 +254,43 @@ class RenderInfo:
         """Template should re-render if the entity is added or removed with domains watched."""
         return split_entity_id(entity_id)[0] in self.domains_lifecycle
 
+    def _collect_entity(self, entity_id: str) -> None:
+        """Collect an entity the template depends on in full."""
+        self.entities.add(entity_id)  # type: ignore[attr-defined]
+        self._entities_fully_read.add(entity_id)
+
+    def _collect_entity_field(self, entity_id: str, field: str | None) -> None:
+        """Collect a single state field the template read from an entity."""
+        self.entities.add(entity_id)  # type: ignore[attr-defined]
+        fields = self._entity_fields.setdefault(entity_id, set())
+        if field is not None:
+            fields.add(field)
+
+    def _collect_entity_attribute(self, entity_id: str, attribute: Any) -> None:
+        """Collect a single attribute the template read from an entity."""
+        self.entities.add(entity_id)  # type: ignore[attr-defined]
+        self._entity_fields.setdefault(entity_id, set())
+        self._entity_attributes.setdefault(entity_id, set()).add(attribute)
+
+    def state_change_affects_render(
+        self, entity_id: str, old_state: State | None, new_state: State | None
+    ) -> bool:
+        """Return if a state change touches what the template read from the entity."""
+        reads = self._entity_reads.get(entity_id)
+        if reads is None or old_state is None or new_state is None:
+            return True
+        fields, attributes = reads
+        for field in fields:
+            if getattr(old_state, field) != getattr(new_state, field):
+                return True
+        old_attributes = old_state.attributes
+        new_attributes = new_state.attributes
+        return any(
+            old_attributes.get(attribute, _SENTINEL)
+            != new_attributes.get(attribute, _SENTINEL)
+            for attribute in attributes
+        )
+
     def result(self) -> str:
         """Results of the template computation."""
         if self.exception is not None:
@@ -277,6 +328,18 @@ class RenderInfo:
         if self.all_states:
             return
 
+        # Entities also reachable through a whole domain or read in full
+        # re-render on every change.
+        self._entity_reads = {
+            entity_id: (
+                frozenset(fields),
+                frozenset(self._entity_attributes.get(entity_id, ())),
+            )
+            for entity_id, fields in self._entity_fields.items()
+            if entity_id not in self._entities_fully_read
+            and split_entity_id(entity_id)[0] not in self.domains
+        }
+
         if self.domains:
             self.filter = self._filter_domains_and_entities
         elif self.entities:
@@ -714,17 +777,33 @@ class TemplateState(State):
 
     def _collect_state(self) -> None:
         if self._collect and _RENDER_INFO in self._hass.data:
-            self._hass.data[_RENDER_INFO].entities.add(self._state.entity_id)
+            self._hass.data[_RENDER_INFO]._collect_entity(self._state.entity_id)
+
+    def _collect_field(self, field: str | None) -> None:
+        if self._collect and _RENDER_INFO in self._hass.data:
+            self._hass.data[_RENDER_INFO]._collect_entity_field(
+                self._state.entity_id, field
+            )
+
+    def _collect_attribute(self, attribute: Any) -> None:
+        if self._collect and _RENDER_INFO in self._hass.data:
+            self._hass.data[_RENDER_INFO]._collect_entity_attribute(
+                self._state.entity_id, attribute
+            )
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item):
         """Return a property as an attribute for jinja."""
-        if item in _COLLECTABLE_STATE_ATTRIBUTES:
-            # _collect_state inlined here for performance
+        if item == "state":
+            # _collect_field inlined here for performance
             if self._collect and _RENDER_INFO in self._hass.data:
-                self._hass.data[_RENDER_INFO].entities.add(self._state.entity_id)
-            return getattr(self._state, item)
+                self._hass.data[_RENDER_INFO]._collect_entity_field(
+                    self._state.entity_id, "state"
+                )
+            return self._state.state
+        if item in _COLLECTABLE_STATE_ATTRIBUTES:
+            return getattr(self, item)
         if item == "entity_id":
             return self._state.entity_id
         if item == "state_with_unit":
@@ -742,55 +821,65 @@ class TemplateState(State):
     @property
     def state(self):
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_field("state")
         return self._state.state
 
     @property
     def attributes(self):
-        """Wrap State.attributes."""
-        self._collect_state()
-        return self._state.attributes
+        """Wrap State.attributes.
+
+        While collecting, the attributes are wrapped so only the attributes
+        the template reads are collected.
+        """
+        if not self._collect or _RENDER_INFO not in self._hass.data:
+            return self._state.attributes
+        if not self._state.attributes:
+            self._collect_field("attributes")
+            return self._state.attributes
+        self._collect_field(None)
+        return TemplateStateAttributes(self)
 
     @property
     def last_changed(self):
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_field("last_changed")
         return self._state.last_changed
 
     @property
     def last_updated(self):
         """Wrap State.last_updated."""
-        self._collect_state()
+        self._collect_field("last_updated")
         return self._state.last_updated
 
     @property
     def context(self):
         """Wrap State.context."""
-        self._collect_state()
+        self._collect_field("context")
         return self._state.context
 
     @property
     def domain(self):
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_field(None)
         return self._state.domain
 
     @property
     def object_id(self):
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_field(None)
         return self._state.object_id
 
     @property
     def name(self):
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_attribute(ATTR_FRIENDLY_NAME)
         return self._state.name
 
     @property
     def state_with_unit(self) -> str:
         """Return the state concatenated with the unit if available."""
-        self._collect_state()
+        self._collect_field("state")
+        self._collect_attribute(ATTR_UNIT_OF_MEASUREMENT)
         unit = self._state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         return f"{self._state.state} {unit}" if unit else self._state.state
 
@@ -804,10 +893,71 @@ class TemplateState(State):
         return f"<template TemplateState({self._state.__repr__()})>"
 
 
+class TemplateStateAttributes(collections.abc.Mapping):
+    """Read-only view of state attributes that collects the attributes read."""
+
+    __slots__ = ("_template_state", "_attributes")
+
+    def __init__(self, template_state: TemplateState) -> None:
+        """Initialize the attributes view."""
+        self._template_state = template_state
+        self._attributes = template_state._state.attributes
+
+    def _collect_all(self) -> None:
+        self._template_state._collect_field("attributes")
+
+    def __getitem__(self, key: Any) -> Any:
+        """Return an attribute and collect it."""
+        self._template_state._collect_attribute(key)
+        return self._attributes[key]
+
+    def __contains__(self, key: Any) -> bool:
+        """Return if the attribute exists and collect it."""
+        self._template_state._collect_attribute(key)
+        return key in self._attributes
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return an attribute or the default and collect it."""
+        self._template_state._collect_attribute(key)
+        return self._attributes.get(key, default)
+
+    def __iter__(self) -> Any:
+        """Iterate the attributes, which reads all of them."""
+        self._collect_all()
+        return iter(self._attributes)
+
+    def __len__(self) -> int:
+        """Return the number of attributes, which reads all of them."""
+        self._collect_all()
+        return len(self._attributes)
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare all the attributes."""
+        self._collect_all()
+        if isinstance(other, TemplateStateAttributes):
+            other = other._attributes
+        return self._attributes == other
+
+    def copy(self) -> dict[str, Any]:
+        """Return a copy of all the attributes."""
+        self._collect_all()
+        return self._attributes.copy()
+
+    def __str__(self) -> str:
+        """Return all the attributes as a string."""
+        self._collect_all()
+        return str(self._attributes)
+
+    def __repr__(self) -> str:
+        """Representation of all the attributes."""
+        self._collect_all()
+        return repr(self._attributes)
+
+
 def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
     entity_collect = hass.data.get(_RENDER_INFO)
     if entity_collect is not None:
-        entity_collect.entities.add(entity_id)
+        entity_collect._collect_entity(entity_id)
 
 
 def _state_generator(hass: HomeAssistant, domain: str | None) -> Generator:
@@ -1408,7 +1558,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             undefined = jinja2.StrictUndefined
         super().__init__(undefined=undefined)
         self.hass = hass
-        self.template_cache = weakref.WeakValueDictionary()
+        self.limited = limited
+        self.strict = strict
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1554,12 +1705,62 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        cached = self.template_cache.get(source)
+        key = (source, self.limited, self.strict)
+        cached = _COMPILED_CODE_CACHE.get(key)
 
         if cached is None:
-            cached = self.template_cache[source] = super().compile(source)
+            cached = super().compile(source)
+            _COMPILED_CODE_CACHE.set(key, cached)
 
         return cached
 
 
+class _CompiledCodeCache:
+    """Compiled template code shared by all templates and environments.
+
+    Templates are compiled in the event loop and in executor threads,
+    so the LRU is guarded by a lock.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the cache."""
+        self._lru: LRU[tuple[str, bool, bool], CodeType] = LRU(maxsize)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: tuple[str, bool, bool]) -> CodeType | None:
+        """Return the compiled code of a template source."""
+        with self._lock:
+            code = self._lru.get(key)
+            if code is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return code
+
+    def set(self, key: tuple[str, bool, bool], code: CodeType) -> None:
+        """Store the compiled code of a template source."""
+        with self._lock:
+            self._lru[key] = code
+
+    def info(self) -> dict[str, int]:
+        """Return the hits, misses and size of the cache."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._lru),
+                "maxsize": self._lru.maxsize,
+            }
+
+
+_COMPILED_CODE_CACHE = _CompiledCodeCache(COMPILED_CODE_CACHE_SIZE)
+
+
+def compiled_code_cache_info() -> dict[str, int]:
+    """Return the hits, misses and size of the compiled template cache."""
+    return _COMPILED_CODE_CACHE.info()
+
+
 _NO_HASS_ENV = TemplateEnvironment(None)  # type: ignore[no-untyped-call]
@@ -28,12 +28,15 @@ class TraceElement:
         if variables is None:
             variables = {}
         last_variables = variables_cv.get() or {}
-        variables_cv.set(dict(variables))
         changed_variables = {
             key: value
             for key, value in variables.items()
-            if key not in last_variables or last_variables[key] != value
+            if key not in last_variables
+            or (last_variables[key] is not value and last_variables[key] != value)
         }
+        # Steps that leave the variables alone share the previous copy
+        if changed_variables or len(variables) != len(last_variables):
+            variables_cv.set(dict(variables))
         self._variables = changed_variables
 
     def __repr__(self) -> str:
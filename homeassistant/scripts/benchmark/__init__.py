@@ -13,10 +13,16 @@ from typing import Callable, TypeVar
 
 from homeassistant import core
 from homeassistant.components.websocket_api.const import JSON_DUMP
-from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.const import (
+    ATTR_NOW,
+    EVENT_STATE_CHANGED,
+    EVENT_TIME_CHANGED,
+    MATCH_ALL,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_encoder_default, orjson
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -86,6 +92,60 @@ async def fire_events(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_match_all(hass):
+    """Fire a million events of mixed types with a MATCH_ALL listener.
+
+    The time includes firing the events, divide the million events
+    by it to get the events per second.
+    """
+    count = 0
+    event_types = [f"benchmark_event_{idx}" for idx in range(10)]
+    events_to_fire = 10 ** 6
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    hass.bus.async_listen(MATCH_ALL, listener)
+    # Half of the event types also have their own listener
+    for event_type in event_types[::2]:
+        hass.bus.async_listen(event_type, listener)
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(event_types[idx % 10])
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire * 3 // 2
+
+    return timer() - start
+
+
+@benchmark
+async def fire_events_without_listeners(hass):
+    """Fire a million events nobody listens to.
+
+    The time includes firing the events, divide the million events
+    by it to get the events per second.
+    """
+    event_name = "benchmark_event"
+    events_to_fire = 10 ** 6
+
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(event_name)
+
+    await hass.async_block_till_done()
+
+    return timer() - start
+
+
 @benchmark
 async def fire_events_with_filter(hass):
     """Fire a million events with a filter that rejects them."""
@@ -368,6 +428,40 @@ async def filtering_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def filtering_unique_entity_id(hass):
+    """Run 100k unique entity ids through an include/exclude entity filter."""
+    entities_filter = convert_include_exclude_filter(
+        {
+            "include": {
+                "domains": ["automation", "script", "group", "media_player"],
+                "entity_globs": [
+                    f"binary_sensor.*_{kind}"
+                    for kind in ("contact", "occupancy", "detected", "lock")
+                ]
+                + ["input_*", "device_tracker.*_phone", "switch.*_light"],
+                "entities": ["test.entity_1", "binary_sensor.garage_door_open"],
+            },
+            "exclude": {
+                "domains": ["input_number"],
+                "entity_globs": ["media_player.google_*", "group.all_*"],
+                "entities": [],
+            },
+        }
+    )
+    domains = ["binary_sensor", "switch", "light", "media_player", "sensor"]
+    entity_ids = [
+        f"{domains[i % len(domains)]}.device_{i}_occupancy" for i in range(10 ** 5)
+    ]
+
+    start = timer()
+
+    for entity_id in entity_ids:
+        entities_filter(entity_id)
+
+    return timer() - start
+
+
 @benchmark
 async def valid_entity_id(hass):
     """Run valid entity ID a million times."""
@@ -379,7 +473,7 @@ async def valid_entity_id(hass):
 
 @benchmark
 async def json_serialize_states(hass):
-    """Serialize million states with websocket default encoder."""
+    """Serialize million states with the websocket encoder."""
     states = [
         core.State("light.kitchen", "on", {"friendly_name": "Kitchen Lights"})
         for _ in range(10 ** 6)
@@ -390,6 +484,79 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def json_serialize_states_orjson(hass):
+    """Serialize million states with the compiled encoder."""
+    if orjson is None:
+        raise RuntimeError("orjson is not installed")
+
+    states = [
+        core.State("light.kitchen", "on", {"friendly_name": "Kitchen Lights"})
+        for _ in range(10 ** 6)
+    ]
+
+    start = timer()
+    orjson.dumps(
+        states, option=orjson.OPT_NON_STR_KEYS, default=json_encoder_default
+    ).decode("utf-8")
+    return timer() - start
+
+
+@benchmark
+async def json_serialize_states_stdlib(hass):
+    """Serialize million states with the standard library encoder."""
+    states = [
+        core.State("light.kitchen", "on", {"friendly_name": "Kitchen Lights"})
+        for _ in range(10 ** 6)
+    ]
+
+    start = timer()
+    json.dumps(states, cls=JSONEncoder, allow_nan=False)
+    return timer() - start
+
+
+@benchmark
+async def websocket_get_states(hass):
+    """Answer get_states a hundred times with 10k entities."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.websocket_api import commands, messages
+
+    class Connection:
+        """Websocket connection of an admin only serializing the messages."""
+
+        class user:  # pylint: disable=invalid-name
+            """The admin user."""
+
+            class permissions:  # pylint: disable=invalid-name
+                """Permissions allowing everything."""
+
+                @staticmethod
+                def access_all_entities(key):
+                    """Allow reading all entities."""
+                    return True
+
+        @staticmethod
+        def send_message(message):
+            """Serialize the message like the websocket writer does."""
+            if not isinstance(message, str):
+                messages.message_to_json(message)
+
+    for idx in range(10 ** 4):
+        hass.states.async_set(
+            f"light.kitchen_{idx}",
+            "on",
+            {"friendly_name": f"Kitchen Lights {idx}", "brightness": 255},
+        )
+    connection = Connection()
+
+    start = timer()
+    for idx in range(100):
+        commands.handle_get_states(
+            hass, connection, {"id": idx + 1, "type": "get_states"}
+        )
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -2,15 +2,22 @@
 from __future__ import annotations
 
 from collections import deque
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
 import json
 import logging
+import math
 import os
 import tempfile
 from typing import Any, Callable
 
-from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -22,6 +29,108 @@ class WriteError(HomeAssistantError):
     """Error writing the data."""
 
 
+class JSONEncoder(json.JSONEncoder):
+    """JSONEncoder that supports Home Assistant objects."""
+
+    def default(self, o: Any) -> Any:
+        """Convert Home Assistant objects.
+
+        Hand other objects to the original method.
+        """
+        if isinstance(o, datetime):
+            return o.isoformat()
+        if isinstance(o, set):
+            return list(o)
+        if hasattr(o, "as_dict"):
+            return o.as_dict()
+        if is_dataclass(o) and not isinstance(o, type):
+            return asdict(o)
+
+        return json.JSONEncoder.default(self, o)
+
+
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects for the compiled encoder.
+
+    Datetimes and dataclasses are serialized natively by it.
+    """
+    if isinstance(obj, set):
+        return list(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    if isinstance(obj, tuple):
+        # Named tuples are serialized as lists by the standard library
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _has_non_finite_float(data: Any) -> bool:
+    """Return if data holds NaN or Infinity, converting it like the encoder."""
+    to_process = [data]
+    while to_process:
+        obj = to_process.pop()
+        obj_type = type(obj)
+        # Check the most common types first, this runs for every message
+        if obj_type is str or obj is None or obj_type is int or obj_type is bool:
+            continue
+        if obj_type is dict:
+            to_process.extend(obj.values())
+        elif obj_type is list:
+            to_process.extend(obj)
+        elif isinstance(obj, float):
+            if not math.isfinite(obj):
+                return True
+        elif isinstance(obj, dict):
+            to_process.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set)):
+            to_process.extend(obj)
+        elif hasattr(obj, "as_dict"):
+            to_process.append(obj.as_dict())
+        elif is_dataclass(obj) and not isinstance(obj, type):
+            to_process.append(asdict(obj))
+    return False
+
+
+def json_dumps(
+    data: Any,
+    *,
+    encoder: type[json.JSONEncoder] | None = JSONEncoder,
+    indent: bool = False,
+    allow_nan: bool = True,
+) -> str:
+    """Serialize data to JSON with the fastest encoder installed.
+
+    The compiled encoder is used when it is installed and the encoder is
+    JSONEncoder, which also serializes Home Assistant objects, or None,
+    which only serializes plain data. Other encoders and installs without
+    it use the standard library.
+
+    The compiled encoder writes NaN and Infinity as null. If its output has
+    a null and the data holds them, they are handled like the standard
+    library does: rejected if not allow_nan, else written as NaN and Infinity.
+
+    Raises TypeError or ValueError if the data can not be serialized.
+    """
+    if orjson is None or (encoder is not None and encoder is not JSONEncoder):
+        return json.dumps(
+            data, cls=encoder, indent=4 if indent else None, allow_nan=allow_nan
+        )
+
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    result = orjson.dumps(
+        data,
+        option=option,
+        default=json_encoder_default if encoder is not None else None,
+    )
+    if b"null" in result and _has_non_finite_float(data):
+        if not allow_nan:
+            raise ValueError("Out of range float values are not JSON compliant")
+        return json.dumps(data, cls=encoder, indent=4 if indent else None)
+    return result.decode("utf-8")
+
+
 def load_json(filename: str, default: list | dict | None = None) -> list | dict:
     """Load JSON data from a file and return as dict or list.
 
@@ -54,7 +163,7 @@ def save_json(
     Returns True on success.
     """
     try:
-        json_data = json.dumps(data, indent=4, cls=encoder)
+        json_data = json_dumps(data, encoder=encoder, indent=True)
     except TypeError as error:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
@@ -100,6 +209,11 @@ def find_paths_unserializable_data(
 
     This method is slow! Only use for error handling.
     """
+    from homeassistant.core import (  # pylint: disable=import-outside-toplevel
+        Event,
+        State,
+    )
+
     to_process = deque([(bad_data, "$")])
     invalid = {}
 
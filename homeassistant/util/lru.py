@@ -0,0 +1,81 @@
+"""Bounded least recently used mapping."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Generic, TypeVar, overload
+
+_KT = TypeVar("_KT")
+_VT = TypeVar("_VT")
+_T = TypeVar("_T")
+
+
+class LRU(Generic[_KT, _VT]):
+    """A mapping that evicts the least recently used key when full.
+
+    Not thread safe, the owner must only use it from a single thread.
+    """
+
+    __slots__ = ("_data", "_maxsize")
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the mapping."""
+        self._data: OrderedDict[_KT, _VT] = OrderedDict()
+        self._maxsize = maxsize
+
+    @property
+    def maxsize(self) -> int:
+        """Return the maximum number of keys."""
+        return self._maxsize
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        """Return if the key is in the mapping without marking it as used."""
+        return key in self._data
+
+    def __getitem__(self, key: _KT) -> _VT:
+        """Return the value for key and mark it as most recently used."""
+        value = self._data[key]
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: _KT, value: _VT) -> None:
+        """Set the value for key and evict the least recently used key if full."""
+        data = self._data
+        data[key] = value
+        data.move_to_end(key)
+        if len(data) > self._maxsize:
+            data.popitem(last=False)
+
+    def __delitem__(self, key: _KT) -> None:
+        """Remove key."""
+        del self._data[key]
+
+    @overload
+    def get(self, key: _KT) -> _VT | None:
+        ...
+
+    @overload
+    def get(self, key: _KT, default: _VT | _T) -> _VT | _T:
+        ...
+
+    def get(self, key: _KT, default: _VT | _T | None = None) -> _VT | _T | None:
+        """Return the value for key or default and mark key as used."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key: _KT, default: _VT | None = None) -> _VT | None:
+        """Remove key and return its value or default."""
+        return self._data.pop(key, default)
+
+    def items(self) -> list[tuple[_KT, _VT]]:
+        """Return a snapshot of the items from least to most recently used."""
+        return list(self._data.items())
+
+    def clear(self) -> None:
+        """Remove all keys."""
+        self._data.clear()
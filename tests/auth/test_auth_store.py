@@ -248,3 +248,20 @@ async def test_loading_race_condition(hass):
         mock_dev_registry.assert_called_once_with(hass)
         mock_load.assert_called_once_with()
         assert results[0] == results[1]
+
+
+async def test_registry_updates_invalidate_permission_decisions(hass):
+    """Test registry changes drop the cached entity decisions."""
+    store = auth_store.AuthStore(hass)
+    await store._async_load()
+    generation = store._perm_lookup.generation
+
+    hass.bus.async_fire(
+        "entity_registry_updated", {"action": "create", "entity_id": "light.kitchen"}
+    )
+    hass.bus.async_fire(
+        "device_registry_updated", {"action": "create", "device_id": "mock-dev-id"}
+    )
+    await hass.async_block_till_done()
+
+    assert store._perm_lookup.generation == generation + 2
@@ -1,5 +1,6 @@
 """Tests for the Home Assistant auth module."""
 from datetime import timedelta
+import time
 from unittest.mock import Mock, patch
 
 import jwt
@@ -360,6 +361,57 @@ async def test_cannot_retrieve_expired_access_token(hass):
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_refresh_token_lookups(hass):
+    """Test looking up refresh tokens by id and token after changes."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    first = await manager.async_create_refresh_token(user, CLIENT_ID)
+    second = await manager.async_create_refresh_token(user, "https://other.example")
+
+    assert await manager.async_get_refresh_token(first.id) is first
+    assert await manager.async_get_refresh_token_by_token(second.token) is second
+    assert await manager.async_get_refresh_token_by_token(first.token[:-1]) is None
+
+    await manager.async_remove_refresh_token(first)
+    assert await manager.async_get_refresh_token(first.id) is None
+    assert await manager.async_get_refresh_token_by_token(first.token) is None
+    assert first.id not in user.refresh_tokens
+
+    await manager.async_remove_user(user)
+    assert await manager.async_get_refresh_token(second.id) is None
+    assert await manager.async_get_refresh_token_by_token(second.token) is None
+
+
+async def test_validated_access_tokens_are_cached(hass):
+    """Test verified access tokens skip decoding until they are invalidated."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    other_refresh_token = await manager.async_create_refresh_token(
+        user, "https://other.example"
+    )
+    access_token = manager.async_create_access_token(refresh_token)
+    other_access_token = manager.async_create_access_token(other_refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+    with patch("homeassistant.auth.jwt.decode") as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+    assert not mock_decode.called
+
+    with patch("time.time", return_value=time.time() + 61):
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+
+    assert (
+        await manager.async_validate_access_token(other_access_token)
+        is other_refresh_token
+    )
+    await manager.async_deactivate_user(user)
+    assert await manager.async_validate_access_token(other_access_token) is None
+
+
 async def test_generating_system_user(hass):
     """Test that we can add a system user."""
     events = []
@@ -1016,6 +1016,15 @@ def mock_storage(data=None):
         # To ensure that the data can be serialized
         data[store.key] = json.loads(json.dumps(data_to_write, cls=store._encoder))
 
+    def mock_write_log(store, path, log_id, records, truncate):
+        """Mock version of write log, applying the records to the data."""
+        _LOGGER.info("Writing change log to %s: %s", store.key, records)
+        storage._apply_log_records(
+            data[store.key]["data"],
+            store._log_collections,
+            json.loads(json.dumps(records, cls=store._encoder)),
+        )
+
     async def mock_remove(store):
         """Remove data."""
         data.pop(store.key, None)
@@ -1028,6 +1037,10 @@ def mock_storage(data=None):
         "homeassistant.helpers.storage.Store._write_data",
         side_effect=mock_write_data,
         autospec=True,
+    ), patch(
+        "homeassistant.helpers.storage.Store._write_log",
+        side_effect=mock_write_log,
+        autospec=True,
     ), patch(
         "homeassistant.helpers.storage.Store.async_remove",
         side_effect=mock_remove,
@@ -1038,7 +1051,7 @@ def mock_storage(data=None):
 
 async def flush_store(store):
     """Make sure all delayed writes of a store are written."""
-    if store._data is None:
+    if store._data is None and not store._pending_changes:
         return
 
     store._async_cleanup_final_write_listener()
@@ -2,7 +2,7 @@
 # pylint: disable=protected-access,invalid-name
 from datetime import timedelta
 import json
-from unittest.mock import patch, sentinel
+from unittest.mock import AsyncMock, Mock, patch, sentinel
 
 import pytest
 from pytest import approx
@@ -1043,3 +1043,262 @@ async def test_list_statistic_ids(hass, hass_ws_client, units, attributes, unit)
     response = await client.receive_json()
     assert response["success"]
     assert response["result"] == []
+
+
+async def test_fetch_period_api_stream(hass, hass_client):
+    """Test the fetch period view streams the history in entity_id order."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.cow", "on")
+    hass.states.async_set("light.nomatch", "on")
+
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{dt_util.utcnow().isoformat()}?stream&filter_entity_id=light.kitchen,light.cow",
+    )
+    assert response.status == 200
+    response_json = await response.json()
+    assert len(response_json) == 2
+    assert response_json[0][0]["entity_id"] == "light.cow"
+    assert response_json[1][0]["entity_id"] == "light.kitchen"
+
+    response = await client.get(
+        f"/api/history/period/{dt_util.utcnow().isoformat()}?stream&filter_entity_id=light.missing",
+    )
+    assert response.status == 200
+    assert await response.json() == []
+
+
+async def test_stream_during_period(hass, hass_ws_client):
+    """Test the history is streamed in chunks that can be resumed."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.cow", "on")
+    hass.states.async_set("light.nomatch", "on")
+
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    with patch.object(history, "STREAM_CHUNK_SIZE", 2):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream_during_period",
+                "start_time": dt_util.utcnow().isoformat(),
+                "entity_ids": ["light.kitchen", "light.cow", "light.nomatch"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["type"] == "event"
+        assert list(response["event"]["states"]) == ["light.cow", "light.kitchen"]
+        assert response["event"]["cursor"] == "light.kitchen"
+        response = await client.receive_json()
+        assert list(response["event"]["states"]) == ["light.nomatch"]
+        assert response["event"]["cursor"] == "light.nomatch"
+        response = await client.receive_json()
+        assert response["success"]
+
+        await client.send_json(
+            {
+                "id": 2,
+                "type": "history/stream_during_period",
+                "start_time": dt_util.utcnow().isoformat(),
+                "entity_ids": ["light.kitchen", "light.cow", "light.nomatch"],
+                "cursor": "light.kitchen",
+            }
+        )
+        response = await client.receive_json()
+        assert list(response["event"]["states"]) == ["light.nomatch"]
+        response = await client.receive_json()
+        assert response["id"] == 2
+        assert response["success"]
+
+
+async def test_stream_during_period_waits_for_client(hass, hass_ws_client):
+    """Test streaming many chunks stays within the pending message limit."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    entity_ids = [f"light.number_{index}" for index in range(10)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "on")
+
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    with patch("homeassistant.components.websocket_api.http.MAX_PENDING_MSG", 2):
+        client = await hass_ws_client()
+    with patch.object(history, "STREAM_CHUNK_SIZE", 1):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream_during_period",
+                "start_time": dt_util.utcnow().isoformat(),
+                "entity_ids": entity_ids,
+            }
+        )
+        received = []
+        for _ in entity_ids:
+            response = await client.receive_json()
+            received.extend(response["event"]["states"])
+        response = await client.receive_json()
+        assert response["success"]
+
+    assert received == sorted(entity_ids)
+
+
+async def test_stream_during_period_stops_when_closed(hass):
+    """Test streaming stops reading the period once the client is gone."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    entity_ids = [f"light.number_{index}" for index in range(10)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "on")
+
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    connection = Mock(async_drain=AsyncMock(return_value=False))
+    with patch.object(history, "STREAM_CHUNK_SIZE", 1):
+        await hass.async_add_executor_job(
+            history._stream_history_chunks,
+            hass,
+            connection,
+            1,
+            start,
+            None,
+            entity_ids,
+            None,
+            True,
+            True,
+            False,
+            False,
+            None,
+        )
+
+    assert len(connection.send_message.mock_calls) == 1
+
+
+async def test_stream_during_period_bad_start_time(hass, hass_ws_client):
+    """Test streaming the history with an invalid start_time."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream_during_period",
+            "start_time": "cats",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
+async def test_fetch_period_api_columnar(hass, hass_client):
+    """Test the fetch period view returns parallel lists of states."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    hass.states.async_set("light.kitchen", "on", {"brightness": 1})
+    await hass.async_block_till_done()
+    first_changed = hass.states.get("light.kitchen").last_changed
+    hass.states.async_set("light.kitchen", "on", {"brightness": 2})
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.cow", "on")
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}?columnar&filter_entity_id=light.kitchen,light.cow",
+    )
+    assert response.status == 200
+    response_json = await response.json()
+    assert response_json == {
+        "light.cow": {
+            "state": ["on"],
+            "last_changed": [
+                approx(hass.states.get("light.cow").last_changed.timestamp())
+            ],
+        },
+        "light.kitchen": {
+            "state": ["on", "off"],
+            "last_changed": [
+                approx(first_changed.timestamp()),
+                approx(hass.states.get("light.kitchen").last_changed.timestamp()),
+            ],
+        },
+    }
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}?columnar&stream&filter_entity_id=light.kitchen,light.cow",
+    )
+    assert response.status == 200
+    assert await response.json() == response_json
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}?columnar&stream&filter_entity_id=light.missing",
+    )
+    assert response.status == 200
+    assert await response.json() == {}
+
+
+async def test_stream_during_period_columnar(hass, hass_ws_client):
+    """Test streaming the history as parallel lists of states."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["light.kitchen"],
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["event"]["states"]["light.kitchen"]["state"] == ["on", "off"]
+    assert len(response["event"]["states"]["light.kitchen"]["last_changed"]) == 2
+    response = await client.receive_json()
+    assert response["success"]
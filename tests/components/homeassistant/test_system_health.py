@@ -0,0 +1,60 @@
+"""Test Home Assistant system health."""
+from homeassistant.helpers.template import COMPILED_CODE_CACHE_SIZE, Template
+from homeassistant.setup import async_setup_component
+
+from tests.common import MockEntity, MockEntityPlatform, get_system_health_info
+
+
+async def test_template_cache_info(hass):
+    """Test the compiled template cache is reported."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    assert await async_setup_component(hass, "system_health", {})
+
+    info = await get_system_health_info(hass, "homeassistant")
+
+    Template("{{ 'system_health_test' }}", hass).async_render()
+    Template("{{ 'system_health_test' }}", hass).async_render()
+
+    new_info = await get_system_health_info(hass, "homeassistant")
+    assert new_info["template_cache_misses"] == info["template_cache_misses"] + 1
+    assert new_info["template_cache_hits"] == info["template_cache_hits"] + 1
+    assert new_info["template_cache_size"].endswith(f"/{COMPILED_CODE_CACHE_SIZE}")
+
+
+async def test_polling_stats_info(hass):
+    """Test the polling metrics are reported."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    assert await async_setup_component(hass, "system_health", {})
+
+    info = await get_system_health_info(hass, "homeassistant")
+    assert info["polling_skipped_ticks"] == 0
+    assert info["polling_max_latency"] == "0.000 s"
+    assert info["polling_slowest_platform"] is None
+
+    ent_platform = MockEntityPlatform(hass, platform_name="slow")
+    ent_platform.polling_stats.skipped_ticks = 2
+    ent_platform.polling_stats.max_latency = 1.5
+
+    info = await get_system_health_info(hass, "homeassistant")
+    assert info["polling_skipped_ticks"] == 2
+    assert info["polling_max_latency"] == "1.500 s"
+    assert info["polling_slowest_platform"] == "test_domain.slow"
+
+
+async def test_suppressed_state_writes_info(hass):
+    """Test the suppressed state writes are reported."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    assert await async_setup_component(hass, "system_health", {})
+
+    ent_platform = MockEntityPlatform(hass)
+    ent = MockEntity(name="test")
+    await ent_platform.async_add_entities([ent])
+
+    info = await get_system_health_info(hass, "homeassistant")
+    assert info["suppressed_state_writes"] == 0
+
+    ent.async_write_ha_state()
+    ent.async_write_ha_state()
+
+    info = await get_system_health_info(hass, "homeassistant")
+    assert info["suppressed_state_writes"] == 2
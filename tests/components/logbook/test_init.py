@@ -1,5 +1,6 @@
 """The tests for the logbook component."""
 # pylint: disable=protected-access,invalid-name
+import asyncio
 import collections
 from datetime import datetime, timedelta
 import json
@@ -19,6 +20,7 @@ from homeassistant.const import (
     ATTR_FRIENDLY_NAME,
     ATTR_NAME,
     ATTR_SERVICE,
+    ATTR_UNIT_OF_MEASUREMENT,
     CONF_DOMAINS,
     CONF_ENTITIES,
     CONF_EXCLUDE,
@@ -279,6 +281,7 @@ def create_state_changed_event_from_old_new(
         [
             "event_type"
             "event_data"
+            "shared_data"
             "time_fired"
             "context_id"
             "context_user_id"
@@ -287,6 +290,7 @@ def create_state_changed_event_from_old_new(
             "entity_id"
             "domain"
             "attributes"
+            "shared_attrs"
             "state_id",
             "old_state_id",
         ],
@@ -294,7 +298,9 @@ def create_state_changed_event_from_old_new(
 
     row.event_type = EVENT_STATE_CHANGED
     row.event_data = "{}"
-    row.attributes = attributes_json
+    row.shared_data = None
+    row.attributes = None
+    row.shared_attrs = attributes_json
     row.time_fired = event_time_fired
     row.state = new_state and new_state.get("state")
     row.entity_id = entity_id
@@ -1834,6 +1840,324 @@ async def test_context_filter(hass, hass_client):
     assert response.status == 400
 
 
+async def test_logbook_paging(hass, hass_client):
+    """Test paging through the logbook resolves contexts from earlier pages."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    now = dt_util.utcnow() - timedelta(hours=2)
+    start = now.replace(minute=now.minute - now.minute % 15, second=0, microsecond=0)
+    context = ha.Context()
+
+    def _at(minutes):
+        return patch(
+            "homeassistant.util.dt.utcnow",
+            return_value=start + timedelta(minutes=minutes),
+        )
+
+    with _at(0):
+        hass.states.async_set("light.kitchen", STATE_OFF)
+        hass.states.async_set("sensor.door", "closed")
+    with _at(1):
+        hass.bus.async_fire(
+            EVENT_CALL_SERVICE,
+            {ATTR_DOMAIN: "light", ATTR_SERVICE: "turn_on"},
+            context=context,
+        )
+    with _at(2):
+        hass.states.async_set("light.kitchen", STATE_ON, context=context)
+    with _at(16):
+        hass.states.async_set("light.kitchen", STATE_OFF, context=context)
+    with _at(17):
+        hass.states.async_set("sensor.door", "open")
+    with _at(18):
+        hass.states.async_set("sensor.door", "closed")
+    await _async_commit_and_wait(hass)
+
+    client = await hass_client()
+    url = f"/api/logbook/{(start - timedelta(minutes=1)).isoformat()}"
+    params = {"end_time": str(start + timedelta(hours=1)), "limit": 2}
+
+    # The service call and the light turning on
+    response = await client.get(url, params=params)
+    assert response.status == 200
+    page = await response.json()
+    assert [entry["state"] for entry in page["events"]] == [STATE_ON]
+    assert page["events"][0]["context_service"] == "turn_on"
+    second_cursor = page["next_cursor"]
+    assert second_cursor is not None
+
+    # The door may still close in this batch, its update is held back
+    response = await client.get(url, params={**params, "cursor": second_cursor})
+    page = await response.json()
+    assert [entry["entity_id"] for entry in page["events"]] == ["light.kitchen"]
+    assert page["events"][0]["context_domain"] == "light"
+    assert page["events"][0]["context_service"] == "turn_on"
+    assert page["next_cursor"] is not None
+
+    response = await client.get(url, params={**params, "cursor": page["next_cursor"]})
+    page = await response.json()
+    assert [(entry["entity_id"], entry["state"]) for entry in page["events"]] == [
+        ("sensor.door", "closed")
+    ]
+    assert page["next_cursor"] is None
+
+    response = await client.get(
+        url,
+        params={**params, "entity": "light.kitchen", "cursor": second_cursor},
+    )
+    page = await response.json()
+    assert [entry["state"] for entry in page["events"]] == [STATE_OFF]
+    assert page["events"][0]["context_service"] == "turn_on"
+    assert page["next_cursor"] is None
+
+    response = await client.get(url, params={**params, "limit": 0})
+    assert response.status == 400
+
+    response = await client.get(url, params={**params, "cursor": start.isoformat()})
+    assert response.status == 400
+
+
+def test_next_cursor_holds_back_last_batch():
+    """Test rows that depend on the rows after a page are held back."""
+    start = dt_util.utcnow().replace(minute=15, second=0, microsecond=0)
+
+    def _row(event_id, minutes, event_type=EVENT_STATE_CHANGED, entity_id=None):
+        return Mock(
+            event_id=event_id,
+            event_type=event_type,
+            entity_id=entity_id,
+            domain=entity_id and entity_id.split(".")[0],
+            time_fired=start + timedelta(minutes=minutes),
+        )
+
+    rows = [
+        _row(1, -1, entity_id="sensor.door"),
+        _row(2, 1, entity_id="sensor.door"),
+        _row(3, 2, entity_id="light.kitchen"),
+        _row(4, 3, EVENT_HOMEASSISTANT_STOP),
+        _row(5, 4, EVENT_HOMEASSISTANT_STOP),
+        _row(6, 5, entity_id="sensor.door"),
+        _row(7, 5, EVENT_HOMEASSISTANT_STOP),
+    ]
+    held_event_ids = set()
+
+    cursor = logbook._next_cursor(rows, held_event_ids)
+
+    assert cursor == logbook.LogbookCursor(rows[-1].time_fired, 7, (6, 7))
+    assert held_event_ids == {2, 6, 7}
+    assert logbook._parse_cursor(logbook._cursor_to_str(cursor)) == cursor
+
+
+async def test_event_stream(hass, hass_ws_client):
+    """Test the event stream sends history and then live events."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    hass.states.async_set("switch.test", STATE_OFF)
+    hass.states.async_set("switch.test", STATE_ON)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/event_stream",
+            "start_time": (dt_util.utcnow() - timedelta(hours=1)).isoformat(),
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    response = await client.receive_json()
+    assert response["id"] == 1
+    assert response["type"] == "event"
+    assert [entry["state"] for entry in response["event"]["events"]] == [STATE_ON]
+
+    response = await client.receive_json()
+    assert response["event"] == {"events": [], "live": True}
+
+    context = ha.Context()
+    hass.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {ATTR_DOMAIN: "switch", ATTR_SERVICE: "turn_off"},
+        context=context,
+    )
+    hass.states.async_set("switch.test", STATE_OFF, context=context)
+    await hass.async_block_till_done()
+
+    response = await client.receive_json()
+    entries = response["event"]["events"]
+    assert len(entries) == 1
+    _assert_entry(entries[0], entity_id="switch.test", state=STATE_OFF)
+    assert entries[0]["context_domain"] == "switch"
+    assert entries[0]["context_service"] == "turn_off"
+
+    # Continuous sensors and attribute changes are skipped like in the database
+    hass.states.async_set("sensor.power", "1", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+    hass.states.async_set("sensor.power", "2", {ATTR_UNIT_OF_MEASUREMENT: "W"})
+    hass.states.async_set("switch.test", STATE_OFF, {"attr": 1})
+    logbook.async_log_entry(hass, "Alarm", "is triggered", "switch", "switch.test")
+    await hass.async_block_till_done()
+
+    response = await client.receive_json()
+    entries = response["event"]["events"]
+    assert len(entries) == 1
+    assert entries[0]["message"] == "is triggered"
+
+
+async def test_event_stream_recorder_timeout(hass, hass_ws_client):
+    """Test the event stream fails when the recorder does not catch up."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    init_count = sum(hass.bus.async_listeners().values())
+    with patch.object(logbook, "RECORDER_SYNC_TIMEOUT", 0), patch.object(
+        hass.data[recorder.DATA_INSTANCE],
+        "async_block_till_done",
+        side_effect=asyncio.Event().wait,
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "logbook/event_stream",
+                "start_time": (dt_util.utcnow() - timedelta(hours=1)).isoformat(),
+            }
+        )
+        response = await client.receive_json()
+
+    assert not response["success"]
+    assert response["error"]["code"] == "timeout"
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
+async def test_event_stream_recorder_timeout_after_unsubscribe(hass, hass_ws_client):
+    """Test the recorder timeout when the stream was already unsubscribed."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_ws_client()
+    init_count = sum(hass.bus.async_listeners().values())
+    waiting = asyncio.Event()
+    unsubscribed = asyncio.Event()
+
+    async def _block_till_done():
+        waiting.set()
+        await unsubscribed.wait()
+        raise asyncio.TimeoutError
+
+    with patch.object(
+        hass.data[recorder.DATA_INSTANCE],
+        "async_block_till_done",
+        side_effect=_block_till_done,
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "logbook/event_stream",
+                "start_time": (dt_util.utcnow() - timedelta(hours=1)).isoformat(),
+            }
+        )
+        await waiting.wait()
+        await client.send_json(
+            {"id": 2, "type": "unsubscribe_events", "subscription": 1}
+        )
+        response = await client.receive_json()
+        assert response["id"] == 2
+        assert response["success"]
+
+        unsubscribed.set()
+        response = await client.receive_json()
+
+    assert response["id"] == 1
+    assert response["error"]["code"] == "timeout"
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
+async def test_event_stream_context_from_history(hass, hass_ws_client):
+    """Test live entries find the contexts started in the history."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    hass.states.async_set("switch.test", STATE_OFF)
+    context = ha.Context()
+    hass.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {ATTR_DOMAIN: "switch", ATTR_SERVICE: "turn_on"},
+        context=context,
+    )
+    hass.states.async_set("switch.test", STATE_ON, context=context)
+    await _async_commit_and_wait(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/event_stream",
+            "start_time": (dt_util.utcnow() - timedelta(hours=1)).isoformat(),
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert [entry["state"] for entry in response["event"]["events"]] == [STATE_ON]
+    response = await client.receive_json()
+    assert response["event"] == {"events": [], "live": True}
+
+    hass.states.async_set("switch.test", STATE_OFF, context=context)
+    await hass.async_block_till_done()
+
+    response = await client.receive_json()
+    entries = response["event"]["events"]
+    assert len(entries) == 1
+    _assert_entry(entries[0], entity_id="switch.test", state=STATE_OFF)
+    assert entries[0]["context_domain"] == "switch"
+    assert entries[0]["context_service"] == "turn_on"
+
+
+async def test_event_stream_past_period(hass, hass_ws_client):
+    """Test the event stream only sends history for a past period."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    hass.states.async_set("switch.test", STATE_OFF)
+    hass.states.async_set("switch.test", STATE_ON)
+    hass.states.async_set("switch.other", STATE_OFF)
+    hass.states.async_set("switch.other", STATE_ON)
+    await _async_commit_and_wait(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/event_stream",
+            "start_time": (dt_util.utcnow() - timedelta(hours=1)).isoformat(),
+            "end_time": dt_util.utcnow().isoformat(),
+            "entity_ids": ["switch.other"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    entries = response["event"]["events"]
+    assert len(entries) == 1
+    _assert_entry(entries[0], entity_id="switch.other", state=STATE_ON)
+
+    await client.send_json(
+        {"id": 2, "type": "logbook/event_stream", "start_time": "cats"}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
 async def _async_fetch_logbook(client, params=None):
     if params is None:
         params = {}
@@ -0,0 +1,69 @@
+"""The tests for the MQTT topic trie."""
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+
+@pytest.mark.parametrize(
+    "topic_filter,topic,matches",
+    [
+        ("a/b/c", "a/b/c", True),
+        ("a/b/c", "a/b", False),
+        ("a/b", "a/b/c", False),
+        ("a/+/c", "a/b/c", True),
+        ("a/+/c", "a/b/d", False),
+        ("+/+", "a/b", True),
+        ("+", "a/b", False),
+        ("a/#", "a", True),
+        ("a/#", "a/b/c", True),
+        ("a/#", "b/c", False),
+        ("#", "a/b/c", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("$SYS/+", "$SYS/broker", True),
+        ("a/+/#", "a/b", True),
+        ("a/+/#", "a", False),
+        ("/a", "/a", True),
+        ("+/a", "/a", True),
+    ],
+)
+def test_match(topic_filter, topic, matches):
+    """Test matching topics against topic filters like paho does."""
+    trie = TopicTrie()
+    trie.add(topic_filter, "value")
+    assert trie.match(topic) == (["value"] if matches else [])
+
+
+def test_match_in_order_added():
+    """Test matches are returned in the order they were added."""
+    trie = TopicTrie()
+    trie.add("a/#", 1)
+    trie.add("a/b", 2)
+    trie.add("a/+", 3)
+    trie.add("#", 4)
+    trie.add("a/b", 5)
+    trie.add("a/c", 6)
+
+    assert trie.match("a/b") == [1, 2, 3, 4, 5]
+
+
+def test_remove():
+    """Test removing values and pruning the empty levels."""
+    trie = TopicTrie()
+    trie.add("a/b/c", 1)
+    trie.add("a/b/c", 2)
+    trie.add("a/+", 3)
+
+    trie.remove("a/b/c", 1)
+    assert trie.match("a/b/c") == [2]
+
+    trie.remove("a/b/c", 2)
+    assert trie.match("a/b/c") == []
+    assert trie.match("a/b") == [3]
+
+    trie.remove("a/+", 3)
+    assert trie._root.children == {}
+
+    with pytest.raises(KeyError):
+        trie.remove("a/+", 3)
@@ -7,6 +7,7 @@ from unittest.mock import patch, sentinel
 
 from homeassistant.components.recorder import history
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.util import session_scope
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
@@ -233,6 +234,80 @@ def test_get_significant_states_with_initial(hass_recorder):
     assert states == hist
 
 
+def test_stream_significant_states(hass_recorder):
+    """Test streaming matches get_significant_states in entity_id order."""
+    hass = hass_recorder()
+    zero, four, _ = record_states(hass)
+    one_and_half = zero + timedelta(seconds=1.5)
+
+    hist = history.get_significant_states(
+        hass, one_and_half, four, minimal_response=True
+    )
+    with session_scope(hass=hass) as session:
+        streamed = list(
+            history.stream_significant_states(
+                hass, session, one_and_half, four, minimal_response=True
+            )
+        )
+
+    assert [entity_id for entity_id, _ in streamed] == sorted(hist)
+    assert dict(streamed) == hist
+
+
+def test_stream_significant_states_after_entity_id(hass_recorder):
+    """Test streaming resumes after the given entity_id."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+
+    with session_scope(hass=hass) as session:
+        streamed = dict(
+            history.stream_significant_states(
+                hass, session, zero, four, after_entity_id="media_player.test3"
+            )
+        )
+
+    assert streamed == {
+        entity_id: entity_states
+        for entity_id, entity_states in states.items()
+        if entity_id > "media_player.test3"
+    }
+
+
+def test_stream_significant_states_binary_order(hass_recorder):
+    """Test streaming orders entity ids by code point like Python does."""
+    hass = hass_recorder()
+    zero, four, _ = record_states(hass)
+
+    with session_scope(hass=hass) as session, patch.object(
+        history, "_significant_states_query", wraps=history._significant_states_query
+    ) as mock_query:
+        list(history.stream_significant_states(hass, session, zero, four))
+
+    assert mock_query.call_args[0][-1] == history.ENTITY_ID_BINARY_COLLATIONS["sqlite"]
+
+
+def test_stream_significant_states_columnar(hass_recorder):
+    """Test streaming parallel lists of states and last_changed timestamps."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+
+    with session_scope(hass=hass) as session:
+        streamed = dict(
+            history.stream_significant_states(hass, session, zero, four, columnar=True)
+        )
+
+    expected = {}
+    for entity_id, entity_states in states.items():
+        columns = expected[entity_id] = {"state": [], "last_changed": []}
+        for state in entity_states:
+            # Attribute only changes are not included
+            if columns["state"][-1:] == [state.state]:
+                continue
+            columns["state"].append(state.state)
+            columns["last_changed"].append(state.last_changed.timestamp())
+    assert streamed == expected
+
+
 def test_get_significant_states_without_initial(hass_recorder):
     """Test that only significant states are returned.
 
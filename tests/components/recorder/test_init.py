@@ -25,7 +25,13 @@ from homeassistant.components.recorder import (
     run_information_with_session,
 )
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    EventData,
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
@@ -141,6 +147,20 @@ async def test_saving_state(
     assert state == _state_empty_context(hass, entity_id)
 
 
+async def test_async_block_till_done_commits(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test waiting for the recorder commits the pending events."""
+    instance = await async_setup_recorder_instance(hass)
+
+    hass.states.async_set("test.recorder", "on")
+    await hass.async_block_till_done()
+    await instance.async_block_till_done()
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 1
+
+
 async def test_saving_many_states(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -785,6 +805,172 @@ def test_saving_state_with_serializable_data(hass_recorder, caplog):
     assert "State is not JSON serializable" in caplog.text
 
 
+@pytest.mark.parametrize("bulk_writer", [False, True])
+def test_saving_states_shares_attributes(hass_recorder, bulk_writer):
+    """Test states with the same attributes share one attributes row."""
+    hass = hass_recorder({"bulk_writer": bulk_writer})
+
+    hass.states.set("test.one", "on", {"shared": True})
+    hass.states.set("test.two", "on", {"shared": True})
+    wait_recording_done(hass)
+    hass.states.set("test.one", "off", {"shared": True})
+    hass.states.set("test.two", "off", {"shared": False})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 4
+        assert all(state.attributes is None for state in states)
+        assert states[0].attributes_id == states[1].attributes_id
+        assert states[0].attributes_id == states[2].attributes_id
+        assert states[0].attributes_id != states[3].attributes_id
+        assert states[2].to_native().attributes == {"shared": True}
+        assert states[3].to_native().attributes == {"shared": False}
+
+        assert session.query(StateAttributes).count() == 2
+
+
+def test_saving_states_finds_attributes_in_database(hass_recorder):
+    """Test attributes not in the cache are found in the database."""
+    hass = hass_recorder()
+
+    hass.states.set("test.one", "on", {"shared": True})
+    wait_recording_done(hass)
+
+    hass.data[DATA_INSTANCE]._state_attributes_ids.clear()
+
+    hass.states.set("test.one", "off", {"shared": True})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 2
+        assert states[0].attributes_id == states[1].attributes_id
+        assert session.query(StateAttributes).count() == 1
+
+
+@pytest.mark.parametrize("bulk_writer", [False, True])
+def test_saving_events_shares_event_data(hass_recorder, bulk_writer):
+    """Test events with the same data share one event data row."""
+    hass = hass_recorder({"bulk_writer": bulk_writer})
+
+    hass.bus.fire("test_event", {"shared": True})
+    hass.bus.fire("test_event", {"shared": True})
+    wait_recording_done(hass)
+    hass.bus.fire("test_event", {"shared": True})
+    hass.bus.fire("test_event", {"shared": False})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        events = list(session.query(Events).filter_by(event_type="test_event"))
+        assert len(events) == 4
+        assert all(event.event_data is None for event in events)
+        assert events[0].data_id == events[1].data_id
+        assert events[0].data_id == events[2].data_id
+        assert events[0].data_id != events[3].data_id
+        assert events[2].to_native().data == {"shared": True}
+        assert events[3].to_native().data == {"shared": False}
+
+        assert (
+            session.query(EventData)
+            .filter(EventData.data_id.in_([events[0].data_id, events[3].data_id]))
+            .count()
+            == 2
+        )
+
+
+def test_saving_events_finds_event_data_in_database(hass_recorder):
+    """Test event data not in the cache is found in the database."""
+    hass = hass_recorder()
+
+    hass.bus.fire("test_event", {"shared": True})
+    wait_recording_done(hass)
+
+    hass.data[DATA_INSTANCE]._event_data_ids.clear()
+
+    hass.bus.fire("test_event", {"shared": True})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        events = list(session.query(Events).filter_by(event_type="test_event"))
+        assert len(events) == 2
+        assert events[0].data_id == events[1].data_id
+        assert (
+            session.query(EventData)
+            .filter(EventData.shared_data == '{"shared": true}')
+            .count()
+            == 1
+        )
+
+
+def test_bulk_writer_saving_sets_old_state(hass_recorder):
+    """Test the bulk writer saves states and links the old state."""
+    hass = hass_recorder({"bulk_writer": True})
+
+    hass.states.set("test.one", "on", {"attr": 1})
+    hass.states.set("test.two", "on", {})
+    hass.bus.fire("bulk_event", {"data": "yes"})
+    wait_recording_done(hass)
+    hass.states.set("test.one", "off", {"attr": 2})
+    hass.states.set("test.two", "off", {})
+    hass.states.remove("test.two")
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 5
+
+        assert [state.entity_id for state in states] == [
+            "test.one",
+            "test.two",
+            "test.one",
+            "test.two",
+            "test.two",
+        ]
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id is None
+        assert states[2].old_state_id == states[0].state_id
+        assert states[3].old_state_id == states[1].state_id
+        assert states[4].old_state_id == states[3].state_id
+        assert states[4].state is None
+        assert states[2].to_native().attributes == {"attr": 2}
+
+        for state in states:
+            event = session.query(Events).filter_by(event_id=state.event_id).one()
+            assert event.event_type == "state_changed"
+
+        db_events = list(session.query(Events).filter_by(event_type="bulk_event"))
+        assert len(db_events) == 1
+        assert db_events[0].to_native().data == {"data": "yes"}
+
+
+def test_bulk_writer_continues_ids_after_reopen(hass_recorder):
+    """Test the bulk writer continues after the existing rows on a new session."""
+    hass = hass_recorder({"bulk_writer": True})
+
+    hass.states.set("test.one", "on", {})
+    wait_recording_done(hass)
+
+    instance = hass.data[DATA_INSTANCE]
+    with patch(
+        "homeassistant.components.recorder.perodic_db_cleanups",
+        side_effect=SQLAlchemyError,
+    ):
+        instance.queue.put(recorder.PerodicCleanupTask())
+        wait_recording_done(hass)
+
+    hass.states.set("test.one", "off", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 2
+        assert states[1].state_id == states[0].state_id + 1
+        assert states[1].event_id > states[0].event_id
+        # The old state cache is cleared when the session is reopened
+        assert states[1].old_state_id is None
+
+
 def test_run_information(hass_recorder):
     """Ensure run_information returns expected data."""
     before_start_recording = dt_util.utcnow()
@@ -9,6 +9,7 @@ from homeassistant.components.recorder.models import (
     Base,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
@@ -40,6 +41,29 @@ def test_from_event_to_db_state():
     assert state == States.from_event(event).to_native()
 
 
+def test_state_attributes_to_native():
+    """Test converting shared attributes to native attributes."""
+    shared_attrs = '{"friendly_name": "Temperature"}'
+    state_attributes = StateAttributes(
+        hash=StateAttributes.hash_shared_attrs(shared_attrs),
+        shared_attrs=shared_attrs,
+    )
+    assert state_attributes.to_native() == {"friendly_name": "Temperature"}
+    assert StateAttributes.hash_shared_attrs(
+        shared_attrs
+    ) == StateAttributes.hash_shared_attrs('{"friendly_name": "Temperature"}')
+
+    state = States(
+        entity_id="sensor.temperature",
+        state="18",
+        attributes=None,
+        state_attributes=state_attributes,
+        last_changed=dt_util.utcnow(),
+        last_updated=dt_util.utcnow(),
+    )
+    assert state.to_native().attributes == {"friendly_name": "Temperature"}
+
+
 def test_from_event_to_delete_state():
     """Test converting deleting state event to db state."""
     event = ha.Event(
@@ -10,7 +10,13 @@ from sqlalchemy.orm.session import Session
 from homeassistant.components import recorder
 from homeassistant.components.recorder import PurgeTask
 from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    EventData,
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -61,6 +67,154 @@ async def test_purge_old_states(
         assert states.count() == 2
 
 
+async def test_purge_old_states_evicts_old_state_ids(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test purging evicts purged states from the bulk writer old state cache."""
+    instance = await async_setup_recorder_instance(hass, {"bulk_writer": True})
+
+    await _add_test_states(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        latest_state_id = states[-1].state_id
+        instance._old_state_ids["test.recorder2"] = states[0].state_id
+        instance._old_state_ids["test.recorder3"] = latest_state_id
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert states.count() == 2
+
+    assert instance._old_state_ids == {"test.recorder3": latest_state_id}
+
+
+async def test_purge_old_states_removes_unused_attributes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test purging states removes the shared attributes no longer used."""
+    instance = await async_setup_recorder_instance(hass)
+
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+
+    with recorder.session_scope(hass=hass) as session:
+        attributes = {
+            shared_attrs: StateAttributes(
+                hash=StateAttributes.hash_shared_attrs(shared_attrs),
+                shared_attrs=shared_attrs,
+            )
+            for shared_attrs in ('{"old": 1}', '{"shared": 1}', '{"new": 1}')
+        }
+        for shared_attrs, timestamp in (
+            ('{"old": 1}', eleven_days_ago),
+            ('{"shared": 1}', eleven_days_ago),
+            ('{"shared": 1}', utcnow),
+            ('{"new": 1}', utcnow),
+        ):
+            event = Events(
+                event_type="state_changed",
+                event_data="{}",
+                origin="LOCAL",
+                created=timestamp,
+                time_fired=timestamp,
+            )
+            session.add(event)
+            session.flush()
+            session.add(
+                States(
+                    entity_id="test.recorder2",
+                    domain="sensor",
+                    state="on",
+                    state_attributes=attributes[shared_attrs],
+                    last_changed=timestamp,
+                    last_updated=timestamp,
+                    created=timestamp,
+                    event_id=event.event_id,
+                )
+            )
+        session.flush()
+        old_attributes_id = attributes['{"old": 1}'].attributes_id
+        shared_attributes_id = attributes['{"shared": 1}'].attributes_id
+
+    instance._state_attributes_ids['{"old": 1}'] = old_attributes_id
+    instance._state_attributes_ids['{"shared": 1}'] = shared_attributes_id
+
+    with session_scope(hass=hass) as session:
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert session.query(States).count() == 2
+        assert {
+            state_attributes.shared_attrs
+            for state_attributes in session.query(StateAttributes)
+        } == {'{"shared": 1}', '{"new": 1}'}
+
+    assert instance._state_attributes_ids.items() == [
+        ('{"shared": 1}', shared_attributes_id)
+    ]
+
+
+async def test_purge_old_events_removes_unused_event_data(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test purging events removes the shared event data no longer used."""
+    instance = await async_setup_recorder_instance(hass)
+
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+
+    with recorder.session_scope(hass=hass) as session:
+        event_data = {
+            shared_data: EventData(
+                hash=EventData.hash_shared_data(shared_data),
+                shared_data=shared_data,
+            )
+            for shared_data in ('{"old": 1}', '{"shared": 1}', '{"new": 1}')
+        }
+        for shared_data, timestamp in (
+            ('{"old": 1}', eleven_days_ago),
+            ('{"shared": 1}', eleven_days_ago),
+            ('{"shared": 1}', utcnow),
+            ('{"new": 1}', utcnow),
+        ):
+            session.add(
+                Events(
+                    event_type="EVENT_TEST_PURGE",
+                    event_data_rel=event_data[shared_data],
+                    origin="LOCAL",
+                    created=timestamp,
+                    time_fired=timestamp,
+                )
+            )
+        session.flush()
+        old_data_id = event_data['{"old": 1}'].data_id
+        shared_data_id = event_data['{"shared": 1}'].data_id
+
+    instance._event_data_ids['{"old": 1}'] = old_data_id
+    instance._event_data_ids['{"shared": 1}'] = shared_data_id
+
+    with session_scope(hass=hass) as session:
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert (
+            session.query(Events).filter_by(event_type="EVENT_TEST_PURGE").count() == 2
+        )
+        assert (
+            session.query(EventData)
+            .filter(EventData.data_id.in_([old_data_id, shared_data_id]))
+            .count()
+            == 1
+        )
+
+    assert '{"old": 1}' not in instance._event_data_ids
+    assert instance._event_data_ids.get('{"shared": 1}') == shared_data_id
+
+
 async def test_purge_old_states_encouters_database_corruption(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -0,0 +1,113 @@
+"""The tests for spilling recorder events to disk."""
+from unittest.mock import patch
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.models import Events, States
+from homeassistant.components.recorder.spill import EventSpill
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import Context, Event, HomeAssistant, State
+
+from .common import async_wait_recording_done
+from .conftest import SetupRecorderInstanceT
+
+
+async def test_spill_replays_in_order(hass: HomeAssistant, tmp_path):
+    """Test spilled events are replayed from the file and memory in order."""
+    spill = EventSpill(hass, str(tmp_path / "events.spill"))
+    context = Context()
+
+    spill.async_add(Event("test_event", {"index": 0}, context=context))
+    spill.async_add(Event("test_event", {"index": 1}))
+    await hass.async_add_executor_job(spill.flush)
+    spill.async_add(
+        Event(
+            "state_changed",
+            {
+                "entity_id": "light.kitchen",
+                "old_state": None,
+                "new_state": State("light.kitchen", "on", {"brightness": 5}),
+            },
+        )
+    )
+    assert spill.active
+    assert spill.pending == 3
+
+    events = spill.replay(2)
+    assert [event.data["index"] for event in events] == [0, 1]
+    assert events[0].context.id == context.id
+    assert spill.active
+
+    events = spill.replay(2)
+    assert len(events) == 1
+    assert events[0].data["old_state"] is None
+    assert events[0].data["new_state"].attributes == {"brightness": 5}
+    assert not spill.active
+    assert spill.pending == 0
+    assert not (tmp_path / "events.spill").exists()
+
+
+async def test_spill_close_keeps_events_not_replayed(hass: HomeAssistant, tmp_path):
+    """Test closing leaves only the events not replayed for the next run."""
+    path = str(tmp_path / "events.spill")
+    spill = EventSpill(hass, path)
+    for index in range(3):
+        spill.async_add(Event("test_event", {"index": index}))
+    await hass.async_add_executor_job(spill.flush)
+    spill.async_add(Event("test_event", {"index": 3}))
+
+    assert [event.data["index"] for event in spill.replay(1)] == [0]
+    spill.close()
+
+    spill = EventSpill(hass, path)
+    spill.load()
+    assert spill.active
+    assert spill.pending == 3
+    assert [event.data["index"] for event in spill.replay(10)] == [1, 2, 3]
+    assert not spill.active
+
+
+async def test_recorder_spills_to_disk(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT, tmp_path
+):
+    """Test the recorder records the events it spilled to disk."""
+    with patch.object(recorder, "DEFAULT_SPILL_FILE", str(tmp_path / "spill")):
+        instance = await async_setup_recorder_instance(
+            hass, {recorder.CONF_SPILL_TO_DISK: True}
+        )
+
+    with patch.object(recorder, "SPILL_QUEUE_BACKLOG", 0):
+        hass.states.async_set("light.kitchen", "on")
+        hass.bus.async_fire("test_event", {"spilled": True})
+        await hass.async_block_till_done()
+        assert instance.spill.active
+
+        await async_wait_recording_done(hass, instance)
+
+    await async_wait_recording_done(hass, instance)
+    assert not instance.spill.active
+    assert instance.spill.replayed == instance.spill.spilled
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).filter_by(entity_id="light.kitchen").count() == 1
+        assert session.query(Events).filter_by(event_type="test_event").count() == 1
+
+
+async def test_tasks_do_not_overtake_spilled_events(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT, tmp_path
+):
+    """Test waiting for the recorder includes the events spilled before."""
+    with patch.object(recorder, "DEFAULT_SPILL_FILE", str(tmp_path / "spill")):
+        instance = await async_setup_recorder_instance(
+            hass, {recorder.CONF_SPILL_TO_DISK: True}
+        )
+
+    with patch.object(recorder, "SPILL_QUEUE_BACKLOG", 0):
+        for index in range(5):
+            hass.bus.async_fire("test_event", {"index": index})
+        await hass.async_block_till_done()
+        assert instance.spill.active
+
+        await instance.async_block_till_done()
+
+        with session_scope(hass=hass) as session:
+            assert session.query(Events).filter_by(event_type="test_event").count() == 5
@@ -0,0 +1,30 @@
+"""The tests for the recorder websocket API."""
+from homeassistant.components import recorder
+from homeassistant.core import HomeAssistant
+
+from .common import async_wait_recording_done
+from .conftest import SetupRecorderInstanceT
+
+
+async def test_recorder_info(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: SetupRecorderInstanceT,
+    hass_ws_client,
+):
+    """Test getting the queue depth and write statistics."""
+    instance = await async_setup_recorder_instance(hass)
+    hass.states.async_set("light.kitchen", "on")
+    await async_wait_recording_done(hass, instance)
+
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "recorder/info"})
+    response = await client.receive_json()
+    assert response["success"]
+    info = response["result"]
+    assert info["backlog"] == 0
+    assert info["max_backlog"] == recorder.MAX_QUEUE_BACKLOG
+    assert info["spill_backlog"] is None
+    assert info["recording"] is True
+    assert info["thread_running"] is True
+    assert info["commits"] > 0
+    assert info["max_commit_latency"] >= info["last_commit_latency"] > 0
@@ -4,7 +4,10 @@ import asyncio
 import pytest
 
 from homeassistant.bootstrap import async_setup_component
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
+from homeassistant.components.trace.const import (
+    DATA_TRACE_BUDGET,
+    DEFAULT_STORED_TRACES,
+)
 from homeassistant.core import Context, callback
 from homeassistant.helpers.typing import UNDEFINED
 
@@ -425,6 +428,69 @@ async def test_trace_overflow(hass, hass_ws_client, domain, stored_traces):
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_step_budget(hass, hass_ws_client, domain):
+    """Test the oldest finished traces are evicted when over the step budget."""
+    id = 1
+
+    def next_id():
+        nonlocal id
+        id += 1
+        return id
+
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    moon_config = {
+        "id": "moon",
+        "trigger": {"platform": "event", "event_type": "test_event2"},
+        "action": {"event": "another_event"},
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config, moon_config])
+    budget = hass.data[DATA_TRACE_BUDGET]
+
+    client = await hass_ws_client()
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+    await hass.async_block_till_done()
+    two_traces_steps = budget.steps
+
+    # Shrink the budget so only the newest trace fits
+    budget.max_steps = two_traces_steps - 1
+    await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], domain, "sun")) == 0
+    moon_traces = _find_traces(response["result"], domain, "moon")
+    assert len(moon_traces) == 1
+    assert moon_traces[0]["last_step"] is not None
+    assert budget.steps <= budget.max_steps
+
+    # The finished trace is serialized when it is requested
+    await client.send_json(
+        {
+            "id": next_id(),
+            "type": "trace/get",
+            "domain": domain,
+            "item_id": "moon",
+            "run_id": moon_traces[0]["run_id"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    trace = response["result"]
+    assert trace["state"] == "stopped"
+    assert trace["last_step"] == moon_traces[0]["last_step"]
+    assert trace["trace"][trace["last_step"]]
+    assert trace["config"]
+
+
 @pytest.mark.parametrize("domain", ["automation", "script"])
 async def test_trace_no_traces(hass, hass_ws_client, domain):
     """Test the storing traces for a script or automation can be disabled."""
@@ -393,6 +393,68 @@ async def test_subscribe_unsubscribe_events(hass, websocket_client):
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+async def test_subscribe_events_shares_listener(hass, hass_ws_client):
+    """Test connections subscribed to the same event share one bus listener."""
+    first_client = await hass_ws_client(hass)
+    second_client = await hass_ws_client(hass)
+
+    for client in (first_client, second_client):
+        await client.send_json(
+            {"id": 5, "type": "subscribe_events", "event_type": "test_event"}
+        )
+        msg = await client.receive_json()
+        assert msg["success"]
+
+    assert hass.bus.async_listeners()["test_event"] == 1
+
+    hass.bus.async_fire("test_event", {"hello": "world"})
+
+    for client in (first_client, second_client):
+        with timeout(3):
+            msg = await client.receive_json()
+        assert msg["id"] == 5
+        assert msg["event"]["data"] == {"hello": "world"}
+
+    await first_client.send_json(
+        {"id": 6, "type": "unsubscribe_events", "subscription": 5}
+    )
+    msg = await first_client.receive_json()
+    assert msg["success"]
+    assert hass.bus.async_listeners()["test_event"] == 1
+
+    await second_client.close()
+    await hass.async_block_till_done()
+    assert "test_event" not in hass.bus.async_listeners()
+
+
+async def test_subscribe_events_coalesced(hass, websocket_client):
+    """Test messages queued together are sent as one frame when supported."""
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    await websocket_client.send_json(
+        {"id": 5, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    for index in range(3):
+        hass.bus.async_fire("test_event", {"index": index})
+
+    with timeout(3):
+        msg = await websocket_client.receive_json()
+
+    assert [event["event"]["data"]["index"] for event in msg] == [0, 1, 2]
+    assert all(event["id"] == 5 for event in msg)
+
+
 async def test_get_states(hass, websocket_client):
     """Test get_states command."""
     hass.states.async_set("greeting.hello", "world")
@@ -412,6 +474,98 @@ async def test_get_states(hass, websocket_client):
     assert msg["result"] == states
 
 
+async def test_subscribe_entities(hass, websocket_client, hass_admin_user):
+    """Test subscribing to compressed entity states and their changes."""
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy(
+        {"entities": {"entity_ids": {"light.permitted": True, "light.new": True}}}
+    )
+    hass.states.async_set("light.permitted", "off", {"color": "red", "brightness": 1})
+    hass.states.async_set("light.not_permitted", "on")
+    original_state = hass.states.get("light.permitted")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "a": {"color": "red", "brightness": 1},
+                "c": original_state.context.id,
+                "lc": original_state.last_changed.timestamp(),
+                "s": "off",
+            }
+        }
+    }
+
+    hass.states.async_set("light.not_permitted", "off")
+    hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    changed_state = hass.states.get("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "a": {"color": "blue"},
+                    "c": changed_state.context.id,
+                    "lc": changed_state.last_changed.timestamp(),
+                    "s": "on",
+                },
+                "-": {"a": ["brightness"]},
+            }
+        }
+    }
+
+    hass.states.async_set("light.new", "on")
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.new"]
+
+    hass.states.async_remove("light.new")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.new"]}
+
+
+async def test_subscribe_entities_with_entity_ids(hass, websocket_client):
+    """Test subscribing to only some entities."""
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.other", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "entity_ids": ["light.permitted"]}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.permitted"]
+
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+
+    updated_state = hass.states.get("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "a": {"color": "red"},
+                    "c": updated_state.context.id,
+                    "lu": updated_state.last_updated.timestamp(),
+                }
+            }
+        }
+    }
+
+
 async def test_get_services(hass, websocket_client):
     """Test get_services command."""
     await websocket_client.send_json({"id": 5, "type": "get_services"})
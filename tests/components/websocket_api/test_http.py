@@ -1,11 +1,15 @@
 """Test Websocket API http module."""
 from datetime import timedelta
+import json
 from unittest.mock import patch
+import zlib
 
 from aiohttp import WSMsgType
 import pytest
 
 from homeassistant.components.websocket_api import const, http
+from homeassistant.components.websocket_api.auth import TYPE_AUTH_REQUIRED
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
 
 from tests.common import async_fire_time_changed
@@ -80,3 +84,95 @@ async def test_non_json_message(hass, websocket_client, caplog):
         f"Unable to serialize to JSON. Bad data found at $.result[0](State: test_domain.entity).attributes.bad={bad_data}(<class 'object'>"
         in caplog.text
     )
+
+
+async def test_binary_messages(hass, websocket_client):
+    """Test messages are sent as one compressed stream when supported."""
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_BINARY_MESSAGES: 1},
+        }
+    )
+    decompressor = zlib.decompressobj()
+
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.BINARY
+    assert json.loads(decompressor.decompress(msg.data)) == {
+        "id": 1,
+        "type": const.TYPE_RESULT,
+        "success": True,
+        "result": None,
+    }
+
+    for idx in range(2, 4):
+        await websocket_client.send_json({"id": idx, "type": "ping"})
+        msg = await websocket_client.receive()
+        assert msg.type == WSMsgType.BINARY
+        assert json.loads(decompressor.decompress(msg.data)) == {
+            "id": idx,
+            "type": "pong",
+        }
+
+    await websocket_client.send_json({"id": 4, "type": "websocket_api/info"})
+    msg = await websocket_client.receive()
+    info = json.loads(decompressor.decompress(msg.data))["result"]
+    assert info["connections"] == 1
+    assert info["deflate_connections"] == 0
+    assert info["messages"] >= 5
+    assert info["message_bytes"] > info["binary_message_bytes"]
+    assert info["binary_message_bytes"] > info["binary_bytes"] > 0
+    assert info["compression_ratio"] > 1
+
+
+async def test_binary_messages_disable(hass, websocket_client):
+    """Test clients can switch binary messages off and on again."""
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_BINARY_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.BINARY
+
+    await websocket_client.send_json(
+        {"id": 2, "type": "supported_features", "features": {}}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 2
+    assert msg["success"]
+
+    await websocket_client.send_json({"id": 3, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg == {"id": 3, "type": "pong"}
+
+    await websocket_client.send_json(
+        {
+            "id": 4,
+            "type": "supported_features",
+            "features": {const.FEATURE_BINARY_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.BINARY
+    # A new zlib stream that a new decompressor reads from its start
+    assert json.loads(zlib.decompressobj().decompress(msg.data))["id"] == 4
+
+
+async def test_per_message_deflate_connections(hass, aiohttp_client):
+    """Test connections negotiating per-message deflate are counted."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    await hass.async_block_till_done()
+    client = await aiohttp_client(hass.http.app)
+    websocket_client = await client.ws_connect(const.URL, compress=15)
+
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == TYPE_AUTH_REQUIRED
+    assert hass.data[const.DATA_STATS].deflate_connections == 1
+
+    await websocket_client.close()
+    await hass.async_block_till_done()
+    assert hass.data[const.DATA_STATS].deflate_connections == 0
@@ -665,7 +665,8 @@ async def test_warn_slow_write_state(hass, caplog):
     assert (
         "Updating state for comp_test.test_entity "
         "(<class 'homeassistant.helpers.entity.Entity'>) "
-        "took 10.000 seconds. Please create a bug report at "
+        "took 10.000 seconds (0 unchanged writes suppressed). "
+        "Please create a bug report at "
         "https://github.com/home-assistant/core/issues?"
         "q=is%3Aopen+is%3Aissue+label%3A%22integration%3A+hue%22"
     ) in caplog.text
@@ -690,7 +691,8 @@ async def test_warn_slow_write_state_custom_component(hass, caplog):
     assert (
         "Updating state for comp_test.test_entity "
         "(<class 'custom_components.bla.sensor.test_warn_slow_write_state_custom_component.<locals>.CustomComponentEntity'>) "
-        "took 10.000 seconds. Please report it to the custom component author."
+        "took 10.000 seconds (0 unchanged writes suppressed). "
+        "Please report it to the custom component author."
     ) in caplog.text
 
 
@@ -788,3 +790,78 @@ async def test_float_conversion(hass):
     state = hass.states.get("hello.world")
     assert state is not None
     assert state.state == "3.6"
+
+
+async def test_unchanged_write_suppressed(hass):
+    """Test unchanged writes are rejected before reaching the state machine."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_extra_state_attributes = {"hello": "world"}
+
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.attributes == {"hello": "world"}
+
+    with patch.object(hass.states, "async_set") as mock_set:
+        ent.async_write_ha_state()
+        ent.async_write_ha_state()
+
+    assert not mock_set.called
+    assert ent._suppressed_writes == 2
+    assert hass.states.get("hello.world") is state
+
+    ent._attr_extra_state_attributes = {"hello": "universe"}
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes == {"hello": "universe"}
+    assert ent._suppressed_writes == 2
+
+
+async def test_warn_slow_write_state_reports_suppressed(hass, caplog):
+    """Test the slow write warning includes the suppressed write count."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+
+    ent.async_write_ha_state()
+    ent.async_write_ha_state()
+
+    with patch("homeassistant.helpers.entity.timer", side_effect=[0, 10]):
+        ent.async_write_ha_state()
+
+    assert "took 10.000 seconds (1 unchanged writes suppressed)" in caplog.text
+    assert ent._suppressed_writes == 2
+
+
+async def test_unchanged_write_after_external_write(hass):
+    """Test an entity rewrites its state when it was overwritten elsewhere."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+
+    ent.async_write_ha_state()
+    hass.states.async_set("hello.world", "overwritten")
+
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").state == "unknown"
+    assert ent._suppressed_writes == 0
+
+    hass.states.async_remove("hello.world")
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").state == "unknown"
+    assert ent._suppressed_writes == 0
+
+
+async def test_unchanged_write_force_update(hass):
+    """Test unchanged writes are not suppressed when forcing updates."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_force_update = True
+
+    ent.async_write_ha_state()
+    first = hass.states.get("hello.world")
+    ent.async_write_ha_state()
+
+    assert hass.states.get("hello.world") is not first
+    assert ent._suppressed_writes == 0
@@ -104,7 +104,7 @@ async def test_setup_does_discovery(mock_setup_component, mock_setup, hass):
     assert ("platform_test", {}, {"msg": "discovery_info"}) == mock_setup.call_args[0]
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
+@patch("homeassistant.helpers.entity_platform.async_track_point_in_utc_time")
 async def test_set_scan_interval_via_config(mock_track, hass):
     """Test the setting of the scan interval via configuration."""
 
@@ -122,7 +122,9 @@ async def test_set_scan_interval_via_config(mock_track, hass):
 
     await hass.async_block_till_done()
     assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    assert mock_track.call_args[0][1].__self__.scan_interval == timedelta(seconds=30)
+    # The first poll is at an offset within the interval
+    assert mock_track.call_args[0][2] - dt_util.utcnow() < timedelta(seconds=30)
 
 
 async def test_set_entity_namespace_via_config(hass):
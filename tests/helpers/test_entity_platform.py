@@ -105,6 +105,142 @@ async def test_polling_updates_entities_with_exception(hass):
     assert len(update_err) == 1
 
 
+async def test_polling_offset_spreads_platforms(hass):
+    """Test platforms poll at a deterministic offset within the interval."""
+    platforms = [
+        MockEntityPlatform(
+            hass, platform_name=name, scan_interval=timedelta(seconds=30)
+        )
+        for name in ("first", "second", "first")
+    ]
+    offsets = [platform._polling_offset() for platform in platforms]
+
+    assert all(timedelta(0) <= offset < timedelta(seconds=30) for offset in offsets)
+    assert offsets[0] == offsets[2]
+    assert offsets[0] != offsets[1]
+
+
+async def test_polling_backs_off_slow_platform(hass):
+    """Test skipped ticks back off polling until the platform keeps up."""
+    ent_platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=30))
+    poll_ent = MockEntity(should_poll=True)
+    await ent_platform.async_add_entities([poll_ent])
+    poll_ent.async_update = Mock()
+    stats = ent_platform.polling_stats
+
+    ent_platform._process_updates = asyncio.Lock()
+    async with ent_platform._process_updates:
+        for _ in range(5):
+            await ent_platform._update_entity_states(dt_util.utcnow())
+
+    assert not poll_ent.async_update.called
+    assert stats.skipped_ticks == 5
+    assert stats.backoff == entity_platform.MAX_POLLING_BACKOFF
+
+    await ent_platform._update_entity_states(dt_util.utcnow())
+
+    assert poll_ent.async_update.called
+    assert stats.polls == 1
+    assert stats.last_latency is not None
+    assert stats.max_latency == stats.last_latency
+    assert stats.backoff == 1
+
+
+async def test_polling_schedules_after_update(hass):
+    """Test the next poll is scheduled once the update finishes."""
+    ent_platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=30))
+    poll_ent = MockEntity(should_poll=True)
+    await ent_platform.async_add_entities([poll_ent])
+
+    update_started = asyncio.Event()
+    finish_update = asyncio.Event()
+
+    async def slow_update():
+        """Mock an update that takes longer than the scan interval."""
+        update_started.set()
+        await finish_update.wait()
+
+    poll_ent.async_update = slow_update
+
+    now = dt_util.utcnow() + timedelta(seconds=65)
+    with patch.object(
+        ent_platform, "_async_schedule_poll", wraps=ent_platform._async_schedule_poll
+    ) as mock_schedule, patch(
+        "homeassistant.helpers.entity_platform.monotonic", side_effect=[0, 35]
+    ):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+        await update_started.wait()
+        assert not mock_schedule.called
+
+        finish_update.set()
+        with patch("homeassistant.util.dt.utcnow", return_value=now):
+            await hass.async_block_till_done()
+
+    assert ent_platform.polling_stats.backoff == 2
+    mock_schedule.assert_called_once_with(now + timedelta(seconds=60))
+
+
+async def test_polling_skipped_tick_schedules_with_backoff(hass):
+    """Test a skipped tick schedules the next poll with the raised backoff."""
+    ent_platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=30))
+    poll_ent = MockEntity(should_poll=True)
+    await ent_platform.async_add_entities([poll_ent])
+    poll_ent.async_update = Mock()
+
+    ent_platform._process_updates = asyncio.Lock()
+    now = dt_util.utcnow()
+    with patch.object(ent_platform, "_async_schedule_poll") as mock_schedule, patch(
+        "homeassistant.util.dt.utcnow", return_value=now
+    ):
+        async with ent_platform._process_updates:
+            await ent_platform._async_poll(now)
+
+    assert not poll_ent.async_update.called
+    assert ent_platform.polling_stats.skipped_ticks == 1
+    mock_schedule.assert_called_once_with(now + timedelta(seconds=60))
+
+
+async def test_polling_not_rescheduled_after_reset(hass):
+    """Test a poll in progress does not reschedule once polling stopped."""
+    ent_platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=30))
+    poll_ent = MockEntity(should_poll=True)
+    await ent_platform.async_add_entities([poll_ent])
+
+    async def stop_polling():
+        """Stop polling while updating."""
+        ent_platform.async_unsub_polling()
+
+    poll_ent.async_update = stop_polling
+
+    await ent_platform._async_poll(dt_util.utcnow())
+    assert ent_platform._async_unsub_polling is None
+
+
+async def test_polling_stats_info(hass):
+    """Test the polling metrics of all platforms are combined."""
+    assert entity_platform.async_polling_stats_info(hass) == {
+        "polls": 0,
+        "skipped_ticks": 0,
+        "max_latency": 0.0,
+        "slowest_platform": None,
+    }
+
+    fast_platform = MockEntityPlatform(hass, platform_name="fast")
+    slow_platform = MockEntityPlatform(hass, platform_name="slow")
+    fast_platform.polling_stats.polls = 3
+    fast_platform.polling_stats.max_latency = 0.1
+    slow_platform.polling_stats.polls = 2
+    slow_platform.polling_stats.skipped_ticks = 1
+    slow_platform.polling_stats.max_latency = 2.5
+
+    assert entity_platform.async_polling_stats_info(hass) == {
+        "polls": 5,
+        "skipped_ticks": 1,
+        "max_latency": 2.5,
+        "slowest_platform": "test_domain.slow",
+    }
+
+
 async def test_update_state_adds_entities(hass):
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -150,7 +286,7 @@ async def test_update_state_adds_entities_with_update_before_add_false(hass):
     assert not ent.update.called
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
+@patch("homeassistant.helpers.entity_platform.async_track_point_in_utc_time")
 async def test_set_scan_interval_via_platform(mock_track, hass):
     """Test the setting of the scan interval via platform."""
 
@@ -169,7 +305,9 @@ async def test_set_scan_interval_via_platform(mock_track, hass):
 
     await hass.async_block_till_done()
     assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    assert mock_track.call_args[0][1].__self__.scan_interval == timedelta(seconds=30)
+    # The first poll is at an offset within the interval
+    assert mock_track.call_args[0][2] - dt_util.utcnow() < timedelta(seconds=30)
 
 
 async def test_adding_entities_with_generator_and_thread_callback(hass):
@@ -248,3 +248,22 @@ def test_filter_schema_include_exclude():
     }
     filt = INCLUDE_EXCLUDE_FILTER_SCHEMA(conf)
     assert filt.config == conf
+
+
+def test_multiple_globs_and_cache():
+    """Test multiple globs are matched and decisions are memoized."""
+    testfilter = generate_filter(
+        [], [], [], [], ["sensor.*_temp", "binary_sensor.door_?", "light.[ab]*"]
+    )
+
+    assert testfilter("sensor.kitchen_temp")
+    assert testfilter("binary_sensor.door_1")
+    assert testfilter("light.attic")
+    assert not testfilter("sensor.kitchen_temp_2")
+    assert not testfilter("binary_sensor.door_10")
+    assert not testfilter("light.cellar")
+
+    assert testfilter("sensor.kitchen_temp")
+    info = testfilter.cache_info()
+    assert info.hits == 1
+    assert info.misses == 6
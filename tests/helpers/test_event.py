@@ -10,7 +10,7 @@ import jinja2
 import pytest
 
 from homeassistant.components import sun
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_TIME_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
@@ -20,6 +20,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_pending_timer_count,
     async_track_point_in_time,
     async_track_point_in_utc_time,
     async_track_same_state,
@@ -126,6 +127,98 @@ async def test_track_point_in_time_drift_rearm(hass):
     assert len(specific_runs) == 1
 
 
+async def test_track_point_in_time_batches_timers(hass):
+    """Test point in time listeners share one event loop timer."""
+    now = dt_util.utcnow()
+    first = datetime(now.year + 1, 5, 24, 21, 59, 55, tzinfo=dt_util.UTC)
+    second = first + timedelta(seconds=5)
+    runs = []
+
+    def loop_timers():
+        return [
+            handle
+            for handle in hass.loop._scheduled
+            if not handle.cancelled()
+            and handle._callback.__qualname__ == "TimerWheel._async_expire"
+        ]
+
+    for idx in range(100):
+        async_track_point_in_utc_time(
+            hass, callback(lambda x, idx=idx: runs.append(idx)), second
+        )
+    unsub = async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append("removed")), first
+    )
+    async_track_point_in_utc_time(hass, callback(lambda x: runs.append("first")), first)
+    assert async_pending_timer_count(hass) == 102
+    assert len(loop_timers()) == 1
+
+    unsub()
+    unsub()
+    assert async_pending_timer_count(hass) == 101
+
+    async_fire_time_changed(hass, first + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert runs == ["first"]
+    assert async_pending_timer_count(hass) == 100
+    assert len(loop_timers()) == 1
+
+    async_fire_time_changed(hass, second + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert runs == ["first", *range(100)]
+    assert async_pending_timer_count(hass) == 0
+    assert not loop_timers()
+
+
+async def test_track_time_change_without_pattern_shares_listener(hass):
+    """Test listeners for every time changed event share one bus listener."""
+    runs = []
+    listeners_before = hass.bus.async_listeners().get(EVENT_TIME_CHANGED, 0)
+
+    unsubs = [
+        async_track_utc_time_change(hass, callback(lambda x, idx=idx: runs.append(idx)))
+        for idx in range(3)
+    ]
+    assert hass.bus.async_listeners()[EVENT_TIME_CHANGED] == listeners_before + 1
+
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+    assert runs == [0, 1, 2]
+
+    unsubs.pop(1)()
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+    assert runs == [0, 1, 2, 0, 2]
+
+    for unsub in unsubs:
+        unsub()
+    assert hass.bus.async_listeners().get(EVENT_TIME_CHANGED, 0) == listeners_before
+
+
+async def test_track_point_in_time_error_does_not_stop_batch(hass):
+    """Test a failing listener does not stop the others due at the same time."""
+    now = dt_util.utcnow()
+    point_in_time = datetime(now.year + 1, 5, 24, 21, 59, 55, tzinfo=dt_util.UTC)
+    runs = []
+
+    @callback
+    def failing_listener(now):
+        raise ValueError
+
+    async_track_point_in_utc_time(hass, failing_listener, point_in_time)
+    async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append(x)), point_in_time
+    )
+
+    with patch.object(hass.loop, "call_exception_handler") as mock_handler:
+        async_fire_time_changed(hass, point_in_time + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
+    assert runs == [point_in_time]
+    assert len(mock_handler.mock_calls) == 1
+    assert isinstance(mock_handler.mock_calls[0][1][0]["exception"], ValueError)
+
+
 async def test_track_state_change_from_to_state_match(hass):
     """Test track_state_change with from and to state matchers."""
     from_and_to_state_runs = []
@@ -1355,6 +1448,38 @@ async def test_track_template_result_and_conditional(hass):
     assert specific_runs[2] == "on"
 
 
+async def test_track_template_result_ignores_unread_changes(hass):
+    """Test tracking a template ignores changes to attributes it did not read."""
+    hass.states.async_set("sensor.test", "on", {"x": 1, "y": 1})
+    runs = []
+
+    @ha.callback
+    def run_callback(event, updates):
+        runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(Template("{{ state_attr('sensor.test', 'x') }}", hass), None)],
+        run_callback,
+    )
+    info.async_refresh()
+    await hass.async_block_till_done()
+
+    assert runs == [1]
+
+    hass.states.async_set("sensor.test", "off", {"x": 1, "y": 2})
+    await hass.async_block_till_done()
+    assert runs == [1]
+
+    hass.states.async_set("sensor.test", "off", {"x": 3, "y": 2})
+    await hass.async_block_till_done()
+    assert runs == [1, 3]
+
+    hass.states.async_remove("sensor.test")
+    await hass.async_block_till_done()
+    assert runs == [1, 3, None]
+
+
 async def test_track_template_result_iterator(hass):
     """Test tracking template."""
     iterator_runs = []
@@ -1,13 +1,24 @@
 """Test Home Assistant remote methods and classes."""
+from collections import namedtuple
+from dataclasses import dataclass
 from datetime import timedelta
+import json
+from unittest.mock import patch
 
 import pytest
 
 from homeassistant import core
-from homeassistant.helpers.json import ExtendedJSONEncoder, JSONEncoder
+from homeassistant.helpers.json import ExtendedJSONEncoder, JSONEncoder, json_dumps
 from homeassistant.util import dt as dt_util
 
 
+@dataclass
+class MockDataclass:
+    """Mock dataclass."""
+
+    value: int
+
+
 def test_json_encoder(hass):
     """Test the JSON Encoder."""
     ha_json_enc = JSONEncoder()
@@ -24,6 +35,9 @@ def test_json_encoder(hass):
     # Test serializing an object which implements as_dict
     assert ha_json_enc.default(state) == state.as_dict()
 
+    # Test serializing a dataclass
+    assert ha_json_enc.default(MockDataclass(1)) == {"value": 1}
+
     # Default method raises TypeError if non HA object
     with pytest.raises(TypeError):
         ha_json_enc.default(1)
@@ -63,3 +77,76 @@ def test_trace_json_encoder(hass):
     # Default method falls back to repr(o)
     o = object()
     assert ha_json_enc.default(o) == {"__type": str(type(o)), "repr": repr(o)}
+
+
+@pytest.fixture(params=["compiled", "stdlib"])
+def json_backend(request):
+    """Serialize with the compiled encoder if installed and with the stdlib."""
+    if request.param == "compiled":
+        yield
+        return
+    with patch("homeassistant.util.json.orjson", None):
+        yield
+
+
+def test_json_dumps(json_backend):
+    """Test serializing Home Assistant objects."""
+    state = core.State("test.test", "hello")
+    now = dt_util.utcnow()
+    data = {
+        "state": state,
+        "now": now,
+        "set": {"milk"},
+        "dataclass": MockDataclass(1),
+        "namedtuple": namedtuple("MockTuple", ["value"])(2),
+        1: "int key",
+    }
+
+    assert json.loads(json_dumps(data)) == {
+        "state": state.as_dict(),
+        "now": now.isoformat(),
+        "set": ["milk"],
+        "dataclass": {"value": 1},
+        "namedtuple": [2],
+        "1": "int key",
+    }
+    assert json.loads(json_dumps(data, indent=True)) == json.loads(json_dumps(data))
+
+
+def test_json_dumps_plain_data(json_backend):
+    """Test serializing only plain data without an encoder."""
+    assert json.loads(json_dumps({"hello": [1]}, encoder=None)) == {"hello": [1]}
+
+    with pytest.raises(TypeError):
+        json_dumps({"hello": {"milk"}}, encoder=None)
+
+
+def test_json_dumps_custom_encoder(json_backend):
+    """Test serializing with a custom encoder."""
+    assert json_dumps(timedelta(seconds=1), encoder=ExtendedJSONEncoder) == (
+        json.dumps(timedelta(seconds=1), cls=ExtendedJSONEncoder)
+    )
+
+
+def test_json_dumps_stdlib_not_allows_nan():
+    """Test the stdlib encoder not allows NaN if asked to."""
+    with patch("homeassistant.util.json.orjson", None), pytest.raises(ValueError):
+        json_dumps(float("nan"), allow_nan=False)
+
+
+def test_json_dumps_not_allows_nan(json_backend):
+    """Test NaN is rejected with either encoder if asked to."""
+    with pytest.raises(ValueError):
+        json_dumps({"value": float("nan")}, allow_nan=False)
+
+
+def test_json_dumps_not_allows_nan_in_state(json_backend):
+    """Test NaN and Infinity next to null values in states are rejected."""
+    state = core.State("sensor.test", "on", {"value": float("inf"), "other": None})
+    with pytest.raises(ValueError):
+        json_dumps([state], allow_nan=False)
+
+
+def test_json_dumps_allows_nan(json_backend):
+    """Test NaN is written like the stdlib does if allowed."""
+    assert json_dumps({"value": float("nan")}) == '{"value": NaN}'
@@ -279,3 +279,217 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+MOCK_LOG_DATA = {"items": [{"id": "a", "value": 1}, {"id": "b", "value": 1}]}
+# The unpatched writers, the hass fixture mocks writing storage
+WRITE_DATA = storage.Store._write_data
+WRITE_LOG = storage.Store._write_log
+
+
+@pytest.fixture
+def log_store(hass):
+    """Fixture of a store logging changes of items."""
+    yield storage.Store(hass, MOCK_VERSION, MOCK_KEY, log_collections={"items": "id"})
+
+
+async def test_log_changes(hass, log_store, hass_storage):
+    """Test logging changes instead of saving all data."""
+    await log_store.async_save(MOCK_LOG_DATA)
+    log_id = hass_storage[log_store.key]["log_id"]
+
+    with patch.object(
+        log_store, "_write_data", wraps=log_store._write_data
+    ) as mock_write_data:
+        log_store.async_delay_log_changes(
+            lambda: pytest.fail("Saved all data"),
+            [("items", "a", {"id": "a", "value": 2}), ("items", "b", None)],
+            1,
+        )
+        log_store.async_delay_log_changes(
+            lambda: pytest.fail("Saved all data"),
+            [("items", "c", {"id": "c", "value": 1})],
+            1,
+        )
+        async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
+    assert not mock_write_data.mock_calls
+    assert hass_storage[log_store.key] == {
+        "version": MOCK_VERSION,
+        "key": MOCK_KEY,
+        "data": {"items": [{"id": "a", "value": 2}, {"id": "c", "value": 1}]},
+        "log_id": log_id,
+    }
+
+
+async def test_log_changes_without_saved_data(hass, log_store, hass_storage):
+    """Test the data is saved if there is no saved data to log against."""
+    log_store.async_delay_log_changes(
+        lambda: MOCK_LOG_DATA, [("items", "a", {"id": "a", "value": 1})], 1
+    )
+    async_fire_time_changed(hass, dt.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert hass_storage[log_store.key]["data"] == MOCK_LOG_DATA
+
+
+async def test_log_compacting(hass, log_store, hass_storage):
+    """Test the data is saved once the log is long enough."""
+    await log_store.async_save(MOCK_LOG_DATA)
+    log_id = hass_storage[log_store.key]["log_id"]
+
+    with patch.object(storage, "STORAGE_LOG_COMPACT_RECORDS", 1):
+        log_store.async_delay_log_changes(
+            lambda: pytest.fail("Saved all data"), [("items", "b", None)]
+        )
+        await log_store._async_handle_write_data()
+        assert hass_storage[log_store.key]["log_id"] == log_id
+
+        log_store.async_delay_log_changes(lambda: MOCK_DATA2, [("items", "a", None)])
+        await log_store._async_handle_write_data()
+
+    assert hass_storage[log_store.key]["log_id"] != log_id
+    assert hass_storage[log_store.key]["data"] == MOCK_DATA2
+
+
+async def test_log_changes_on_final_write(hass, log_store, hass_storage):
+    """Test logged changes are written when we quit Home Assistant."""
+    await log_store.async_save(MOCK_LOG_DATA)
+    log_store.async_delay_log_changes(lambda: MOCK_LOG_DATA, [("items", "b", None)], 5)
+
+    hass.state = CoreState.stopping
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+    assert hass_storage[log_store.key]["data"] == {"items": [{"id": "a", "value": 1}]}
+
+
+def test_load_log(hass, log_store, tmp_path):
+    """Test loading replays the change log of the saved data."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / storage.STORAGE_DIR).mkdir()
+    with open(log_store.path, "w") as fdesc:
+        json.dump(
+            {
+                "version": MOCK_VERSION,
+                "key": MOCK_KEY,
+                "data": MOCK_LOG_DATA,
+                "log_id": "mock-log-id",
+            },
+            fdesc,
+        )
+
+    WRITE_LOG(
+        log_store,
+        log_store.log_path,
+        "mock-log-id",
+        [
+            {"collection": "items", "key": "a", "item": {"id": "a", "value": 2}},
+            {"collection": "items", "key": "b", "item": None},
+        ],
+        True,
+    )
+    WRITE_LOG(
+        log_store,
+        log_store.log_path,
+        "mock-log-id",
+        [{"collection": "items", "key": "b", "item": {"id": "b", "value": 3}}],
+        False,
+    )
+
+    assert log_store._load_data()["data"] == {
+        "items": [{"id": "a", "value": 2}, {"id": "b", "value": 3}]
+    }
+    assert log_store._log_id == "mock-log-id"
+    assert log_store._log_records == 3
+
+
+def test_load_log_incomplete_record(hass, log_store, tmp_path, caplog):
+    """Test loading ignores an incomplete last record of the change log."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / storage.STORAGE_DIR).mkdir()
+    with open(log_store.path, "w") as fdesc:
+        json.dump(
+            {
+                "version": MOCK_VERSION,
+                "key": MOCK_KEY,
+                "data": MOCK_LOG_DATA,
+                "log_id": "mock-log-id",
+            },
+            fdesc,
+        )
+    with open(log_store.log_path, "w") as fdesc:
+        fdesc.write(
+            '{"log_id": "mock-log-id"}\n'
+            '{"collection": "items", "key": "b", "item": null}\n'
+            '{"collection": "items", "key": "a", "it'
+        )
+
+    assert log_store._load_data()["data"] == {"items": [{"id": "a", "value": 1}]}
+    assert "Ignoring incomplete change log record" in caplog.text
+
+
+async def test_log_changes_after_incomplete_record(hass, log_store, tmp_path):
+    """Test changes after an incomplete record of the change log are kept."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / storage.STORAGE_DIR).mkdir()
+    with open(log_store.path, "w") as fdesc:
+        json.dump(
+            {
+                "version": MOCK_VERSION,
+                "key": MOCK_KEY,
+                "data": MOCK_LOG_DATA,
+                "log_id": "mock-log-id",
+            },
+            fdesc,
+        )
+    with open(log_store.log_path, "w") as fdesc:
+        fdesc.write(
+            '{"log_id": "mock-log-id"}\n'
+            '{"collection": "items", "key": "b", "item": null}\n'
+            '{"collection": "items", "key": "a", "it'
+        )
+
+    with patch.object(storage.Store, "_write_data", WRITE_DATA), patch.object(
+        storage.Store, "_write_log", WRITE_LOG
+    ):
+        data = (await hass.async_add_executor_job(log_store._load_data))["data"]
+        item = {"id": "c", "value": 1}
+        data["items"].append(item)
+        log_store.async_delay_log_changes(lambda: data, [("items", "c", item)])
+        await log_store._async_handle_write_data()
+        item["value"] = 2
+        log_store.async_delay_log_changes(lambda: data, [("items", "c", item)])
+        await log_store._async_handle_write_data()
+
+    new_store = storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, log_collections={"items": "id"}
+    )
+    assert (await hass.async_add_executor_job(new_store._load_data))["data"] == {
+        "items": [{"id": "a", "value": 1}, {"id": "c", "value": 2}]
+    }
+    assert new_store._log_records == 1
+
+
+def test_load_log_of_older_data(hass, log_store, tmp_path):
+    """Test loading ignores a change log of older saved data."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / storage.STORAGE_DIR).mkdir()
+    with open(log_store.path, "w") as fdesc:
+        json.dump(
+            {
+                "version": MOCK_VERSION,
+                "key": MOCK_KEY,
+                "data": MOCK_LOG_DATA,
+                "log_id": "mock-log-id",
+            },
+            fdesc,
+        )
+    with open(log_store.log_path, "w") as fdesc:
+        fdesc.write(
+            '{"log_id": "older-log-id"}\n'
+            '{"collection": "items", "key": "b", "item": null}\n'
+        )
+
+    assert log_store._load_data()["data"] == MOCK_LOG_DATA
@@ -2094,6 +2094,78 @@ async def test_async_render_to_info_in_conditional(hass):
     assert_result_info(info, "oink", ["sensor.xyz", "sensor.pig"], [])
 
 
+async def test_async_render_to_info_collects_fields_and_attributes(hass):
+    """Test a render only depends on the state fields and attributes it read."""
+    hass.states.async_set("sensor.a", "on", {"unit_of_measurement": "W", "x": 1})
+    hass.states.async_set("sensor.b", "off", {"friendly_name": "B", "x": 2})
+    hass.states.async_set("sensor.c", "off", {"x": 3})
+    old_a = hass.states.get("sensor.a")
+    old_b = hass.states.get("sensor.b")
+    old_c = hass.states.get("sensor.c")
+
+    info = template.Template(
+        "{{ states('sensor.a') }} {{ states.sensor.b.attributes.x }}"
+        " {{ state_attr('sensor.b', 'missing') }} {{ states.sensor.b.name }}"
+        " {{ states.sensor.c.attributes | list }}",
+        hass,
+    ).async_render_to_info()
+    assert_result_info(info, "on 2 None B ['x']", ["sensor.a", "sensor.b", "sensor.c"])
+
+    hass.states.async_set("sensor.a", "on", {"unit_of_measurement": "kW"})
+    new_a = hass.states.get("sensor.a")
+    assert not info.state_change_affects_render("sensor.a", old_a, new_a)
+    hass.states.async_set("sensor.a", "off", {"unit_of_measurement": "kW"})
+    assert info.state_change_affects_render(
+        "sensor.a", old_a, hass.states.get("sensor.a")
+    )
+
+    hass.states.async_set("sensor.b", "on", {"friendly_name": "B", "x": 2})
+    new_b = hass.states.get("sensor.b")
+    assert not info.state_change_affects_render("sensor.b", old_b, new_b)
+    for attributes in ({"friendly_name": "B", "x": 5}, {"x": 2}, {"missing": 0}):
+        hass.states.async_set("sensor.b", "off", attributes)
+        assert info.state_change_affects_render(
+            "sensor.b", old_b, hass.states.get("sensor.b")
+        )
+
+    # Iterating the attributes reads all of them
+    hass.states.async_set("sensor.c", "on", {"x": 3})
+    new_c = hass.states.get("sensor.c")
+    assert not info.state_change_affects_render("sensor.c", old_c, new_c)
+    hass.states.async_set("sensor.c", "off", {"x": 3, "y": 4})
+    assert info.state_change_affects_render(
+        "sensor.c", old_c, hass.states.get("sensor.c")
+    )
+
+    assert info.state_change_affects_render("sensor.a", old_a, None)
+    assert info.state_change_affects_render("sensor.a", None, new_a)
+
+
+async def test_async_render_to_info_collects_whole_states(hass):
+    """Test a render reading whole states depends on every change."""
+    hass.states.async_set("sensor.a", "on", {"x": 1})
+    hass.states.async_set("light.b", "on", {"x": 1})
+    old_a = hass.states.get("sensor.a")
+    old_b = hass.states.get("light.b")
+    hass.states.async_set("sensor.a", "on", {"x": 2})
+    hass.states.async_set("light.b", "on", {"x": 2})
+    new_a = hass.states.get("sensor.a")
+    new_b = hass.states.get("light.b")
+
+    for template_str in (
+        "{{ states.sensor.a.state }}{{ states.sensor.a.attributes.items() | list }}",
+        "{{ states.sensor.a.state }}{{ states.sensor.a == states.sensor.a }}",
+        "{{ states.sensor.a.state }}{{ states.sensor | map(attribute='state') | list }}",
+    ):
+        info = template.Template(template_str, hass).async_render_to_info()
+        assert info.state_change_affects_render("sensor.a", old_a, new_a)
+
+    info = template.Template(
+        "{{ states.light.b.state }}{{ states | map(attribute='state') | list }}", hass
+    ).async_render_to_info()
+    assert info.state_change_affects_render("light.b", old_b, new_b)
+
+
 def test_jinja_namespace(hass):
     """Test Jinja's namespace command can be used."""
     test_template = template.Template(
@@ -2170,35 +2242,43 @@ def test_urlencode(hass):
     assert tpl.async_render() == "the%20quick%20brown%20fox%20%3D%20true"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
+async def test_compiled_code_cache(hass):
+    """Test templates share compiled code by source."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
-    )
+    info = template.compiled_code_cache_info()
+
+    tpl = template.Template(template_string, hass)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert template.compiled_code_cache_info()["misses"] == info["misses"] + 1
 
-    tpl2 = template.Template(
-        (template_string),
-    )
+    tpl2 = template.Template(template_string, hass)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert template.compiled_code_cache_info()["hits"] == info["hits"] + 1
+    assert tpl2._compiled_code is tpl._compiled_code
+
+    # Still cached once the templates are gone, for example after a reload
+    del tpl, tpl2
+    tpl3 = template.Template(template_string, hass)
+    tpl3.ensure_valid()
+    assert template.compiled_code_cache_info()["hits"] == info["hits"] + 2
+
+    # Limited templates are compiled by their own environment
+    limited_env = template.TemplateEnvironment(hass, limited=True)
+    assert limited_env.compile(template_string) is not tpl3._compiled_code
+    assert template.compiled_code_cache_info()["misses"] == info["misses"] + 2
+
+
+async def test_compiled_code_cache_evicts():
+    """Test the compiled code cache is bounded."""
+    cache = template._CompiledCodeCache(1)
+    cache.set(("1", False, False), compile("1", "<template>", "eval"))
+    cache.set(("2", False, False), compile("2", "<template>", "eval"))
+
+    assert cache.get(("1", False, False)) is None
+    assert cache.get(("2", False, False)) is not None
+    assert cache.info() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 1}
 
 
 def test_is_template_string():
@@ -3,6 +3,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
@@ -383,6 +384,32 @@ def test_state_as_dict():
     assert state.as_dict() is state.as_dict()
 
 
+def test_state_as_dict_json():
+    """Test a State as JSON."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0)
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        last_updated=last_time,
+        last_changed=last_time,
+    )
+    assert json.loads(state.as_dict_json) == state.as_dict()
+    assert json.loads(state.attributes_json) == {"pig": "dog"}
+    # 2nd time to verify cache
+    assert state.as_dict_json is state.as_dict_json
+    assert state.attributes_json is state.attributes_json
+
+
+def test_state_as_dict_json_nan():
+    """Test a State with NaN attributes is not valid JSON."""
+    state = ha.State("happy.happy", "on", {"pig": float("nan")})
+    with pytest.raises(ValueError):
+        state.as_dict_json
+    # The recorder has always stored NaN attributes
+    assert state.attributes_json == '{"pig": NaN}'
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -431,6 +458,59 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_listeners_change_between_events(hass):
+    """Test listeners added and removed between events of a type are used."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(("test", event.event_type))
+
+    @ha.callback
+    def match_all_listener(event):
+        """Mock match all listener."""
+        calls.append((MATCH_ALL, event.event_type))
+
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == []
+
+    unsub = hass.bus.async_listen("test", listener)
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == [("test", "test")]
+
+    unsub_match_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+    calls.clear()
+    hass.bus.async_fire("test")
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+    assert calls == [(MATCH_ALL, "test"), ("test", "test")]
+
+    unsub()
+    calls.clear()
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == [(MATCH_ALL, "test")]
+
+    unsub_match_all()
+    calls.clear()
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == []
+
+
+async def test_eventbus_no_listeners_not_cached(hass):
+    """Test firing event types nobody listens to does not grow the cache."""
+    dispatch = dict(hass.bus._dispatch)
+
+    for idx in range(10):
+        hass.bus.async_fire(f"test_no_listeners_{idx}")
+
+    assert hass.bus._dispatch == dispatch
+
+
 async def test_eventbus_unsubscribe_listener(hass):
     """Test unsubscribe listener from returned function."""
     calls = []
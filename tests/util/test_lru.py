@@ -0,0 +1,48 @@
+"""Test Home Assistant LRU mapping."""
+from homeassistant.util.lru import LRU
+
+
+def test_lru_evicts_least_recently_used():
+    """Test the least recently used key is evicted when full."""
+    lru = LRU(2)
+    lru["a"] = 1
+    lru["b"] = 2
+    assert lru["a"] == 1
+
+    lru["c"] = 3
+
+    assert len(lru) == 2
+    assert "b" not in lru
+    assert lru.items() == [("a", 1), ("c", 3)]
+
+
+def test_lru_get_marks_used():
+    """Test get marks the key as used and returns the default when missing."""
+    lru = LRU(2)
+    lru["a"] = 1
+    lru["b"] = 2
+    assert lru.get("a") == 1
+    assert lru.get("missing") is None
+    assert lru.get("missing", 5) == 5
+
+    lru["c"] = 3
+
+    assert "a" in lru
+    assert "b" not in lru
+    assert lru.maxsize == 2
+
+
+def test_lru_pop_and_clear():
+    """Test removing keys."""
+    lru = LRU(3)
+    lru["a"] = 1
+    lru["b"] = 2
+    lru["c"] = 3
+
+    assert lru.pop("a") == 1
+    assert lru.pop("a") is None
+    del lru["b"]
+    assert lru.items() == [("c", 3)]
+
+    lru.clear()
+    assert len(lru) == 0